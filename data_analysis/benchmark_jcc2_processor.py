@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the JCC2 Data Processor
+
+Generates synthetic exports of any size from a real export's schema row and
+times and memory-profiles loading, validation, the summary methods, SUS/NPS
+and export_summary. Results can be saved as a baseline; later runs compared
+against it fail when an operation got slower or hungrier than the tolerance.
+
+Examples:
+    python benchmark_jcc2_processor.py \\
+        --schema data/mock_20_jcc2_user_questionnaire.csv \\
+        --rows 1000 10000 --save-baseline benchmark_baseline.json
+    python benchmark_jcc2_processor.py \\
+        --schema data/mock_20_jcc2_user_questionnaire.csv \\
+        --rows 1000 10000 --baseline benchmark_baseline.json
+    python benchmark_jcc2_processor.py \\
+        --schema data/JCC2_Data_Collection_and_Interview_Form_v4_mock_data_*.csv \\
+        --rows 100000 --width 3000 --mode lazy
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from jcc2_data_processor import (
+    FieldSchema,
+    UserQuestionnaireProcessor,
+    create_processor,
+)
+
+# Share of optional fields left blank, and of required fields left blank so
+# validation has errors to report
+OPTIONAL_BLANK_RATE = 0.3
+REQUIRED_BLANK_RATE = 0.02
+
+TEXT_POOL = np.array(
+    [
+        "No issues observed",
+        "Intermittent latency during peak hours",
+        "Needed a manual export to share data",
+        "Workflow was clear after initial training",
+        "Search results were incomplete",
+        "Used a spreadsheet as a workaround",
+        "Integration with partner systems was slow",
+        "",
+    ]
+)
+UNKNOWN_POOL = np.array(["Yes", "No", "N/A", "Partially"])
+GENERATOR_CHUNK_ROWS = 20000
+# Stream mode reads each export in this many chunks
+STREAM_CHUNKS = 10
+
+
+def read_schema_row(schema_csv: str) -> Tuple[List[str], List[str]]:
+    """Header and schema row of a real export"""
+    with open(schema_csv, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        return next(reader), next(reader)
+
+
+def widen_schema(
+    columns: List[str], schema_row: List[str], width: Optional[int]
+) -> Tuple[List[str], List[str]]:
+    """
+    Repeat sectioned columns under copied section names until width is reached
+
+    Copies go to new sections (``<section>_c2.<field>``) so application and
+    SUS field names keep their usual form.
+    """
+    if width is None or width <= len(columns):
+        return columns, schema_row
+
+    sectioned = [
+        (col, schema) for col, schema in zip(columns, schema_row) if "." in col
+    ]
+    columns, schema_row = list(columns), list(schema_row)
+    copy_number = 2
+    while len(columns) < width:
+        for col, schema in sectioned:
+            if len(columns) >= width:
+                break
+            section, field_id = col.split(".", 1)
+            columns.append(f"{section}_c{copy_number}.{field_id}")
+            schema_row.append(schema)
+        copy_number += 1
+    return columns, schema_row
+
+
+def _datatable_columns(schema_string: str) -> List[Tuple[str, str]]:
+    """Column ids and types of a datatable schema string"""
+    parts = schema_string.split("|")
+    columns = []
+    in_types = False
+    for part in parts[1:]:
+        if part.startswith("column_types:"):
+            in_types = True
+            part = part[len("column_types:") :]
+        elif part.startswith(("minRows:", "maxRows:", "columns:")) or ":" not in part:
+            in_types = False
+            continue
+        if in_types:
+            col_id, col_type = part.split(":", 1)
+            columns.append((col_id, col_type))
+    return columns
+
+
+def _datatable_pool(
+    field_schema: FieldSchema,
+    schema_string: str,
+    rng: np.random.Generator,
+    size: int = 50,
+) -> np.ndarray:
+    """A pool of distinct datatable JSON payloads for one field"""
+    columns = _datatable_columns(schema_string)
+    column_defs = [
+        {"id": col_id, "label": col_id.replace("_", " ").title(), "type": col_type}
+        for col_id, col_type in columns
+    ]
+    min_rows = field_schema.min_rows or 1
+    max_rows = max(field_schema.max_rows or 5, min_rows)
+    payloads = []
+    for _ in range(size):
+        rows = []
+        for run in range(int(rng.integers(min_rows, max_rows + 1))):
+            row = {}
+            for col_id, col_type in columns:
+                if col_type == "number":
+                    row[col_id] = run + 1
+                else:
+                    row[col_id] = str(rng.choice(UNKNOWN_POOL[:3]))
+            rows.append(row)
+        payloads.append(json.dumps({"columns": column_defs, "rows": rows}))
+    return np.array(payloads, dtype=object)
+
+
+def _value_type(field_schema: FieldSchema, schema_string: str) -> str:
+    """Field type that decides a column's values"""
+    if field_schema.field_type == "system":
+        # System columns name their real type in the second schema part
+        return schema_string.split("|")[1].split(":")[0]
+    return field_schema.field_type
+
+
+def _column_values(
+    field_schema: FieldSchema,
+    schema_string: str,
+    start: int,
+    n_rows: int,
+    rng: np.random.Generator,
+    pools: Dict[str, np.ndarray],
+) -> np.ndarray:
+    """Synthetic raw CSV values for rows start to start + n_rows of one column"""
+    field_type = _value_type(field_schema, schema_string)
+
+    if field_type == "identifier":
+        # Numbered from the first row of the chunk so ids stay unique
+        rows = np.arange(start, start + n_rows).astype(str)
+        return np.char.add("synthetic-", rows).astype(object)
+    if field_type == "enum":
+        options = schema_string.split("enum:", 1)[1].split(",")
+        return rng.choice(options, size=n_rows).astype(object)
+    if field_type in ("datetime", "date"):
+        seconds = rng.integers(0, 365 * 24 * 3600, size=n_rows)
+        stamps = np.datetime64("2025-01-01T00:00:00") + seconds.astype("timedelta64[s]")
+        values = np.datetime_as_string(
+            stamps, unit="s" if field_type == "datetime" else "D"
+        )
+        values = values.astype(object)
+        if field_type == "datetime":
+            values = values + ".000Z"
+    elif field_type == "number":
+        low = field_schema.min_value if field_schema.min_value is not None else 0
+        high = field_schema.max_value if field_schema.max_value is not None else 100
+        values = (
+            rng.integers(int(low), int(high) + 1, size=n_rows)
+            .astype(str)
+            .astype(object)
+        )
+    elif field_type in ("radio", "select") and field_schema.options:
+        values = rng.choice(np.array(field_schema.options, dtype=object), size=n_rows)
+    elif field_type == "checkbox" and field_schema.multiple and field_schema.options:
+        options = np.array(field_schema.options, dtype=object)
+        picks = rng.random((n_rows, len(options))) < 0.35
+        values = np.array(["; ".join(options[row]) for row in picks], dtype=object)
+    elif field_type == "checkbox":
+        values = np.full(n_rows, "Yes", dtype=object)
+    elif field_type == "datatable":
+        if field_schema.name not in pools:
+            pools[field_schema.name] = _datatable_pool(field_schema, schema_string, rng)
+        values = rng.choice(pools[field_schema.name], size=n_rows)
+    elif field_type == "unknown":
+        values = rng.choice(UNKNOWN_POOL, size=n_rows).astype(object)
+    else:
+        values = rng.choice(TEXT_POOL, size=n_rows).astype(object)
+
+    blank_rate = REQUIRED_BLANK_RATE if field_schema.required else OPTIONAL_BLANK_RATE
+    values[rng.random(n_rows) < blank_rate] = ""
+    return values
+
+
+def generate_synthetic_csv(
+    schema_csv: str,
+    n_rows: int,
+    output_path: str,
+    width: Optional[int] = None,
+    seed: int = 0,
+) -> Path:
+    """
+    Write a synthetic export with the schema of an existing one
+
+    Values follow each field's schema: options for radio/select/checkbox
+    (multiple selections joined with "; "), min/max for numbers and column
+    types and row limits for datatables. Rows are generated and written in
+    chunks, so exports with millions of rows fit in memory.
+
+    Args:
+        schema_csv: Real export whose header and schema row are reused
+        n_rows: Number of respondents
+        output_path: CSV file to write
+        width: Total column count; sections are repeated to reach it
+        seed: Random seed
+
+    Returns:
+        Path of the written CSV
+    """
+    columns, schema_row = widen_schema(*read_schema_row(schema_csv), width)
+    schemas = [
+        FieldSchema.parse(col, schema) for col, schema in zip(columns, schema_row)
+    ]
+    rng = np.random.default_rng(seed)
+    pools: Dict[str, np.ndarray] = {}
+
+    output_path = Path(output_path)
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerow(schema_row)
+
+    for start in range(0, n_rows, GENERATOR_CHUNK_ROWS):
+        chunk_rows = min(GENERATOR_CHUNK_ROWS, n_rows - start)
+        chunk = {
+            col: _column_values(field_schema, schema, start, chunk_rows, rng, pools)
+            for col, field_schema, schema in zip(columns, schemas, schema_row)
+        }
+        pd.DataFrame(chunk, columns=columns).to_csv(
+            output_path, mode="a", header=False, index=False
+        )
+
+    return output_path
+
+
+def wall_time(operation: Callable[[], Any]) -> float:
+    """Wall time of one call in seconds"""
+    start = time.perf_counter()
+    operation()
+    return round(time.perf_counter() - start, 4)
+
+
+def peak_memory(operation: Callable[[], Any]) -> float:
+    """Peak traced memory of one call in MB"""
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1e6, 2)
+
+
+def _stages(
+    csv_path: Path, mode: str, chunksize: Optional[int]
+) -> List[Tuple[str, Callable[[], Any]]]:
+    """Processor stages of one benchmark run, in order, on a fresh processor"""
+    processor = create_processor(str(csv_path))
+    load_kwargs = {
+        "full": {},
+        "lazy": {"lazy": True},
+        "stream": {"chunksize": chunksize},
+    }[mode]
+
+    stages = [("load_data", lambda: processor.load_data(**load_kwargs))]
+    if isinstance(processor, UserQuestionnaireProcessor):
+        # Run before anything loads the whole frame, so lazy mode shows its gain
+        stages += [
+            ("calculate_sus_scores", processor.calculate_sus_scores),
+            ("calculate_nps_score", processor.calculate_nps_score),
+        ]
+    if mode != "stream":
+        stages.append(("validate_data", processor.validate_data))
+    stages += [
+        ("get_all_sections_summary", processor.get_all_sections_summary),
+        ("get_format_specific_summary", processor.get_format_specific_summary),
+    ]
+    if mode != "stream":
+        stages += [
+            ("analyze_application_patterns", processor.analyze_application_patterns),
+            ("prepare_visualization_data", processor.prepare_visualization_data),
+            ("export_summary", processor.export_summary),
+        ]
+
+    def cold(operation):
+        def call():
+            processor.invalidate_cache()
+            operation()
+
+        return call
+
+    return [(name, cold(operation)) for name, operation in stages]
+
+
+def benchmark_file(
+    csv_path: Path, mode: str = "full", chunksize: Optional[int] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Time and memory-profile every processor stage on one export
+
+    Stages are timed in one run and memory-profiled in a second run under
+    tracemalloc, whose allocation tracing would otherwise slow them down
+    unevenly. The summary cache is cleared before each stage so memoization
+    does not hide the cost of a cold call.
+
+    Args:
+        csv_path: Export to benchmark
+        mode: "full", "lazy" or "stream"
+        chunksize: Rows per chunk in stream mode
+    """
+    if mode == "stream" and chunksize is None:
+        raise ValueError("Stream mode needs a chunksize")
+    seconds = {
+        name: wall_time(operation)
+        for name, operation in _stages(csv_path, mode, chunksize)
+    }
+    peaks = {
+        name: peak_memory(operation)
+        for name, operation in _stages(csv_path, mode, chunksize)
+    }
+    return {
+        name: {"seconds": seconds[name], "peak_mb": peaks[name]} for name in seconds
+    }
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    tolerance: float,
+    min_seconds: float = 0.05,
+) -> List[str]:
+    """
+    Regressions of results against a baseline
+
+    A stage regresses when its time or peak memory exceeds the baseline by
+    more than tolerance. Stages faster than min_seconds in both runs are
+    too noisy to compare on time.
+    """
+    regressions = []
+    for case, stages in results.items():
+        for stage, metrics in stages.items():
+            reference = baseline.get(case, {}).get(stage)
+            if reference is None:
+                continue
+            for metric in ("seconds", "peak_mb"):
+                if (
+                    metric == "seconds"
+                    and max(metrics[metric], reference[metric]) < min_seconds
+                ):
+                    continue
+                limit = reference[metric] * (1 + tolerance)
+                if metrics[metric] > limit:
+                    regressions.append(
+                        f"{case} {stage}: {metric} {metrics[metric]} > "
+                        f"{reference[metric]} (+{tolerance:.0%})"
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the JCC2 data processor")
+    parser.add_argument(
+        "--schema",
+        default="data/mock_20_jcc2_user_questionnaire.csv",
+        help="Real export whose schema row drives the generator",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[1000, 10000],
+        help="Respondent counts to benchmark (e.g. 1000 10000 100000 1000000)",
+    )
+    parser.add_argument(
+        "--width",
+        type=int,
+        default=None,
+        help="Total column count (default: schema width)",
+    )
+    parser.add_argument("--mode", choices=["full", "lazy", "stream"], default="full")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--workdir", default=None, help="Where to write generated exports"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep generated exports")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", help="Write results to this baseline JSON")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown or memory growth over the baseline (default 25%%)",
+    )
+    args = parser.parse_args()
+
+    logging.getLogger("jcc2_data_processor").setLevel(logging.ERROR)
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="jcc2_bench_"))
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    results = {}
+    for n_rows in args.rows:
+        csv_path = workdir / f"synthetic_{n_rows}x{args.width or 'schema'}.csv"
+        start = time.perf_counter()
+        generate_synthetic_csv(args.schema, n_rows, csv_path, args.width, args.seed)
+        n_columns = len(pd.read_csv(csv_path, nrows=0).columns)
+        print(
+            f"Generated {n_rows} rows x {n_columns} columns "
+            f"in {time.perf_counter() - start:.1f}s "
+            f"({csv_path.stat().st_size / 1e6:.1f} MB)"
+        )
+
+        case = f"{Path(args.schema).stem}:{n_rows}x{n_columns}:{args.mode}"
+        chunksize = max(1, n_rows // STREAM_CHUNKS)
+        results[case] = benchmark_file(csv_path, args.mode, chunksize)
+        for stage, metrics in results[case].items():
+            print(
+                f"  {stage:<30} {metrics['seconds']:>9.3f}s "
+                f"{metrics['peak_mb']:>10.1f} MB"
+            )
+
+        if not args.keep:
+            csv_path.unlink()
+
+    if args.save_baseline:
+        baseline_path = Path(args.save_baseline)
+        baseline = (
+            json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+        )
+        baseline.update(results)
+        baseline_path.write_text(json.dumps(baseline, indent=2))
+        print(f"\nSaved baseline to {baseline_path}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
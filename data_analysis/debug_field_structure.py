@@ -84,12 +84,19 @@ print(f"\n{'='*80}")
 print("Detailed look at mop_1_1_1 fields:")
 print(f"{'='*80}")
 
+# Distributions for every choice field, computed in one pass
+profile = processor.data_profile
+
 if 'mop_1_1_1' in processor.sections:
     mop_fields = processor.sections['mop_1_1_1']
     for field in sorted(mop_fields):
         print(f"  {field}")
         # Check sample values
-        if field in df.columns:
-            non_null = df[field].dropna()
-            if len(non_null) > 0:
-                print(f"    Sample values: {non_null.value_counts().head(3).to_dict()}")
\ No newline at end of file
+        if field in profile.value_counts:
+            value_counts = profile.get_value_counts(field)
+        elif field in df.columns:
+            value_counts = df[field].dropna().value_counts()
+        else:
+            continue
+        if len(value_counts) > 0:
+            print(f"    Sample values: {value_counts.head(3).to_dict()}")
\ No newline at end of file
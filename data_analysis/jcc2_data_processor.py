@@ -9,22 +9,221 @@ Supports:
 
 import pandas as pd
 import numpy as np
+from scipy import sparse, stats
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, field as dataclass_field
-from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple, Union
+from dataclasses import asdict, dataclass, field as dataclass_field
+from datetime import date, datetime
+import argparse
 import json
-from collections import defaultdict
+import copy
+import functools
+import glob
+import gzip
+import hashlib
+import re
+import sqlite3
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+import warnings
+from collections import Counter, OrderedDict, defaultdict, namedtuple
+from contextlib import contextmanager, nullcontext
+from itertools import chain, compress
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # optional faster JSON backend
+    orjson = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+try:
+    from textblob import TextBlob
+except ImportError:  # only needed to score new texts in analyze_sentiment
+    TextBlob = None
+
+
+# The module does not configure logging; applications choose handlers and levels
 logger = logging.getLogger(__name__)
+# Machine-readable stage records, see ProcessorStats
+stats_logger = logging.getLogger(__name__ + ".stats")
+
+# Bump when parsing or type conversion changes so cached loads are rebuilt
+PROCESSOR_VERSION = "1.6.1"
+
+CACHE_SUFFIX = ".jcc2cache"
+
+# Overrides the per-user directory that parsed-state caches are kept in
+CACHE_DIR_ENV = "JCC2_CACHE_DIR"
+
+# Sentiment score cache shared by every CSV in a folder
+SENTIMENT_CACHE_NAME = "jcc2_sentiment.sqlite"
+
+# Terms of the full-text index: lowercase words, numbers and hyphenated names
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*")
+
+# Tokens shorter than this (stray letters, "a", "i") are not indexed
+MIN_TOKEN_LENGTH = 2
+
+# Common words left out of term frequency tables (still searchable)
+STOPWORDS = frozenset(
+    """a about all also an and any are as at be been but by can could did do
+    does for from had has have i if in into is it its just more my no not of
+    on or our so some than that the their them then there these they this to
+    too very was we were what when which while who will with would you your""".split()
+)
+
+# Candidate formats for date and datetime fields, tried in order on a sample
+TEMPORAL_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y",
+)
+TEMPORAL_SAMPLE_SIZE = 200
+
+# Used when a file has no exp_app_* columns to derive applications from
+DEFAULT_APPLICATIONS = [
+    "jcc2cyberops",
+    "jcc2readiness",
+    "a2it",
+    "cad",
+    "codex",
+    "crucible",
+    "cyber9line",
+    "dispatch",
+    "madss",
+    "rally",
+    "redmap",
+    "sigact",
+    "threathub",
+    "triage",
+    "unity",
+]
+
+# Short forms used in field names for some applications
+APPLICATION_ALIASES = {
+    "cyberops": "jcc2cyberops",
+    "readiness": "jcc2readiness",
+    "cyber_9line": "cyber9line",
+    "threat_hub": "threathub",
+}
+
+# Row label for rating fields that are not about a single application
+OVERALL_APPLICATION = "overall"
+
+EFFECTIVENESS_RATINGS = {
+    "Completely Ineffective": 1,
+    "Moderately Ineffective": 2,
+    "Slightly Ineffective": 3,
+    "Slightly Effective": 4,
+    "Moderately Effective": 5,
+    "Completely Effective": 6,
+    "Not Applicable": np.nan,
+}
+
+# Recommendation question NPS is computed from (Yes promotes, No detracts)
+RECOMMEND_FIELD = "overall_system_suitability_eval.recommend_jcc2"
+
+# Demographic columns the demographic cube groups by, when present
+DEMOGRAPHIC_FIELDS = [
+    "role_and_echelon.current_role_status",
+    "role_and_echelon.is_cyber_operator",
+    "role_and_echelon.cyber_ops_division_team",
+    "role_and_echelon.echelon",
+    "role_and_echelon.duties",
+    "operational_jcc2_experience.exp_cyberoperations",
+    "operational_jcc2_experience.exp_yourcurrentrole",
+    "operational_jcc2_experience.exp_jcc2experience",
+]
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values JSON has no type for: numpy, pandas and datetime values"""
+    if value is pd.NaT:
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (np.ndarray, pd.Series, pd.Index)):
+        return value.tolist()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict(orient="records")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _dumps(value: Any, compact: bool = False) -> str:
+    """Encode JSON with orjson when installed, falling back to json"""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=_json_default, option=option).decode()
+    if compact:
+        return json.dumps(value, default=_json_default, separators=(",", ":"))
+    return json.dumps(value, default=_json_default, indent=2)
+
+
+def _open_text(path: Union[str, Path], mode: str = "r"):
+    """Open a text file, through gzip when the name ends in .gz"""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def cache_dir() -> Path:
+    """Per-user directory for parsed-state caches
+
+    $JCC2_CACHE_DIR when set, otherwise jcc2 under $XDG_CACHE_HOME (~/.cache).
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "jcc2"
+
+
+def _is_private(path: Path) -> bool:
+    """True if path is owned by this user and not group or world writable"""
+    info = path.stat()
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        return False
+    return not info.st_mode & 0o022
+
+
+def _loads(value: str) -> Any:
+    """Decode JSON with orjson when installed, falling back to json"""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def _to_datetime(values: np.ndarray, fmt: str) -> pd.DatetimeIndex:
+    """Parse values with one format, as UTC when time zones are mixed"""
+    try:
+        with warnings.catch_warnings():
+            # pandas warns before returning mixed offsets as objects
+            warnings.simplefilter("ignore", FutureWarning)
+            return pd.DatetimeIndex(pd.to_datetime(values, format=fmt, errors="coerce"))
+    except ValueError:
+        # Aware and naive values together only parse onto a common zone
+        return pd.DatetimeIndex(
+            pd.to_datetime(values, format=fmt, errors="coerce", utc=True)
+        )
 
 
 class DataFormat(Enum):
@@ -35,7 +234,7 @@ class DataFormat(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldSchema:
     """Represents the schema definition for a single field"""
 
@@ -44,7 +243,11 @@ class FieldSchema:
     field_id: Optional[str]
     field_type: str
     required: bool = False
-    options: List[str] = dataclass_field(default_factory=list)
+    # Shared between fields with the same schema string; do not mutate
+    options: Tuple[str, ...] = ()
+    option_set: FrozenSet[str] = dataclass_field(
+        default=frozenset(), repr=False, compare=False
+    )
     depends_on: Optional[str] = None
     min_value: Optional[float] = None
     max_value: Optional[float] = None
@@ -54,10 +257,26 @@ class FieldSchema:
     column_types: Dict[str, str] = dataclass_field(default_factory=dict)
     min_rows: Optional[int] = None
     max_rows: Optional[int] = None
+    # Value type of a system column, e.g. "datetime" for system|datetime
+    system_type: Optional[str] = None
+
+    @property
+    def temporal_type(self) -> Optional[str]:
+        """The "date" or "datetime" type of fields holding timestamps, else None"""
+        if self.field_type in ("date", "datetime"):
+            return self.field_type
+        if self.system_type in ("date", "datetime"):
+            return self.system_type
+        return None
 
     @classmethod
     def parse(cls, column_name: str, schema_string: str) -> "FieldSchema":
         """Parse schema string into FieldSchema object"""
+        return cls.from_spec(column_name, cls.compile(schema_string))
+
+    @classmethod
+    def from_spec(cls, column_name: str, spec: Dict[str, Any]) -> "FieldSchema":
+        """Create the field for a column from a compiled schema string"""
         # Parse column name for section and field_id
         section = None
         field_id = column_name
@@ -67,77 +286,2241 @@ class FieldSchema:
             section = parts[0]
             field_id = parts[1]
 
-        # Parse schema string
-        parts = schema_string.split("|")
-        field_type = parts[0] if parts else "text"
+        return cls(name=column_name, section=section, field_id=field_id, **spec)
 
-        schema_obj = cls(
-            name=column_name, section=section, field_id=field_id, field_type=field_type
-        )
+    @staticmethod
+    def compile(schema_string: str) -> Dict[str, Any]:
+        """Parse a schema string into the attributes it defines"""
+        parts = schema_string.split("|")
+        spec: Dict[str, Any] = {"field_type": parts[0] if parts else "text"}
+        if spec["field_type"] == "system" and len(parts) > 1:
+            spec["system_type"] = parts[1].split(":", 1)[0]
 
         # Parse additional attributes
         for part in parts[1:]:
             if part == "required":
-                schema_obj.required = True
+                spec["required"] = True
             elif part == "optional":
-                schema_obj.required = False
+                spec["required"] = False
             elif part == "multiple":
-                schema_obj.multiple = True
+                spec["multiple"] = True
             elif part.startswith("options:"):
                 options_str = part[8:]
-                schema_obj.options = [opt.strip() for opt in options_str.split(",")]
+                spec["options"] = tuple(opt.strip() for opt in options_str.split(","))
+                spec["option_set"] = frozenset(spec["options"])
             elif part.startswith("depends_on:"):
-                schema_obj.depends_on = part[11:]
+                spec["depends_on"] = part[11:]
             elif part.startswith("min:"):
-                schema_obj.min_value = float(part[4:])
+                spec["min_value"] = float(part[4:])
             elif part.startswith("max:"):
-                schema_obj.max_value = float(part[4:])
+                spec["max_value"] = float(part[4:])
             elif part.startswith("columns:"):
-                schema_obj.columns = int(part[8:])
+                spec["columns"] = int(part[8:])
             elif part.startswith("column_types:"):
                 # Parse column types for datatable
                 col_types_str = part[13:]
+                column_types = spec.setdefault("column_types", {})
                 for col_def in col_types_str.split("|"):
                     if ":" in col_def:
                         col_name, col_type = col_def.split(":", 1)
-                        schema_obj.column_types[col_name] = col_type
+                        column_types[col_name] = col_type
             elif part.startswith("minRows:"):
-                schema_obj.min_rows = int(part[8:])
+                spec["min_rows"] = int(part[8:])
             elif part.startswith("maxRows:"):
-                schema_obj.max_rows = int(part[8:])
+                spec["max_rows"] = int(part[8:])
+
+        return spec
+
+
+class SchemaRegistry:
+    """
+    Compiled schema strings, each parsed once
+
+    Columns sharing a schema string (hundreds of identical rating fields in
+    the questionnaire) share one options tuple, option frozenset and
+    categorical dtype. The registry pickles with the processor cache.
+    """
+
+    def __init__(self):
+        self.specs: Dict[str, Dict[str, Any]] = {}
+        self._dtypes: Dict[Tuple[str, ...], pd.CategoricalDtype] = {}
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def field(self, column_name: str, schema_string: str) -> FieldSchema:
+        """FieldSchema for a column, compiling its schema string on first use"""
+        spec = self.specs.get(schema_string)
+        if spec is None:
+            spec = self.specs[schema_string] = FieldSchema.compile(schema_string)
+        return FieldSchema.from_spec(column_name, spec)
+
+    def categorical_dtype(self, options: Tuple[str, ...]) -> pd.CategoricalDtype:
+        """Shared categorical dtype for an options tuple"""
+        dtype = self._dtypes.get(options)
+        if dtype is None:
+            dtype = self._dtypes[options] = pd.CategoricalDtype(
+                list(dict.fromkeys(options))
+            )
+        return dtype
+
+
+class ValidationRule(Enum):
+    """Schema rules checked by the validation engine"""
+
+    REQUIRED = "required"
+    INVALID_OPTION = "invalid_option"
+    INVALID_OPTIONS = "invalid_options"
+    BELOW_MIN = "below_min"
+    ABOVE_MAX = "above_max"
+
+
+class _ValidationCollector:
+    """Accumulates per-column validation failures as parallel arrays"""
+
+    def __init__(self, max_errors: Optional[int] = None):
+        self.max_errors = max_errors
+        self.count = 0
+        self._positions: List[np.ndarray] = []
+        self._columns: List[np.ndarray] = []
+        self._rules: List[np.ndarray] = []
+        self._values: List[np.ndarray] = []
+
+    @property
+    def full(self) -> bool:
+        return self.max_errors is not None and self.count >= self.max_errors
+
+    def add(
+        self,
+        col_position: int,
+        rule: ValidationRule,
+        mask: np.ndarray,
+        series: pd.Series,
+    ):
+        """Record the rows of ``series`` flagged by a boolean mask"""
+        positions = np.flatnonzero(mask)
+        if len(positions) > 0:
+            self.add_positions(
+                col_position, rule, positions, series.to_numpy()[positions]
+            )
+
+    def add_positions(
+        self,
+        col_position: int,
+        rule: ValidationRule,
+        positions: np.ndarray,
+        values: np.ndarray,
+    ):
+        """Record failures at the given row positions"""
+        if self.full:
+            return
+        if self.max_errors is not None:
+            remaining = self.max_errors - self.count
+            positions = positions[:remaining]
+            values = values[:remaining]
+
+        self._positions.append(np.asarray(positions, dtype=np.int64))
+        self._columns.append(np.full(len(positions), col_position, dtype=np.int32))
+        self._rules.append(np.full(len(positions), _RULE_ORDER[rule], dtype=np.int8))
+        self._values.append(np.asarray(values, dtype=object))
+        self.count += len(positions)
+
+    def to_frame(self, index: pd.Index, columns: List[str]) -> pd.DataFrame:
+        """Build the error table, sorted by row, column and rule"""
+        rules = list(ValidationRule)
+        if not self._positions:
+            return pd.DataFrame(
+                {
+                    "row": pd.Series([], dtype=index.dtype),
+                    "column": pd.Categorical([], categories=columns),
+                    "rule": pd.Categorical([], categories=[r.value for r in rules]),
+                    "value": pd.Series([], dtype=object),
+                }
+            )
+
+        positions = np.concatenate(self._positions)
+        col_codes = np.concatenate(self._columns)
+        rule_codes = np.concatenate(self._rules)
+        values = np.concatenate(self._values)
+
+        order = np.lexsort((rule_codes, col_codes, positions))
+        return pd.DataFrame(
+            {
+                "row": index.to_numpy()[positions[order]],
+                "column": pd.Categorical.from_codes(
+                    col_codes[order], categories=columns
+                ),
+                "rule": pd.Categorical.from_codes(
+                    rule_codes[order], categories=[r.value for r in rules]
+                ),
+                "value": values[order],
+            }
+        )
+
+
+_RULE_ORDER = {rule: code for code, rule in enumerate(ValidationRule)}
+
+
+GroupKey = Union[str, pd.Series, pd.DataFrame, List[Any]]
+
+
+def _to_float_array(series: pd.Series) -> np.ndarray:
+    """Convert a column to a float array, coercing non-numeric values to NaN"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=float, na_value=np.nan)
+    return pd.to_numeric(
+        pd.Series(series.to_numpy(dtype=object)), errors="coerce"
+    ).to_numpy(dtype=float, na_value=np.nan)
+
+
+def _group_indicators(df: pd.DataFrame, group_by: GroupKey) -> pd.DataFrame:
+    """
+    Build a boolean respondent x group membership matrix
+
+    A column name or Series yields one group per distinct value; list-valued
+    cells (multiple-choice checkboxes) put a respondent in every selected
+    group. A boolean DataFrame is used as-is, one group per column. A list of
+    keys stacks all their groups, so overlapping groupings can be aggregated
+    in a single pass. Columns are labelled (grouping, group).
+    """
+    keys = group_by if isinstance(group_by, list) else [group_by]
+    n_rows = len(df)
+    frames = []
+
+    for key in keys:
+        if isinstance(key, pd.DataFrame):
+            indicators = key.reindex(df.index).fillna(False).astype(bool)
+            grouping = key.columns.name or "membership"
+        else:
+            values = df[key] if isinstance(key, str) else key.reindex(df.index)
+            grouping = key if isinstance(key, str) else (key.name or "group")
+            positions = pd.Series(
+                values.to_numpy(dtype=object), index=np.arange(n_rows)
+            )
+            if positions.map(type).eq(list).any():
+                positions = positions.explode()
+            positions = positions.dropna()
+            indicators = (
+                pd.get_dummies(positions)
+                .groupby(level=0)
+                .max()
+                .reindex(np.arange(n_rows), fill_value=False)
+            )
+            indicators.index = df.index
+
+        indicators.columns = pd.MultiIndex.from_product(
+            [[grouping], indicators.columns], names=["grouping", "group"]
+        )
+        frames.append(indicators)
+
+    return pd.concat(frames, axis=1)
+
+
+def _grouped_stats(values: pd.Series, indicators: pd.DataFrame) -> pd.DataFrame:
+    """Count, mean and standard deviation of values for every group at once"""
+    x = values.to_numpy(dtype=float)
+    valid = ~np.isnan(x)
+    filled = np.where(valid, x, 0.0)
+    membership = indicators.to_numpy(dtype=float)
+
+    counts = membership.T @ valid
+    sums = membership.T @ filled
+    sumsq = membership.T @ (filled**2)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+        variances = (sumsq - counts * means**2) / (counts - 1)
+
+    return pd.DataFrame(
+        {
+            "count": counts.astype(int),
+            "mean": means,
+            "std": np.sqrt(np.clip(variances, 0, None)),
+        },
+        index=indicators.columns,
+    )
+
+
+def _bootstrap_ratios(
+    numerators: np.ndarray,
+    denominators: np.ndarray,
+    n_draws: int,
+    rng: np.random.Generator,
+    strata: Optional[np.ndarray] = None,
+    block_size: int = 256,
+) -> np.ndarray:
+    """
+    Bootstrap replicates of sum(numerator) / sum(denominator) for every column
+
+    Each draw resamples respondents with replacement, within each stratum
+    when stratum codes are given so stratum sizes stay fixed. A block of
+    draws is one draws x respondents index matrix, turned into resample
+    counts, and the ratios of every column for the whole block come from two
+    matrix products. Blocks only bound memory: the random stream, and so the
+    result for a given rng, does not depend on block_size.
+
+    Returns:
+        n_draws x columns array (NaN where a resample has no denominator)
+    """
+    n_rows = len(numerators)
+    strata = np.zeros(n_rows, dtype=np.int64) if strata is None else np.asarray(strata)
+    # Respondents sorted by stratum; slot j draws from the stratum of respondent j
+    order = np.argsort(strata, kind="stable")
+    sizes = np.bincount(strata)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    slot_start, slot_size = starts[strata], sizes[strata]
+
+    replicates = np.empty((n_draws, numerators.shape[1]))
+    for start in range(0, n_draws, block_size):
+        n_block = min(block_size, n_draws - start)
+        draws = rng.random((n_block, n_rows))
+        picks = order[slot_start + (draws * slot_size).astype(np.int64)]
+        counts = (
+            np.bincount(
+                (np.arange(n_block)[:, None] * n_rows + picks).ravel(),
+                minlength=n_block * n_rows,
+            )
+            .reshape(n_block, n_rows)
+            .astype(float)
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            replicates[start : start + n_block] = (counts @ numerators) / (
+                counts @ denominators
+            )
+    return replicates
+
+
+def _count_values(series: pd.Series, field_schema: Optional[FieldSchema]) -> pd.Series:
+    """Value counts for a column, counting each selected option of list cells"""
+    if (
+        field_schema is not None
+        and field_schema.field_type == "checkbox"
+        and field_schema.multiple
+    ):
+        series = series.explode()
+    counts = series.value_counts()
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categorical counts include every schema option; keep observed ones
+        counts = counts[counts > 0]
+    return counts
+
+
+@dataclass
+class MultiChoiceMatrix:
+    """
+    Sparse respondent x option selection matrix for a multiple-choice field
+
+    Columns are the schema options in order, followed by any off-schema
+    options found in the data.
+    """
+
+    field: str
+    options: List[str]
+    matrix: sparse.csr_matrix
+    index: pd.Index
+    n_schema_options: int
+
+    @classmethod
+    def from_lists(
+        cls, series: pd.Series, field_schema: FieldSchema
+    ) -> "MultiChoiceMatrix":
+        """Build the matrix from a column of selected-option lists"""
+        cells = [v if isinstance(v, list) else [] for v in series.to_numpy()]
+        lengths = np.fromiter((len(v) for v in cells), dtype=np.int64, count=len(cells))
+        selected = pd.Index(list(chain.from_iterable(cells)), dtype=object)
+
+        options = pd.Index(list(dict.fromkeys(field_schema.options)), dtype=object)
+        extras = selected[~selected.isin(options)].unique()
+        all_options = options.append(extras)
+
+        matrix = sparse.csr_matrix(
+            (
+                np.ones(len(selected), dtype=np.int8),
+                (
+                    np.repeat(np.arange(len(cells)), lengths),
+                    all_options.get_indexer(selected),
+                ),
+            ),
+            shape=(len(cells), len(all_options)),
+        )
+        # Repeated selections within a cell count once
+        matrix.data = np.minimum(matrix.data, 1)
+
+        return cls(
+            field=field_schema.name,
+            options=all_options.tolist(),
+            matrix=matrix,
+            index=series.index,
+            n_schema_options=len(options),
+        )
+
+    @classmethod
+    def concat(
+        cls, parts: List["MultiChoiceMatrix"], index: pd.Index
+    ) -> "MultiChoiceMatrix":
+        """
+        Stack matrices of the same field row-wise
+
+        Option columns are the first part's, followed by options only seen
+        in later parts. ``index`` labels the stacked rows.
+        """
+        options = pd.Index(parts[0].options, dtype=object)
+        for part in parts[1:]:
+            options = options.append(
+                pd.Index(part.options).difference(options, sort=False)
+            )
+
+        blocks = []
+        for part in parts:
+            coo = part.matrix.tocoo()
+            remap = options.get_indexer(part.options)
+            blocks.append(
+                sparse.csr_matrix(
+                    (coo.data, (coo.row, remap[coo.col])),
+                    shape=(part.matrix.shape[0], len(options)),
+                )
+            )
+
+        return cls(
+            field=parts[0].field,
+            options=options.tolist(),
+            matrix=sparse.vstack(blocks, format="csr"),
+            index=index,
+            n_schema_options=parts[0].n_schema_options,
+        )
+
+    def take(self, positions: np.ndarray) -> "MultiChoiceMatrix":
+        """Rows at the given positions"""
+        return MultiChoiceMatrix(
+            field=self.field,
+            options=self.options,
+            matrix=self.matrix[positions],
+            index=self.index[positions],
+            n_schema_options=self.n_schema_options,
+        )
+
+    @property
+    def off_schema_options(self) -> List[str]:
+        return self.options[self.n_schema_options :]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Dense boolean respondent x option frame"""
+        return pd.DataFrame(
+            self.matrix.toarray().astype(bool), index=self.index, columns=self.options
+        )
+
+    def option_counts(self) -> pd.Series:
+        """Number of respondents selecting each option, most common first"""
+        counts = pd.Series(
+            np.asarray(self.matrix.sum(axis=0)).ravel(),
+            index=self.options,
+            name="count",
+        )
+        counts = counts[counts > 0]
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def cooccurrence(self) -> pd.DataFrame:
+        """Option x option counts of respondents selecting both options"""
+        counts = (self.matrix.T @ self.matrix).toarray()
+        return pd.DataFrame(counts, index=self.options, columns=self.options)
+
+    def breakdown(self, indicators: pd.DataFrame) -> pd.DataFrame:
+        """Group x option selection counts for a boolean membership matrix"""
+        membership = sparse.csr_matrix(indicators.to_numpy(dtype=np.int64))
+        counts = (membership.T @ self.matrix).toarray()
+        return pd.DataFrame(counts, index=indicators.columns, columns=self.options)
+
+    def mean_by_option(self, values: pd.Series) -> pd.DataFrame:
+        """Count and mean of a numeric column among respondents choosing each option"""
+        x = _to_float_array(values.reindex(self.index))
+        valid = ~np.isnan(x)
+        counts = self.matrix.T @ valid.astype(np.int64)
+        sums = self.matrix.T @ np.where(valid, x, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        return pd.DataFrame({"count": counts, "mean": means}, index=self.options)
+
+
+class RatingCube:
+    """
+    Ordinal ratings arranged as respondent x application x section
+
+    Every rating field of a section is assigned to the application named at
+    the end of the field (or to OVERALL_APPLICATION). Responses are held as a
+    sparse respondent x (application, section, level) count matrix, with a
+    final level for Not Applicable, so every aggregate below is a sparse
+    matrix product. Matrices are application x section; with group_by they
+    are stacked under (grouping, group) row levels.
+    """
+
+    def __init__(
+        self,
+        counts: sparse.csr_matrix,
+        index: pd.Index,
+        applications: List[str],
+        sections: List[str],
+        labels: List[str],
+        scores: np.ndarray,
+        fields: Dict[tuple, List[str]],
+    ):
+        self.counts = counts
+        self.index = index
+        self.applications = applications
+        self.sections = sections
+        self.labels = labels
+        self.scores = scores
+        self.fields = fields
+
+    @property
+    def shape(self) -> tuple:
+        return (len(self.index), len(self.applications), len(self.sections))
+
+    @property
+    def n_levels(self) -> int:
+        return len(self.scores) + 1
+
+    def _cell_weights(self, level_weights: np.ndarray) -> sparse.csr_matrix:
+        """(cell, level) -> cell matrix weighting each level"""
+        n_cells = len(self.applications) * len(self.sections)
+        return sparse.kron(
+            sparse.identity(n_cells, format="csr"),
+            sparse.csr_matrix(level_weights.reshape(-1, 1)),
+            format="csr",
+        )
+
+    def _group_totals(self, matrix: sparse.csr_matrix, indicators) -> np.ndarray:
+        """Column sums of matrix, overall or per group (groups x columns)"""
+        if indicators is None:
+            return np.asarray(matrix.sum(axis=0))
+        membership = sparse.csr_matrix(indicators.to_numpy(dtype=np.int64))
+        return (membership.T @ matrix).toarray()
+
+    def _frame(self, values: np.ndarray, indicators) -> pd.DataFrame:
+        """Shape groups x cells into application x section matrices"""
+        n_apps, n_sections = len(self.applications), len(self.sections)
+        values = values.reshape(-1, n_sections)
+        if indicators is None:
+            return pd.DataFrame(values, index=self.applications, columns=self.sections)
+
+        rows = pd.MultiIndex.from_tuples(
+            [
+                (*group, app)
+                for group in indicators.columns
+                for app in self.applications
+            ],
+            names=["grouping", "group", "application"],
+        )
+        return pd.DataFrame(values, index=rows, columns=self.sections)
+
+    def _sums_and_counts(self, indicators):
+        rated = np.append(np.ones(len(self.scores)), 0.0)
+        scores = np.append(self.scores, 0.0)
+        counts = self._group_totals(self.counts @ self._cell_weights(rated), indicators)
+        sums = self._group_totals(self.counts @ self._cell_weights(scores), indicators)
+        return sums, counts
+
+    def to_array(self) -> np.ndarray:
+        """Dense respondent x application x section mean ratings (NaN if none)"""
+        rated = np.append(np.ones(len(self.scores)), 0.0)
+        scores = np.append(self.scores, 0.0)
+        counts = (self.counts @ self._cell_weights(rated)).toarray()
+        sums = (self.counts @ self._cell_weights(scores)).toarray()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (sums / counts).reshape(self.shape)
+
+    def count(self, indicators: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Number of ratings (excluding Not Applicable) per cell"""
+        return self._frame(self._sums_and_counts(indicators)[1], indicators)
+
+    def not_applicable(self, indicators: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Number of Not Applicable responses per cell"""
+        na_level = np.append(np.zeros(len(self.scores)), 1.0)
+        na_counts = self._group_totals(
+            self.counts @ self._cell_weights(na_level), indicators
+        )
+        return self._frame(na_counts, indicators)
+
+    def mean(self, indicators: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Mean rating over all responses in each cell"""
+        sums, counts = self._sums_and_counts(indicators)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._frame(sums / counts, indicators)
+
+    def median(self, indicators: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Exact median rating of each cell, taken from its level counts"""
+        levels = self._group_totals(self.counts, indicators)
+        levels = levels.reshape(-1, self.n_levels)[:, :-1]
+        cumulative = levels.cumsum(axis=1)
+        total = cumulative[:, -1]
+
+        # Average of the two middle ratings (the same one for odd totals)
+        lower = (cumulative >= ((total + 1) // 2)[:, None]).argmax(axis=1)
+        upper = (cumulative >= (total // 2 + 1)[:, None]).argmax(axis=1)
+        medians = (self.scores[lower] + self.scores[upper]) / 2
+        medians[total == 0] = np.nan
+        return self._frame(medians, indicators)
+
+    def distribution(self, indicators: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Response counts per rating label, one row per cell"""
+        levels = self._group_totals(self.counts, indicators).reshape(-1, self.n_levels)
+        cells = pd.MultiIndex.from_product(
+            [self.applications, self.sections], names=["application", "section"]
+        )
+        if indicators is None:
+            rows = cells
+        else:
+            rows = pd.MultiIndex.from_tuples(
+                [(*group, *cell) for group in indicators.columns for cell in cells],
+                names=["grouping", "group", "application", "section"],
+            )
+        return pd.DataFrame(levels, index=rows, columns=self.labels)
+
+
+class DemographicCube:
+    """
+    Rating, NPS and SUS totals per demographic group
+
+    Groups are labelled (grouping, group) as in _group_indicators, with a
+    leading ("all", "all") group of every respondent. For each group the
+    cube keeps the number of respondents, per rating field response counts,
+    score sums and sums of squares, recommendation promoter/detractor/
+    response counts and SUS count/sum/sum of squares. Means, standard
+    deviations and NPS for any group, pooled over any set of rating fields,
+    are computed from these totals without touching the rows again.
+    """
+
+    ALL = ("all", "all")
+
+    def __init__(
+        self,
+        index: pd.Index,
+        groups: pd.MultiIndex,
+        fields: pd.Index,
+        respondents: np.ndarray,
+        counts: np.ndarray,
+        sums: np.ndarray,
+        sumsq: np.ndarray,
+        nps: np.ndarray,
+        sus: np.ndarray,
+    ):
+        self.index = index
+        self.groups = groups
+        self.fields = fields
+        self.respondents = respondents
+        self.counts = counts
+        self.sums = sums
+        self.sumsq = sumsq
+        self.nps_counts = nps
+        self.sus_totals = sus
+
+    @classmethod
+    def build(
+        cls,
+        indicators: pd.DataFrame,
+        ratings: pd.DataFrame,
+        recommend: Optional[pd.Series] = None,
+        sus_scores: Optional[pd.Series] = None,
+    ) -> "DemographicCube":
+        """
+        Aggregate every group with one matrix product per statistic
+
+        Args:
+            indicators: Respondent x (grouping, group) membership
+            ratings: Respondent x rating field scores (NaN if unrated)
+            recommend: Recommendation answers (Yes/No/other) for NPS
+            sus_scores: Per-respondent SUS scores
+        """
+        everyone = pd.DataFrame(
+            True,
+            index=indicators.index,
+            columns=pd.MultiIndex.from_tuples(
+                [cls.ALL], names=indicators.columns.names
+            ),
+        )
+        indicators = pd.concat([everyone, indicators], axis=1)
+        membership = indicators.to_numpy(dtype=float)
+
+        def totals(values: np.ndarray) -> np.ndarray:
+            """Count, sum and sum of squares of each column per group"""
+            valid = ~np.isnan(values)
+            filled = np.where(valid, values, 0.0)
+            return (
+                membership.T @ valid,
+                membership.T @ filled,
+                membership.T @ filled**2,
+            )
+
+        counts, sums, sumsq = totals(ratings.to_numpy(dtype=float))
+
+        n_groups = membership.shape[1]
+        nps = np.zeros((n_groups, 3))
+        if recommend is not None:
+            answers = recommend.to_numpy(dtype=object)
+            answered = pd.notna(answers)
+            nps = membership.T @ np.column_stack(
+                [answers == "Yes", answers == "No", answered]
+            ).astype(float)
+
+        sus = np.zeros((n_groups, 3))
+        if sus_scores is not None:
+            sus = np.column_stack(totals(sus_scores.to_numpy(dtype=float)[:, None]))
+
+        return cls(
+            index=indicators.index,
+            groups=indicators.columns,
+            fields=ratings.columns,
+            respondents=membership.sum(axis=0),
+            counts=counts,
+            sums=sums,
+            sumsq=sumsq,
+            nps=nps,
+            sus=sus,
+        )
+
+    @staticmethod
+    def _stats(count, total, total_sq) -> Dict[str, np.ndarray]:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+            variance = (total_sq - count * mean**2) / (count - 1)
+        return {
+            "count": count.astype(np.int64),
+            "mean": mean,
+            "std": np.sqrt(np.clip(variance, 0, None)),
+        }
+
+    def _field_positions(self, fields: Optional[List[str]]) -> np.ndarray:
+        if fields is None:
+            return np.arange(len(self.fields))
+        positions = self.fields.get_indexer(fields)
+        return positions[positions >= 0]
+
+    def mean(self, fields: Optional[List[str]] = None) -> pd.DataFrame:
+        """Mean score per group x rating field"""
+        positions = self._field_positions(fields)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = self.sums[:, positions] / self.counts[:, positions]
+        return pd.DataFrame(means, index=self.groups, columns=self.fields[positions])
+
+    def count(self, fields: Optional[List[str]] = None) -> pd.DataFrame:
+        """Number of scored responses per group x rating field"""
+        positions = self._field_positions(fields)
+        return pd.DataFrame(
+            self.counts[:, positions].astype(np.int64),
+            index=self.groups,
+            columns=self.fields[positions],
+        )
+
+    def ratings(self, fields: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Ratings pooled over fields, per group
+
+        Every scored response of the fields counts once, so the mean is
+        over responses rather than a mean of field means.
+
+        Returns:
+            DataFrame of count, mean, std and respondents per group
+        """
+        positions = self._field_positions(fields)
+        stats_frame = pd.DataFrame(
+            self._stats(
+                self.counts[:, positions].sum(axis=1),
+                self.sums[:, positions].sum(axis=1),
+                self.sumsq[:, positions].sum(axis=1),
+            ),
+            index=self.groups,
+        )
+        stats_frame["respondents"] = self.respondents.astype(np.int64)
+        return stats_frame
+
+    def nps(self) -> pd.DataFrame:
+        """Promoters, detractors, responses and NPS (-100 to 100) per group"""
+        promoters, detractors, responses = self.nps_counts.T
+        with np.errstate(invalid="ignore", divide="ignore"):
+            score = (promoters - detractors) / responses * 100
+        return pd.DataFrame(
+            {
+                "promoters": promoters.astype(np.int64),
+                "detractors": detractors.astype(np.int64),
+                "responses": responses.astype(np.int64),
+                "nps": score,
+            },
+            index=self.groups,
+        )
+
+    def sus(self) -> pd.DataFrame:
+        """Count, mean and standard deviation of SUS scores per group"""
+        return pd.DataFrame(self._stats(*self.sus_totals.T), index=self.groups)
+
+
+def _encode_values(values: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Integer codes (-1 for missing) and labels of a column's values"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    codes, labels = pd.factorize(values, sort=True)
+    return codes, pd.Index(labels)
+
+
+class ContingencyTables:
+    """
+    Factor x outcome contingency tables for many column pairs at once
+
+    The counts of every pair live in one (pair, factor level, outcome level)
+    array filled by a single bincount over offset codes; levels beyond a
+    pair's own labels are zero padding. Test statistics are computed for all
+    pairs together. Pairs are labelled (section, factor).
+
+    Instances are read-only, so memoized results can be shared.
+    """
+
+    def __init__(
+        self,
+        counts: np.ndarray,
+        keys: pd.MultiIndex,
+        columns: List[Tuple[str, str]],
+        row_labels: List[pd.Index],
+        col_labels: List[pd.Index],
+    ):
+        counts.flags.writeable = False
+        self.counts = counts
+        self.keys = keys
+        self.columns = columns
+        self.row_labels = row_labels
+        self.col_labels = col_labels
+
+    @classmethod
+    def from_frame(
+        cls, df: pd.DataFrame, pairs: Dict[Tuple[str, str], Tuple[str, str]]
+    ) -> "ContingencyTables":
+        """
+        Count every pair of df in one pass
+
+        Args:
+            df: Converted response data
+            pairs: (section, factor) -> (factor column, outcome column)
+        """
+        encoded = {}
+        for col in {col for pair in pairs.values() for col in pair}:
+            encoded[col] = _encode_values(df[col])
+
+        columns = list(pairs.values())
+        row_labels = [encoded[factor_col][1] for factor_col, _ in columns]
+        col_labels = [encoded[outcome_col][1] for _, outcome_col in columns]
+        n_pairs = len(columns)
+        n_levels = max((len(labels) for labels in row_labels), default=0)
+        n_outcomes = max((len(labels) for labels in col_labels), default=0)
+
+        counts = np.zeros(n_pairs * n_levels * n_outcomes, dtype=np.int64)
+        if n_pairs and len(df):
+            factor_codes = np.stack(
+                [encoded[factor_col][0] for factor_col, _ in columns]
+            )
+            outcome_codes = np.stack(
+                [encoded[outcome_col][0] for _, outcome_col in columns]
+            )
+            # Offset each pair's cells so one bincount covers all of them
+            offsets = (np.arange(n_pairs) * n_levels * n_outcomes)[:, None]
+            cells = offsets + factor_codes * n_outcomes + outcome_codes
+            answered = (factor_codes >= 0) & (outcome_codes >= 0)
+            counts = np.bincount(cells[answered], minlength=len(counts))
+
+        keys = pd.MultiIndex.from_tuples(list(pairs), names=["section", "factor"])
+        return cls(
+            counts.reshape(n_pairs, n_levels, n_outcomes),
+            keys,
+            columns,
+            row_labels,
+            col_labels,
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def table(self, section: str, factor: str) -> pd.DataFrame:
+        """Counts of one pair, with unobserved levels dropped"""
+        i = self.keys.get_loc((section, factor))
+        rows, cols = self.row_labels[i], self.col_labels[i]
+        # Renamed copies: the label indexes are shared between pairs and with
+        # the columns' categorical dtypes
+        factor_col, outcome_col = self.columns[i]
+        ct = pd.DataFrame(
+            self.counts[i, : len(rows), : len(cols)],
+            index=rows.rename(factor_col),
+            columns=cols.rename(outcome_col),
+        )
+        return ct.loc[ct.sum(axis=1) > 0, ct.sum(axis=0) > 0]
+
+    def chi_square(self) -> pd.DataFrame:
+        """
+        Pearson chi-square test of independence for every pair
+
+        Unobserved levels do not count towards the degrees of freedom; pairs
+        with fewer than two observed levels on either side get NaN. No
+        continuity correction is applied.
+
+        Returns:
+            DataFrame indexed by (section, factor) with n, chi2, dof,
+            p_value and cramers_v
+        """
+        observed = self.counts.astype(float)
+        row_sums = observed.sum(axis=2)
+        col_sums = observed.sum(axis=1)
+        n = row_sums.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            expected = row_sums[:, :, None] * col_sums[:, None, :] / n[:, None, None]
+            terms = np.where(expected > 0, (observed - expected) ** 2 / expected, 0.0)
+        row_dof = np.maximum((row_sums > 0).sum(axis=1) - 1, 0)
+        col_dof = np.maximum((col_sums > 0).sum(axis=1) - 1, 0)
+        dof = row_dof * col_dof
+
+        testable = dof > 0
+        statistic = np.where(testable, terms.sum(axis=(1, 2)), np.nan)
+        p_value = np.where(
+            testable, stats.chi2.sf(statistic, np.maximum(dof, 1)), np.nan
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cramers_v = np.sqrt(statistic / (n * np.minimum(row_dof, col_dof)))
+        return pd.DataFrame(
+            {
+                "n": n.astype(np.int64),
+                "chi2": statistic,
+                "dof": dof,
+                "p_value": p_value,
+                "cramers_v": cramers_v,
+            },
+            index=self.keys,
+        )
+
+    def two_by_two(self, positive: str = "Yes", negative: str = "No") -> np.ndarray:
+        """
+        (pair, 2, 2) float counts of factor x outcome restricted to two levels
+
+        Rows and columns are ordered (positive, negative); other levels such
+        as N/A are left out. Pairs missing either level are NaN.
+        """
+        levels = [positive, negative]
+        rows = np.array(
+            [labels.get_indexer(levels) for labels in self.row_labels]
+        ).reshape(-1, 2)
+        cols = np.array(
+            [labels.get_indexer(levels) for labels in self.col_labels]
+        ).reshape(-1, 2)
+        pair = np.arange(len(self.keys))[:, None, None]
+        sub = self.counts[
+            pair, np.maximum(rows, 0)[:, :, None], np.maximum(cols, 0)[:, None, :]
+        ].astype(float)
+        sub[(rows < 0).any(axis=1) | (cols < 0).any(axis=1)] = np.nan
+        return sub
+
+    def fisher_exact(self, positive: str = "Yes", negative: str = "No") -> pd.DataFrame:
+        """
+        Two-sided Fisher's exact test on every pair's 2x2 table
+
+        The p-value sums the hypergeometric probability of every table with
+        the observed margins that is no more likely than the observed one,
+        as scipy.stats.fisher_exact does, evaluated for all pairs at once.
+
+        Args:
+            positive: Level counted as present/success (default "Yes")
+            negative: Level counted as absent/failure (default "No")
+
+        Returns:
+            DataFrame indexed by (section, factor) with n, odds_ratio,
+            p_value and the outcome rate given a positive and a negative
+            factor
+        """
+        sub = self.two_by_two(positive, negative)
+        a, b, c, d = sub[:, 0, 0], sub[:, 0, 1], sub[:, 1, 0], sub[:, 1, 1]
+        n = a + b + c + d
+        p_value = np.full(len(n), np.nan)
+
+        valid = np.flatnonzero(n > 0)
+        if len(valid):
+            total = n[valid].astype(np.int64)[:, None]
+            factor_total = (a + b)[valid].astype(np.int64)[:, None]
+            outcome_total = (a + c)[valid].astype(np.int64)[:, None]
+            # Every possible top-left count, outside a pair's support the pmf is 0
+            k = np.arange(int(total.max()) + 1)[None, :]
+            pmf = stats.hypergeom.pmf(k, total, outcome_total, factor_total)
+            observed = stats.hypergeom.pmf(
+                a[valid].astype(np.int64)[:, None], total, outcome_total, factor_total
+            )
+            # Same relative tolerance as scipy for ties in floating point
+            as_extreme = pmf <= observed * (1 + 1e-7)
+            p_value[valid] = np.minimum((pmf * as_extreme).sum(axis=1), 1.0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            odds_ratio = (a * d) / (b * c)
+            rate_positive = a / (a + b)
+            rate_negative = c / (c + d)
+        return pd.DataFrame(
+            {
+                "n": n,
+                "odds_ratio": odds_ratio,
+                "p_value": p_value,
+                "rate_given_positive": rate_positive,
+                "rate_given_negative": rate_negative,
+            },
+            index=self.keys,
+        )
+
+
+def _textblob_sentiment(text: str) -> Tuple[float, float]:
+    """Polarity (-1 to 1) and subjectivity (0 to 1) of text with TextBlob"""
+    sentiment = TextBlob(text).sentiment
+    return float(sentiment.polarity), float(sentiment.subjectivity)
+
+
+def _score_batch(scorer, texts: List[str]) -> List[Tuple[float, float]]:
+    """Score a batch of texts (module-level so a process pool can run it)"""
+    return [tuple(scorer(text)) for text in texts]
+
+
+class SentimentCache:
+    """
+    Sentiment scores on disk, keyed by scorer and a hash of the text
+
+    A SQLite file, so one cache serves every dataset and every run and
+    unchanged responses are never scored twice.
+    """
+
+    # Keep IN (...) lookups under SQLite's bound parameter limit
+    LOOKUP_CHUNK = 500
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sentiment ("
+            "scorer TEXT NOT NULL, text_hash TEXT NOT NULL, "
+            "polarity REAL, subjectivity REAL, "
+            "PRIMARY KEY (scorer, text_hash))"
+        )
+
+    def __enter__(self) -> "SentimentCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._conn.close()
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get_many(
+        self, scorer: str, hashes: List[str]
+    ) -> Dict[str, Tuple[float, float]]:
+        """Cached scores of the given text hashes that have been scored"""
+        found = {}
+        for start in range(0, len(hashes), self.LOOKUP_CHUNK):
+            chunk = hashes[start : start + self.LOOKUP_CHUNK]
+            rows = self._conn.execute(
+                "SELECT text_hash, polarity, subjectivity FROM sentiment "
+                f"WHERE scorer = ? AND text_hash IN ({','.join('?' * len(chunk))})",
+                [scorer, *chunk],
+            )
+            found.update(
+                (text_hash, (polarity, subjectivity))
+                for text_hash, polarity, subjectivity in rows
+            )
+        return found
+
+    def put_many(self, scorer: str, scores: Dict[str, Tuple[float, float]]):
+        """Store scores by text hash"""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sentiment VALUES (?, ?, ?, ?)",
+                [(scorer, text_hash, *score) for text_hash, score in scores.items()],
+            )
+
+
+class TextIndex:
+    """
+    Inverted index over free-text responses
+
+    Every non-empty (respondent, field) response is a document. Term counts
+    are held as a sparse document x term matrix whose columns are the
+    postings of each term; the vocabulary is sorted so prefix queries are a
+    range lookup. Documents carry their field, section and, for pooled data,
+    dataset, so term frequencies per group are one sparse product.
+    """
+
+    def __init__(
+        self,
+        terms: pd.Index,
+        counts: sparse.csr_matrix,
+        rows: np.ndarray,
+        groups: Dict[str, Tuple[np.ndarray, pd.Index]],
+    ):
+        self.terms = terms
+        self.counts = counts
+        self.rows = rows
+        self.groups = groups
+        self._postings: Optional[sparse.csc_matrix] = None
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        # Typographic apostrophes would split "don\u2019t" into "don" and "t"
+        return text.lower().replace("\u2019", "'")
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """Normalized terms of a text"""
+        return [
+            token
+            for token in TOKEN_PATTERN.findall(cls._normalize(str(text)))
+            if len(token) >= MIN_TOKEN_LENGTH
+        ]
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        fields: List[str],
+        sections: Optional[Dict[str, Optional[str]]] = None,
+        group_column: Optional[str] = None,
+    ) -> "TextIndex":
+        """
+        Index the fields of df
+
+        Each distinct text is tokenized once, however many respondents gave it.
+
+        Args:
+            df: Response data
+            fields: Text columns to index
+            sections: Section of each field
+            group_column: Extra per-respondent grouping (e.g. "dataset")
+        """
+        values = df[fields].to_numpy(dtype=object)
+        rows, cols = np.nonzero(pd.notna(values))
+        text_codes, texts = pd.factorize(values[rows, cols])
+
+        tokens = pd.Series(texts, dtype=object).astype(str).map(cls._normalize)
+        tokens = tokens.str.findall(TOKEN_PATTERN).explode().dropna()
+        tokens = tokens[tokens.str.len() >= MIN_TOKEN_LENGTH]
+        term_codes, terms = pd.factorize(tokens.to_numpy(dtype=object), sort=True)
+        text_terms = sparse.csr_matrix(
+            (
+                np.ones(len(term_codes), dtype=np.int64),
+                (tokens.index.to_numpy(), term_codes),
+            ),
+            shape=(len(texts), len(terms)),
+        )
+        counts = text_terms[text_codes]
+
+        field_names = pd.Index(fields)
+        groups = {"field": (cols, field_names)}
+        if sections is not None:
+            section_codes, section_names = pd.factorize(
+                pd.Series([sections.get(col) for col in fields], dtype=object)
+            )
+            groups["section"] = (section_codes[cols], pd.Index(section_names))
+        if group_column is not None and group_column in df.columns:
+            codes, labels = pd.factorize(df[group_column].to_numpy(dtype=object)[rows])
+            groups[group_column] = (codes, pd.Index(labels))
+
+        return cls(pd.Index(terms), counts, df.index.to_numpy()[rows], groups)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The postings are a transposed copy of counts, rebuilt on demand
+        return {**self.__dict__, "_postings": None}
+
+    def __len__(self) -> int:
+        return self.counts.shape[0]
+
+    @property
+    def postings(self) -> sparse.csc_matrix:
+        """Term columns of the document x term counts"""
+        if self._postings is None:
+            self._postings = self.counts.tocsc()
+        return self._postings
+
+    def _term_ids(self, token: str) -> np.ndarray:
+        """Vocabulary positions of a query term, "term*" for a prefix"""
+        if token.endswith("*"):
+            prefix = token[:-1].lower()
+            start = self.terms.searchsorted(prefix, side="left")
+            stop = self.terms.searchsorted(prefix + "\uffff", side="left")
+            return np.arange(start, stop)
+        ids = self.terms.get_indexer([token])
+        return ids[ids >= 0]
+
+    def search(
+        self,
+        query: str,
+        mode: str = "all",
+        fields: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Responses matching the query terms
+
+        Args:
+            query: Whitespace-separated terms; "term*" matches a prefix
+            mode: "all" to require every term, "any" for at least one
+            fields: Only search these fields
+
+        Returns:
+            DataFrame of row, field and hits (occurrences of the query terms),
+            most hits first
+        """
+        query_terms = [
+            part
+            for token in query.split()
+            for part in ([token] if token.endswith("*") else self.tokenize(token))
+        ]
+        n_docs = len(self)
+        matched = (
+            np.zeros(n_docs, dtype=bool)
+            if mode == "any"
+            else np.ones(n_docs, dtype=bool)
+        )
+        hits = np.zeros(n_docs, dtype=np.int64)
+        for token in query_terms:
+            ids = self._term_ids(token)
+            term_hits = np.asarray(self.postings[:, ids].sum(axis=1)).ravel()
+            hits += term_hits
+            matched = (
+                (matched | (term_hits > 0))
+                if mode == "any"
+                else (matched & (term_hits > 0))
+            )
+        if not query_terms:
+            matched[:] = False
+
+        field_codes, field_names = self.groups["field"]
+        if fields is not None:
+            matched &= np.isin(field_codes, field_names.get_indexer(fields))
+        docs = np.flatnonzero(matched)
+        order = docs[np.argsort(-hits[docs], kind="stable")]
+        return pd.DataFrame(
+            {
+                "row": self.rows[order],
+                "field": field_names[field_codes[order]],
+                "hits": hits[order],
+            }
+        )
+
+    def term_frequencies(
+        self,
+        by: Optional[str] = None,
+        top: Optional[int] = None,
+        stopwords: FrozenSet[str] = STOPWORDS,
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """
+        Term counts overall or per group
+
+        Args:
+            by: None for overall counts, or "field", "section" or a grouping
+                column indexed with the data (e.g. "dataset")
+            top: Keep only the most frequent terms
+            stopwords: Terms to leave out
+
+        Returns:
+            Series of counts by term, or a term x group DataFrame when by is
+            given; most frequent terms first
+        """
+        keep = ~self.terms.isin(stopwords)
+        if by is None:
+            totals = np.asarray(self.counts.sum(axis=0)).ravel()
+            frequencies = pd.Series(totals, index=self.terms, name="count")[keep]
+            frequencies = frequencies[frequencies > 0].sort_values(
+                ascending=False, kind="stable"
+            )
+            return frequencies if top is None else frequencies.head(top)
+
+        codes, labels = self.groups[by]
+        membership = sparse.csr_matrix(
+            (np.ones(len(codes), dtype=np.int64), (codes, np.arange(len(codes)))),
+            shape=(len(labels), len(codes)),
+        )
+        table = pd.DataFrame(
+            (membership @ self.counts).toarray().T, index=self.terms, columns=labels
+        )[keep]
+        totals = table.sum(axis=1)
+        table = table[totals > 0].iloc[
+            np.argsort(-totals[totals > 0].to_numpy(), kind="stable")
+        ]
+        return table if top is None else table.head(top)
+
+    def save(self, path: Union[str, Path], key: Optional[str] = None):
+        """Pickle the index, preceded by key so stale files can be skipped"""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(
+        cls, path: Union[str, Path], key: Optional[str] = None
+    ) -> Optional["TextIndex"]:
+        """A saved index, or None if it is missing or was saved under another key"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                if pickle.load(f) != key:
+                    return None
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read text index {path}: {e}")
+            return None
+
+
+class ColumnIndex:
+    """
+    Lookup tables from tokens, applications, field types and sections to
+    column positions, built once per set of columns
+
+    Substring queries are answered with one scan and memoized, so repeated
+    report code pays for each pattern only once.
+    """
+
+    TOKEN_SEPARATORS = re.compile(r"[._]")
+    APP_COLUMN = re.compile(r"(?:^|\.)exp_app_(\w+)$")
+
+    def __init__(self, columns: pd.Index, schema: Dict[str, FieldSchema]):
+        self.columns = columns
+        self.positions: Dict[str, int] = {col: i for i, col in enumerate(columns)}
+        self._lower = [col.lower() for col in columns]
+
+        self.tokens: Dict[str, List[int]] = defaultdict(list)
+        self.field_types: Dict[str, List[int]] = defaultdict(list)
+        self.sections: Dict[str, List[int]] = defaultdict(list)
+        derived_apps = []
+        for i, col in enumerate(columns):
+            for token in dict.fromkeys(self.TOKEN_SEPARATORS.split(self._lower[i])):
+                if token:
+                    self.tokens[token].append(i)
+            field_schema = schema.get(col)
+            if field_schema is not None:
+                self.field_types[field_schema.field_type].append(i)
+                if field_schema.section:
+                    self.sections[field_schema.section].append(i)
+            match = self.APP_COLUMN.search(self._lower[i])
+            if match:
+                derived_apps.append(match.group(1))
+
+        self.applications: List[str] = list(
+            dict.fromkeys(derived_apps) or DEFAULT_APPLICATIONS
+        )
+        self._memo: Dict[tuple, List[str]] = {}
+        self.app_columns: Dict[str, List[str]] = {
+            app: self.contains(app) for app in self.applications
+        }
+
+    def names(self, positions: List[int]) -> List[str]:
+        return [self.columns[i] for i in positions]
+
+    def contains(
+        self,
+        substring: str,
+        exclude: Optional[str] = None,
+        case_sensitive: bool = False,
+    ) -> List[str]:
+        """Columns whose name contains substring (and not exclude), in column order"""
+        key = (substring, exclude, case_sensitive)
+        if key not in self._memo:
+            names = self.columns if case_sensitive else self._lower
+            if not case_sensitive:
+                substring = substring.lower()
+                exclude = exclude.lower() if exclude else exclude
+            self._memo[key] = [
+                self.columns[i]
+                for i, name in enumerate(names)
+                if substring in name and not (exclude and exclude in name)
+            ]
+        return self._memo[key]
+
+    def with_token(self, token: str) -> List[str]:
+        """Columns with token as a whole dot/underscore-separated part"""
+        return self.names(self.tokens.get(token.lower(), []))
+
+    def of_type(self, field_type: str) -> List[str]:
+        return self.names(self.field_types.get(field_type, []))
+
+    def in_section(self, section: str) -> List[str]:
+        return self.names(self.sections.get(section, []))
+
+
+class DataProfile:
+    """
+    Running per-column statistics that stand in for the full DataFrame
+
+    Tracks the row count, completion counts, value distributions for
+    choice fields, numeric moments and datatable sizes. Statistics are
+    updated one chunk at a time so summaries can be produced without
+    holding all rows in memory.
+    """
+
+    # Distributions are dropped for columns with more distinct values
+    MAX_DISTINCT_VALUES = 1000
+
+    DISTRIBUTION_TYPES = {"radio", "select", "checkbox", "unknown"}
+
+    def __init__(self, schema: Dict[str, FieldSchema]):
+        self.schema = schema
+        self.columns: pd.Index = pd.Index([])
+        self.n_rows = 0
+        self.non_null: Dict[str, int] = defaultdict(int)
+        self.value_counts: Dict[str, Counter] = {}
+        self.moments: Dict[str, Dict[str, float]] = {}
+        self.datatables: Dict[str, Dict[str, Any]] = {}
+        self.high_cardinality: set = set()
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        schema: Dict[str, FieldSchema],
+        multi_choice: Optional[Dict[str, "MultiChoiceMatrix"]] = None,
+    ) -> "DataProfile":
+        """
+        Profile a fully loaded frame in one pass per field type
+
+        Completion counts come from a single frame-wide reduction, numeric
+        moments from one aggregation over all number columns, and value
+        distributions from one bincount over all categorical columns plus
+        one grouped count over the remaining choice columns.
+        """
+        profile = cls(schema)
+        profile.columns = df.columns
+        profile.n_rows = len(df)
+        profile.non_null.update(df.notna().sum().astype(int).to_dict())
+
+        by_type = defaultdict(list)
+        for col in df.columns:
+            if col in schema:
+                by_type[schema[col].field_type].append(col)
+
+        numbers = by_type.get("number", [])
+        if numbers:
+            stats = df[numbers].agg(["count", "mean", "var", "min", "max"])
+            for col in numbers:
+                count = int(stats.at["count", col])
+                if count == 0:
+                    continue
+                variance = stats.at["var", col]
+                profile.moments[col] = {
+                    "count": count,
+                    "mean": stats.at["mean", col],
+                    "m2": variance * (count - 1) if count > 1 else 0.0,
+                    "min": stats.at["min", col],
+                    "max": stats.at["max", col],
+                }
+            profile._count_frame(df[numbers])
+
+        multi_choice = multi_choice or {}
+        choice_cols = []
+        for field_type in cls.DISTRIBUTION_TYPES:
+            for col in by_type.get(field_type, []):
+                field_schema = schema[col]
+                if field_type == "checkbox" and field_schema.multiple:
+                    if col in multi_choice:
+                        counts = multi_choice[col].option_counts()
+                    else:
+                        counts = _count_values(df[col], field_schema)
+                    profile._update_distribution(col, counts)
+                else:
+                    choice_cols.append(col)
+        if choice_cols:
+            profile._count_frame(df[choice_cols])
+
+        return profile
+
+    def _count_frame(self, frame: pd.DataFrame):
+        """Value distributions for every column of frame at once"""
+        categorical = [
+            col
+            for col in frame.columns
+            if isinstance(frame[col].dtype, pd.CategoricalDtype)
+        ]
+        if categorical:
+            # Offset each column's codes so one bincount covers all of them
+            sizes = np.array([len(frame[col].cat.categories) for col in categorical])
+            offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+            codes = np.column_stack(
+                [frame[col].cat.codes.to_numpy() for col in categorical]
+            )
+            counts = np.bincount(
+                (codes + offsets)[codes >= 0], minlength=int(sizes.sum())
+            )
+            for col, offset, size in zip(categorical, offsets, sizes):
+                col_counts = counts[offset : offset + size]
+                observed = np.flatnonzero(col_counts)
+                self._merge_counts(
+                    col,
+                    frame[col].cat.categories[observed],
+                    col_counts[observed].tolist(),
+                )
+
+        others = [col for col in frame.columns if col not in categorical]
+        if others:
+            stacked = frame[others].melt(var_name="column", value_name="value")
+            stacked = stacked[stacked["value"].notna()]
+            grouped = stacked.groupby(["column", "value"], sort=False).size()
+            for col, col_counts in grouped.groupby(level="column", sort=False):
+                self._update_distribution(col, col_counts.droplevel("column"))
+
+    def update(self, chunk: pd.DataFrame):
+        """Fold a converted chunk of data rows into the running statistics"""
+        if len(self.columns) == 0:
+            self.columns = chunk.columns
+        self.n_rows += len(chunk)
+
+        for col, count in chunk.notna().sum().items():
+            self.non_null[col] += int(count)
+
+        for col in chunk.columns:
+            field_schema = self.schema.get(col)
+            if field_schema is None:
+                continue
+            if field_schema.field_type == "number":
+                self._update_moments(col, chunk[col])
+                self._update_distribution(col, chunk[col].value_counts())
+            elif field_schema.field_type == "datatable":
+                self._update_datatable(col, chunk[col])
+            elif field_schema.field_type in self.DISTRIBUTION_TYPES:
+                self._update_distribution(col, _count_values(chunk[col], field_schema))
+
+    def _update_distribution(self, col: str, counts: pd.Series):
+        self._merge_counts(col, counts.index, counts.to_numpy().tolist())
+
+    def _merge_counts(self, col: str, values, counts: List[int]):
+        if col in self.high_cardinality:
+            return
+        counter = self.value_counts.setdefault(col, Counter())
+        counter.update(dict(zip(values, counts)))
+        if len(counter) > self.MAX_DISTINCT_VALUES:
+            logger.warning(
+                f"Column '{col}' has more than {self.MAX_DISTINCT_VALUES} distinct values, "
+                "dropping its distribution"
+            )
+            self.high_cardinality.add(col)
+            del self.value_counts[col]
+
+    def _update_moments(self, col: str, series: pd.Series):
+        values = series.dropna().to_numpy(dtype=float)
+        if len(values) == 0:
+            return
+
+        mean = values.mean()
+        self._merge_moments(
+            col,
+            {
+                "count": len(values),
+                "mean": mean,
+                "m2": ((values - mean) ** 2).sum(),
+                "min": values.min(),
+                "max": values.max(),
+            },
+        )
+
+    def _merge_moments(self, col: str, other: Dict[str, float]):
+        # Merge chunk moments with Chan's parallel variance update
+        moments = self.moments.setdefault(
+            col, {"count": 0, "mean": 0.0, "m2": 0.0, "min": np.inf, "max": -np.inf}
+        )
+        n_a, n_b = moments["count"], other["count"]
+        delta = other["mean"] - moments["mean"]
+        total = n_a + n_b
+
+        moments["mean"] += delta * n_b / total
+        moments["m2"] += other["m2"] + delta**2 * n_a * n_b / total
+        moments["count"] = total
+        moments["min"] = min(moments["min"], other["min"])
+        moments["max"] = max(moments["max"], other["max"])
+
+    def _remove_moments(self, col: str, other: Dict[str, float]) -> bool:
+        """Take a subset's moments out; False if min/max could not be restored"""
+        moments = self.moments.get(col)
+        if moments is None:
+            return True
+        total, n_b = moments["count"], other["count"]
+        n_a = total - n_b
+        if n_a <= 0:
+            del self.moments[col]
+            return True
+
+        # Chan's update solved for the remaining part
+        mean_a = (moments["mean"] * total - other["mean"] * n_b) / n_a
+        delta = other["mean"] - mean_a
+        moments["m2"] = max(
+            moments["m2"] - other["m2"] - delta**2 * n_a * n_b / total, 0.0
+        )
+        moments["mean"] = mean_a
+        moments["count"] = n_a
+
+        if other["min"] > moments["min"] and other["max"] < moments["max"]:
+            return True
+        counter = self.value_counts.get(col)
+        if not counter:
+            return False
+        moments["min"] = float(min(counter))
+        moments["max"] = float(max(counter))
+        return True
+
+    def merge(self, other: "DataProfile", sign: int = 1) -> List[str]:
+        """
+        Add (sign=1) or remove (sign=-1) the rows profiled by another profile
 
-        return schema_obj
+        Lets a profile follow inserted, changed and deleted rows without
+        profiling the unchanged ones again. Number columns are returned when
+        rows holding their minimum or maximum were removed and no value
+        distribution is kept to find the new one; the caller must recompute
+        those columns' moments.
+        """
+        self.n_rows += sign * other.n_rows
+        for col, count in other.non_null.items():
+            self.non_null[col] += sign * count
+
+        for col in other.high_cardinality - self.high_cardinality:
+            self.high_cardinality.add(col)
+            self.value_counts.pop(col, None)
+        for col, counter in other.value_counts.items():
+            if sign > 0:
+                self._merge_counts(col, list(counter), list(counter.values()))
+            elif col in self.value_counts:
+                own = self.value_counts[col]
+                own.subtract(counter)
+                for value in [value for value, count in own.items() if count <= 0]:
+                    del own[value]
+
+        stale = []
+        for col, moments in other.moments.items():
+            if sign > 0:
+                self._merge_moments(col, moments)
+            elif not self._remove_moments(col, moments):
+                stale.append(col)
+
+        for col, stats in other.datatables.items():
+            own = self.datatables.setdefault(
+                col, {"total_entries": 0, "total_rows": 0, "columns": stats["columns"]}
+            )
+            own["total_entries"] += sign * stats["total_entries"]
+            own["total_rows"] += sign * stats["total_rows"]
+
+        return stale
+
+    def _update_datatable(self, col: str, series: pd.Series):
+        stats = self.datatables.setdefault(
+            col, {"total_entries": 0, "total_rows": 0, "columns": None}
+        )
+        for dt in series.dropna():
+            if isinstance(dt, dict) and "rows" in dt:
+                stats["total_entries"] += 1
+                stats["total_rows"] += len(dt.get("rows", []))
+                if stats["columns"] is None and dt.get("columns"):
+                    stats["columns"] = dt["columns"]
+
+    def get_value_counts(self, col: str) -> pd.Series:
+        """Value distribution for a column, most common first"""
+        counter = self.value_counts.get(col)
+        if not counter:
+            return pd.Series(dtype=int, name="count")
+        counts = pd.Series(counter, name="count")
+        field_schema = self.schema.get(col)
+        if field_schema is not None and field_schema.options:
+            # Break ties in schema option order, whatever order chunks arrived in
+            order = {option: i for i, option in enumerate(field_schema.options)}
+            counts = counts.iloc[
+                np.argsort(
+                    [order.get(v, len(order)) for v in counts.index], kind="stable"
+                )
+            ]
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def get_median(self, col: str) -> float:
+        """Exact median from a numeric column's value distribution"""
+        counts = self.get_value_counts(col)
+        if len(counts) == 0:
+            return np.nan
+        counts = counts.sort_index()
+        cumulative = counts.cumsum().to_numpy()
+        total = cumulative[-1]
+        values = counts.index.to_numpy(dtype=float)
+        lower = values[np.searchsorted(cumulative, (total + 1) // 2)]
+        upper = values[np.searchsorted(cumulative, total // 2 + 1)]
+        return (lower + upper) / 2
+
+    def field_summary(self, col: str) -> Dict[str, Any]:
+        """
+        Per-field summary in the same shape as get_section_summary
+
+        Columns past MAX_DISTINCT_VALUES have no distribution here: their
+        value_distribution is empty, most_common is None and median is NaN.
+        """
+        field_schema = self.schema[col]
+        non_null = self.non_null.get(col, 0)
+        col_summary = {
+            "field_type": field_schema.field_type,
+            "non_null_count": non_null,
+            "null_count": self.n_rows - non_null,
+            "completion_rate": non_null / self.n_rows if self.n_rows else np.nan,
+        }
+
+        if field_schema.field_type in ["radio", "select"]:
+            value_counts = self.get_value_counts(col)
+            col_summary["value_distribution"] = value_counts.to_dict()
+            col_summary["most_common"] = (
+                value_counts.index[0] if len(value_counts) > 0 else None
+            )
+
+        elif field_schema.field_type == "checkbox" and field_schema.multiple:
+            col_summary["value_distribution"] = self.get_value_counts(col).to_dict()
+
+        elif field_schema.field_type == "number":
+            moments = self.moments.get(col)
+            count = moments["count"] if moments else 0
+            col_summary["mean"] = moments["mean"] if count else np.nan
+            col_summary["std"] = (
+                np.sqrt(moments["m2"] / (count - 1)) if count > 1 else np.nan
+            )
+            col_summary["min"] = moments["min"] if count else np.nan
+            col_summary["max"] = moments["max"] if count else np.nan
+            col_summary["median"] = (
+                self.get_median(col) if col not in self.high_cardinality else np.nan
+            )
+
+        return col_summary
+
+    def datatable_summary(self, col: str) -> Dict[str, Any]:
+        """Datatable summary in the same shape as the full-frame summary"""
+        stats = self.datatables.get(col)
+        summary = {"total_entries": 0, "avg_rows_per_entry": 0, "column_summaries": {}}
+        if not stats or stats["total_entries"] == 0:
+            return summary
+
+        summary["total_entries"] = stats["total_entries"]
+        summary["avg_rows_per_entry"] = stats["total_rows"] / stats["total_entries"]
+        for col_def in stats["columns"] or []:
+            summary["column_summaries"][col_def.get("id", "")] = {
+                "type": col_def.get("type", ""),
+                "label": col_def.get("label", ""),
+            }
+        return summary
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _SummaryCache:
+    """
+    Results of summary methods for one data version
+
+    Section-level results are evicted least recently used once maxsize is
+    reached; whole-report results (one per method) are always kept.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._bounded: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._reports: Dict[tuple, Any] = {}
+
+    def clear(self, version: int):
+        self.version = version
+        self._bounded.clear()
+        self._reports.clear()
+
+    def get(self, key: tuple, bounded: bool, compute) -> Any:
+        store = self._bounded if bounded else self._reports
+        if key in store:
+            self.hits += 1
+            if bounded:
+                self._bounded.move_to_end(key)
+            return store[key]
+
+        self.misses += 1
+        result = compute()
+        store[key] = result
+        if bounded and len(self._bounded) > self.maxsize:
+            self._bounded.popitem(last=False)
+        return result
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.maxsize,
+            len(self._bounded) + len(self._reports),
+        )
+
+
+def _copy_summary(value: Any) -> Any:
+    """
+    Copy the containers of a cached summary that callers could modify
+
+    Dicts, lists, sets, arrays and pandas objects are copied; anything else
+    (scalars, read-only results such as ContingencyTables) is shared.
+    """
+    if isinstance(value, dict):
+        copied = copy.copy(value)
+        for key, item in value.items():
+            copied[key] = _copy_summary(item)
+        return copied
+    if isinstance(value, list):
+        return [_copy_summary(item) for item in value]
+    if type(value) is tuple:
+        return tuple(_copy_summary(item) for item in value)
+    if isinstance(value, (set, np.ndarray, pd.DataFrame, pd.Series)):
+        return value.copy()
+    return value
+
+
+def _memoized_summary(bounded: bool = False):
+    """
+    Cache a processor method's result until the processor's data changes
+
+    Callers get copies of the result's mutable containers, so modifying a
+    returned summary never alters the cached one. Calls with unhashable
+    arguments are not cached.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return method(self, *args, **kwargs)
+
+            cache = self._summary_cache
+            if cache.version != self._data_version:
+                cache.clear(self._data_version)
+            result = cache.get(key, bounded, lambda: method(self, *args, **kwargs))
+            return _copy_summary(result)
+
+        return wrapper
+
+    return decorator
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Timing of one processing stage, or of one slow column within a stage"""
+
+    stage: str
+    seconds: float = 0.0
+    rows: Optional[int] = None
+    columns: Optional[int] = None
+    peak_mb: Optional[float] = None
+    column: Optional[str] = None
+
+
+class ProcessorStats:
+    """
+    Wall time, rows, columns and peak memory of processing stages
+
+    Created by BaseJCC2Processor.enable_stats; while a processor's ``stats``
+    is None, no timing code runs. Per-column records are only kept for
+    columns that took at least column_threshold seconds. Peak memory comes
+    from tracemalloc, which slows processing down noticeably, so it is
+    opt-in; a stage's peak is measured relative to memory in use when the
+    stage started and includes its nested stages.
+    """
+
+    def __init__(
+        self,
+        track_memory: bool = False,
+        log_records: bool = False,
+        column_threshold: float = 0.05,
+    ):
+        self.track_memory = track_memory
+        self.log_records = log_records
+        self.column_threshold = column_threshold
+        self.records: List[StageStats] = []
+        # [traced memory at start, highest peak seen] for each open stage
+        self._open_stages: List[List[int]] = []
+        self._started_tracing = False
+
+    @contextmanager
+    def stage(
+        self,
+        name: str,
+        rows: Optional[int] = None,
+        columns: Optional[int] = None,
+        column: Optional[str] = None,
+    ):
+        """
+        Time the enclosed block as one stage
+
+        Yields the StageStats record so rows and columns can be filled in
+        once they are known.
+        """
+        record = StageStats(name, rows=rows, columns=columns, column=column)
+        if self.track_memory:
+            self._start_memory()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            if self.track_memory:
+                record.peak_mb = round(self._stop_memory() / 1e6, 3)
+            if column is None or record.seconds >= self.column_threshold:
+                self.records.append(record)
+                if self.log_records:
+                    fields = asdict(record)
+                    stats_logger.info(json.dumps(fields), extra={"jcc2_stats": fields})
+
+    def _start_memory(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        current, peak = tracemalloc.get_traced_memory()
+        if self._open_stages:
+            # Keep the enclosing stage's peak before resetting it for this one
+            outer = self._open_stages[-1]
+            outer[1] = max(outer[1], peak)
+        tracemalloc.reset_peak()
+        self._open_stages.append([current, current])
+
+    def _stop_memory(self) -> int:
+        _, peak = tracemalloc.get_traced_memory()
+        start, inner_peak = self._open_stages.pop()
+        peak = max(peak, inner_peak)
+        if self._open_stages:
+            outer = self._open_stages[-1]
+            outer[1] = max(outer[1], peak)
+        if not self._open_stages and self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        elif tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        return peak - start
+
+    def to_frame(self) -> pd.DataFrame:
+        """All records in the order the stages finished"""
+        return pd.DataFrame(
+            [asdict(record) for record in self.records],
+            columns=list(StageStats.__dataclass_fields__),
+        )
+
+    def summary(self) -> pd.DataFrame:
+        """Stage totals: calls, seconds and rows summed, highest peak memory"""
+        frame = self.to_frame()
+        frame = frame[frame["column"].isna()]
+        return frame.groupby("stage", sort=False).agg(
+            calls=("seconds", "size"),
+            seconds=("seconds", "sum"),
+            rows=("rows", "sum"),
+            peak_mb=("peak_mb", "max"),
+        )
+
+    def slow_columns(self) -> pd.DataFrame:
+        """Per-column records, slowest first"""
+        frame = self.to_frame()
+        frame = frame[frame["column"].notna()]
+        return frame.sort_values("seconds", ascending=False, ignore_index=True)
+
+    def clear(self):
+        self.records = []
 
 
 class BaseJCC2Processor(ABC):
     """Base processor for JCC2 data formats"""
 
+    # Section summaries kept per data version before the oldest is evicted
+    SECTION_CACHE_SIZE = 128
+
+    # System columns identifying a response and when it last changed
+    ID_COLUMN = "id"
+    UPDATED_COLUMN = "updated_at"
+
+    # Free-text feedback fields scored by analyze_sentiment
+    FEEDBACK_FIELD_TYPES = ("textarea",)
+    # Polarity beyond which a response counts as positive or negative
+    SENTIMENT_THRESHOLD = 0.1
+
     def __init__(self, csv_path: str):
         self.csv_path = Path(csv_path)
-        self.df: Optional[pd.DataFrame] = None
+        self._data_version = 0
+        self._summary_cache = _SummaryCache(self.SECTION_CACHE_SIZE)
+        self._df: Optional[pd.DataFrame] = None
         self.schema: Dict[str, FieldSchema] = {}
+        self.schema_registry = SchemaRegistry()
         self.sections: Dict[str, List[str]] = defaultdict(list)
         self.system_columns: List[str] = []
         self.validation_errors: List[Dict[str, Any]] = []
+        self.validation_table: Optional[pd.DataFrame] = None
+        self._validation_capped = False
+        # Detected format per temporal type, reused by every later conversion
+        self._temporal_formats: Dict[str, str] = {}
         self.format_type: DataFormat = DataFormat.UNKNOWN
         self.datatable_fields: Dict[str, Any] = {}
+        self.profile: Optional[DataProfile] = None
+        self.off_schema_values: Dict[str, Dict[Any, int]] = {}
+        self.multi_choice: Dict[str, MultiChoiceMatrix] = {}
+        # Datatable columns still holding raw JSON, and decoded payloads
+        self._pending_datatables: set = set()
+        self._datatable_cache: Dict[str, Any] = {}
+        self._column_index: Optional[ColumnIndex] = None
+        self._rating_cubes: Dict[tuple, RatingCube] = {}
+        self._text_indexes: Dict[tuple, TextIndex] = {}
+        self._frame_profile: Optional[DataProfile] = None
+        self._frame_profile_version = -1
+        # Header columns not read yet when the file was opened lazily
+        self._unloaded: List[str] = []
+        self._header_columns = pd.Index([])
+        self.stats: Optional[ProcessorStats] = None
+
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        return self._df
+
+    @df.setter
+    def df(self, value: Optional[pd.DataFrame]):
+        self._df = value
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """
+        Start a new data version so cached summaries are recomputed
+
+        Assigning ``df`` does this automatically; call it after modifying
+        ``df`` in place.
+        """
+        self._data_version += 1
+        self._rating_cubes = {}
+        self._text_indexes = {}
+
+    def cache_info(self) -> CacheInfo:
+        """Hit and miss counts of the summary cache"""
+        return self._summary_cache.info()
+
+    def enable_stats(
+        self,
+        track_memory: bool = False,
+        log_records: bool = False,
+        column_threshold: float = 0.05,
+    ) -> ProcessorStats:
+        """
+        Record timings of loading, conversion, decoding, validation and export
 
-    def load_data(self) -> pd.DataFrame:
-        """Load CSV data and parse schema"""
+        Args:
+            track_memory: Also record each stage's peak memory (tracemalloc)
+            log_records: Emit each record as JSON on the
+                ``jcc2_data_processor.stats`` logger
+            column_threshold: Seconds a single column must take to get its
+                own record
+
+        Returns:
+            The ProcessorStats now stored on ``self.stats``; set
+            ``self.stats = None`` to turn recording off again
+        """
+        self.stats = ProcessorStats(track_memory, log_records, column_threshold)
+        return self.stats
+
+    def _stage(self, name: str, **details):
+        """Stats context for one stage, a no-op while stats are disabled"""
+        if self.stats is None:
+            # A fresh throwaway record, so callers setting rows/columns on it
+            # never see values left by another stage or processor
+            return nullcontext(StageStats(name))
+        return self.stats.stage(name, **details)
+
+    def load_data(
+        self,
+        chunksize: Optional[int] = None,
+        use_cache: bool = False,
+        lazy: bool = False,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load CSV data and parse schema
+
+        Args:
+            chunksize: Stream data rows in chunks of this size instead of
+                loading the full frame. Each chunk is converted and folded
+                into ``self.profile``, so section and format-specific
+                summaries can be produced while ``self.df`` stays None.
+                Columns with more than DataProfile.MAX_DISTINCT_VALUES
+                distinct values keep no distribution, so their summaries
+                have no value_distribution, most_common or median.
+            use_cache: Reuse (or create) the parsed-state cache for this CSV
+                in the per-user cache_dir(). The cache is keyed on the
+                file's content hash and PROCESSOR_VERSION, so edits to
+                either rebuild it. Caches that other users can write to are
+                ignored, since loading one unpickles it.
+            lazy: Only read the header and schema row. Columns are read and
+                converted the first time something needs them (a section
+                summary, get_section, SUS/NPS, ...); whole-file reports load
+                everything that is still missing. A cache hit still loads
+                the full cached frame, and lazy opens never write the cache.
+
+        Returns:
+            The converted DataFrame, or None in streaming and lazy mode
+        """
+        with self._stage("load_data") as record:
+            df = self._load_data(chunksize, use_cache, lazy)
+            record.rows = self._row_count()
+            record.columns = len(self._data_columns())
+        return df
+
+    def _load_data(
+        self, chunksize: Optional[int], use_cache: bool, lazy: bool
+    ) -> Optional[pd.DataFrame]:
+        """Body of load_data, timed as one stage"""
         logger.info(f"Loading data from {self.csv_path}")
 
-        # Read the CSV file
-        raw_df = pd.read_csv(self.csv_path, low_memory=False)
+        if use_cache and chunksize is None:
+            cache_key = self._cache_key()
+            with self._stage("read_cache"):
+                found = self._read_cache(cache_key)
+            if found:
+                return self.df
+
+        with self._stage("parse_schema") as record:
+            columns = self._parse_schema()
+            record.columns = len(columns)
+
+        if chunksize is not None:
+            return self._stream_data(chunksize)
+
+        if lazy:
+            self.df = None
+            self.profile = None
+            self._unloaded = columns
+            self._header_columns = pd.Index(columns)
+            logger.info(
+                f"Opened {len(columns)} columns in {len(self.sections)} sections lazily"
+            )
+            return None
+
+        # Read data rows only; the schema row is skipped rather than copied out
+        with self._stage("read_csv") as record:
+            self.df = self._read_rows()
+            record.rows, record.columns = self.df.shape
+        self.df.index = pd.RangeIndex(1, len(self.df) + 1)
+        self.profile = None
+
+        # Convert data types based on schema
+        self._convert_data_types()
+        self._build_multi_choice()
+
+        logger.info(f"Loaded {len(self.df)} data rows with {len(columns)} columns")
+        logger.info(
+            f"Found {len(self.sections)} sections and {len(self.system_columns)} system columns"
+        )
+
+        if use_cache:
+            with self._stage("write_cache"):
+                self._write_cache(cache_key)
+
+        return self.df
 
-        # Extract header and schema rows
-        columns = raw_df.columns.tolist()
-        schema_row = raw_df.iloc[0].tolist() if len(raw_df) > 0 else []
+    @property
+    def cache_path(self) -> Path:
+        """Location of the parsed-state cache for this CSV in cache_dir()"""
+        path_hash = hashlib.sha256(str(self.csv_path.resolve()).encode()).hexdigest()
+        return cache_dir() / f"{self.csv_path.stem}-{path_hash[:16]}{CACHE_SUFFIX}"
+
+    def _cache_key(self) -> str:
+        """Cache key from the CSV content hash, processor class and version"""
+        digest = hashlib.sha256()
+        with open(self.csv_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return f"{type(self).__name__}:{PROCESSOR_VERSION}:{digest.hexdigest()}"
+
+    def _read_cache(self, cache_key: str) -> bool:
+        """Restore parsed state from the cache if it matches cache_key"""
+        if not self.cache_path.exists():
+            return False
+        if not (_is_private(self.cache_path.parent) and _is_private(self.cache_path)):
+            logger.warning(
+                f"Ignoring cache {self.cache_path}: it can be modified by other users"
+            )
+            return False
+
+        try:
+            with open(self.cache_path, "rb") as f:
+                # The key is stored ahead of the payload so stale caches are
+                # rejected without unpickling the frame
+                if pickle.load(f) != cache_key:
+                    logger.info(f"Cache {self.cache_path} is stale, reloading CSV")
+                    return False
+                state = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read cache {self.cache_path}: {e}")
+            return False
+
+        self.df = state["df"]
+        self.schema = state["schema"]
+        self.schema_registry = state["schema_registry"]
+        self.sections = state["sections"]
+        self.system_columns = state["system_columns"]
+        self.datatable_fields = state["datatable_fields"]
+        self.off_schema_values = state["off_schema_values"]
+        self.multi_choice = state["multi_choice"]
+        self._pending_datatables = state["pending_datatables"]
+        self._unloaded = []
+        self.profile = None
+
+        logger.info(f"Loaded {len(self.df)} data rows from cache {self.cache_path}")
+        return True
+
+    def _write_cache(self, cache_key: str):
+        """Write parsed state to the cache, replacing any previous one"""
+        state = {
+            "df": self.df,
+            "schema": self.schema,
+            "schema_registry": self.schema_registry,
+            "sections": self.sections,
+            "system_columns": self.system_columns,
+            "datatable_fields": self.datatable_fields,
+            "off_schema_values": self.off_schema_values,
+            "multi_choice": self.multi_choice,
+            "pending_datatables": self._pending_datatables,
+        }
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            self.cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _is_private(self.cache_path.parent):
+                logger.warning(
+                    f"Not writing cache {self.cache_path}: "
+                    f"{self.cache_path.parent} can be modified by other users"
+                )
+                return
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(cache_key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+            logger.info(f"Wrote cache {self.cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not write cache {self.cache_path}: {e}")
+
+    def _parse_schema(self) -> List[str]:
+        """Read the header and schema row and parse field schemas"""
+        header_df = pd.read_csv(self.csv_path, nrows=1, dtype=object)
+        columns = header_df.columns.tolist()
+        schema_row = header_df.iloc[0].tolist() if len(header_df) > 0 else []
+
+        self.schema = {}
+        self.sections = defaultdict(list)
+        self.system_columns = []
+        self.datatable_fields = {}
+        self.off_schema_values = {}
+        self.multi_choice = {}
+        self._pending_datatables = set()
+        self._unloaded = []
+        self._temporal_formats = {}
+        self.invalidate_cache()
 
         # Parse schema
         logger.info("Parsing field schemas")
         for col, schema_str in zip(columns, schema_row):
             try:
-                field_schema = FieldSchema.parse(col, str(schema_str))
+                field_schema = self.schema_registry.field(col, str(schema_str))
                 self.schema[col] = field_schema
 
                 # Organize by sections
@@ -149,139 +2532,1179 @@ class BaseJCC2Processor(ABC):
             except Exception as e:
                 logger.error(f"Error parsing schema for column '{col}': {e}")
 
-        # Extract actual data (skip schema row)
-        self.df = raw_df.iloc[1:].copy()
+        return columns
 
-        # Convert data types based on schema
-        self._convert_data_types()
+    def _ensure_loaded(self, columns: Optional[List[str]] = None):
+        """
+        Read and convert columns that a lazy open has not loaded yet
 
-        logger.info(f"Loaded {len(self.df)} data rows with {len(columns)} columns")
+        Args:
+            columns: Columns needed (default: all remaining columns)
+        """
+        if not self._unloaded:
+            return
+
+        if columns is None:
+            wanted = self._unloaded
+        else:
+            needed = set(columns)
+            wanted = [col for col in self._unloaded if col in needed]
+        if not wanted:
+            return
+
+        with self._stage("read_csv") as record:
+            frame = self._read_rows(usecols=wanted)
+            record.rows, record.columns = frame.shape
+        frame.index = pd.RangeIndex(1, len(frame) + 1)
+        frame = self._convert_data_types(frame)
+        self._pending_datatables.update(
+            col for col in frame.columns if col in self.datatable_fields
+        )
+        self._build_multi_choice(frame)
+
+        loaded = set(wanted)
+        self._unloaded = [col for col in self._unloaded if col not in loaded]
+        combined = frame if self._df is None else pd.concat([self._df, frame], axis=1)
+        if not self._unloaded:
+            # Fully loaded: same column order as a regular load
+            combined = combined[[col for col in self.schema if col in combined.columns]]
+
+        # Adding columns leaves results for already loaded columns valid, so
+        # the data version is kept; only whole-frame structures are dropped
+        self._df = combined
+        self._frame_profile_version = -1
+        self._rating_cubes = {}
+        logger.info(f"Loaded {len(wanted)} columns, {len(self._unloaded)} still unread")
+
+    def _ensure_group_columns(self, group_by: Optional[GroupKey]):
+        """Load the columns named by a grouping key"""
+        if group_by is None:
+            return
+        keys = group_by if isinstance(group_by, list) else [group_by]
+        self._ensure_loaded([key for key in keys if isinstance(key, str)])
+
+    def get_section(self, section_name: str) -> pd.DataFrame:
+        """
+        Data for one section's columns, loading them first if needed
+
+        Args:
+            section_name: Section name (e.g. "overall_system_usability")
+
+        Returns:
+            DataFrame with the section's columns
+        """
+        columns = self.sections[section_name]
+        self._ensure_loaded(columns)
+        return self.df[columns]
+
+    def _read_rows(self, positions: Optional[np.ndarray] = None, **kwargs) -> Any:
+        """
+        Read data rows as strings, skipping the schema row
+
+        Args:
+            positions: Zero-based data row positions to read (default: all)
+        """
+        skiprows = [1]
+        if positions is not None:
+            # File records: header 0, schema row 1, data rows from 2
+            wanted = set((np.asarray(positions) + 2).tolist())
+            skiprows = lambda i: i != 0 and i not in wanted  # noqa: E731
+        return pd.read_csv(self.csv_path, skiprows=skiprows, dtype=object, **kwargs)
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the loaded data up to date with the CSV, reading only changed rows
+
+        Rows are matched on the ``id`` column and re-read when they are new
+        or their ``updated_at`` differs from the loaded value; removed ids
+        are dropped. Only re-read rows are converted and validated. The
+        column profile (completion counts, value distributions, numeric
+        moments), multiple-choice matrices and validation table are updated
+        by taking out the replaced rows and adding the re-read ones, so
+        summaries built on them (section summaries, NPS, task success
+        rates) do not need a full pass. The refreshed frame matches what
+        load_data() would produce.
+
+        Falls back to load_data() when nothing is loaded yet, the data was
+        streamed, the header or schema row changed, or ids are missing or
+        not unique.
+
+        Returns:
+            Counts of new, changed, removed and unchanged rows (every row
+            counts as new after a full load)
+        """
+        with self._stage("refresh") as record:
+            counts = self._refresh()
+            record.rows = counts["new"] + counts["changed"]
+            record.columns = len(self._data_columns())
+        logger.info(
+            f"Refreshed {self.csv_path}: {counts['new']} new, {counts['changed']} changed, "
+            f"{counts['removed']} removed, {counts['unchanged']} unchanged rows"
+        )
+        return counts
+
+    def _refresh(self) -> Dict[str, int]:
+        """Body of refresh, timed as one stage"""
+        self._ensure_loaded()
+        id_col, updated_col = self.ID_COLUMN, self.UPDATED_COLUMN
+        if self.df is None:
+            return self._reload("no rows are loaded")
+        if id_col not in self.df.columns or updated_col not in self.df.columns:
+            return self._reload(f"'{id_col}' and '{updated_col}' columns are required")
+        if self._schema_changed():
+            return self._reload("the header or schema row changed")
+
+        with self._stage("read_csv") as record:
+            keys = self._read_rows(usecols=[id_col, updated_col])
+            record.rows, record.columns = keys.shape
+        keys = self._convert_data_types(keys)
+        old = self.df
+        if keys[id_col].duplicated().any() or old[id_col].duplicated().any():
+            return self._reload(f"'{id_col}' values are not unique")
+
+        # Position of each file row in the loaded frame (-1 for new rows)
+        old_positions = pd.Index(old[id_col]).get_indexer(keys[id_col])
+        found = np.flatnonzero(old_positions >= 0)
+        old_updated = old[updated_col].to_numpy()[old_positions[found]]
+        new_updated = keys[updated_col].to_numpy()[found]
+        same = (old_updated == new_updated) | (
+            pd.isna(old_updated) & pd.isna(new_updated)
+        )
+        unchanged = np.zeros(len(keys), dtype=bool)
+        unchanged[found[same]] = True
+
+        kept = old_positions[unchanged]
+        reread = np.flatnonzero(~unchanged)
+        counts = {
+            "new": int((old_positions < 0).sum()),
+            "changed": int(len(found) - same.sum()),
+            "removed": int(len(old) - len(found)),
+            "unchanged": int(len(kept)),
+        }
+        if (
+            len(reread) == 0
+            and len(kept) == len(old)
+            and (kept == np.arange(len(old))).all()
+        ):
+            return counts
+
+        with self._stage("read_csv") as record:
+            delta = self._read_rows(positions=reread)
+            record.rows, record.columns = delta.shape
+        delta.index = pd.Index(reread + 1)
+        delta = self._convert_data_types(delta[old.columns])
+        for col in self.datatable_fields:
+            if col in delta.columns and col not in self._pending_datatables:
+                delta[col] = self._decode_datatables(delta[col])
+
+        # Kept rows move to their current file position; everything is
+        # stacked and put back in file order
+        kept_rows = old.iloc[kept]
+        kept_labels = np.flatnonzero(unchanged) + 1
+        order = np.argsort(np.concatenate([kept_labels, reread + 1]), kind="stable")
+        index = pd.RangeIndex(1, len(keys) + 1)
+        combined = pd.concat([kept_rows.set_axis(kept_labels), delta]).iloc[order]
+        combined.index = index
+
+        dropped = np.ones(len(old), dtype=bool)
+        dropped[kept] = False
+        dropped = old.iloc[np.flatnonzero(dropped)]
+        # Columns whose off-schema values were all replaced go back to the
+        # Categorical a fresh load would give them
+        for col in self._forget_off_schema(dropped):
+            combined[col] = self._to_categorical(combined[col], self.schema[col])
+        self._refresh_profile(dropped, delta, combined)
+        for col, matrix in self.multi_choice.items():
+            stacked = MultiChoiceMatrix.concat(
+                [
+                    matrix.take(kept),
+                    MultiChoiceMatrix.from_lists(delta[col], self.schema[col]),
+                ],
+                index,
+            )
+            self.multi_choice[col] = stacked.take(order)
+            self.multi_choice[col].index = index
+        self._refresh_validation(old.index[kept], kept_labels, delta)
+
+        profile_current = self._frame_profile_version == self._data_version
+        self._df = combined
+        self.invalidate_cache()
+        if profile_current:
+            self._frame_profile_version = self._data_version
+        return counts
+
+    def _forget_off_schema(self, dropped: pd.DataFrame) -> List[str]:
+        """
+        Take off-schema values of replaced rows out of off_schema_values
+
+        Returns:
+            Columns left without any off-schema values
+        """
+        cleared = []
+        for col, counts in list(self.off_schema_values.items()):
+            if col not in dropped.columns:
+                continue
+            series = dropped[col]
+            off_schema = series.notna() & ~series.isin(self.schema[col].option_set)
+            for value, count in series[off_schema].value_counts().items():
+                remaining = counts.get(value, 0) - int(count)
+                if remaining > 0:
+                    counts[value] = remaining
+                else:
+                    counts.pop(value, None)
+            if not counts:
+                del self.off_schema_values[col]
+                cleared.append(col)
+        return cleared
+
+    def _refresh_profile(
+        self, dropped: pd.DataFrame, delta: pd.DataFrame, combined: pd.DataFrame
+    ):
+        """Swap replaced rows for re-read ones in the whole-frame profile"""
+        if (
+            self._frame_profile is None
+            or self._frame_profile_version != self._data_version
+        ):
+            return
+        profile = self._frame_profile
+        with self._stage("profile", rows=len(dropped) + len(delta)):
+            stale = []
+            if len(dropped) > 0:
+                stale = profile.merge(
+                    DataProfile.from_frame(dropped, self.schema), sign=-1
+                )
+            profile.merge(DataProfile.from_frame(delta, self.schema))
+            if stale:
+                for col in stale:
+                    profile.moments.pop(col, None)
+                profile.moments.update(
+                    DataProfile.from_frame(combined[stale], self.schema).moments
+                )
+            profile.columns = combined.columns
+
+    def _refresh_validation(
+        self, kept_rows: pd.Index, kept_labels: np.ndarray, delta: pd.DataFrame
+    ):
+        """Keep errors of unchanged rows and validate the re-read ones"""
+        if self.validation_table is None:
+            return
+        if self._validation_capped:
+            # A capped table cannot be extended consistently
+            self.validation_table = None
+            self.validation_errors = []
+            return
+
+        table = self.validation_table
+        relabel = dict(zip(kept_rows, kept_labels))
+        keep = table["row"].isin(kept_rows).to_numpy()
+        kept_errors = table[keep]
+        kept_errors = kept_errors.assign(row=kept_errors["row"].map(relabel).to_numpy())
+        delta_errors, _ = self._validate_frame(delta)
+
+        merged = pd.concat([kept_errors, delta_errors], ignore_index=True)
+        order = np.lexsort(
+            (merged["rule"].cat.codes, merged["column"].cat.codes, merged["row"])
+        )
+        self.validation_table = merged.iloc[order].reset_index(drop=True)
+
+        if len(self.validation_errors) == len(table):
+            # Reuse the error dicts of unchanged rows
+            errors = list(compress(self.validation_errors, keep))
+            if (kept_rows != kept_labels).any():
+                errors = [
+                    (
+                        error
+                        if relabel[error["row"]] == error["row"]
+                        else {**error, "row": relabel[error["row"]]}
+                    )
+                    for error in errors
+                ]
+            errors += self._error_dicts(delta_errors)
+            self.validation_errors = [errors[i] for i in order]
+
+    def _schema_changed(self) -> bool:
+        """Whether the file's header or schema row differs from the parsed schema"""
+        header_df = pd.read_csv(self.csv_path, nrows=1, dtype=object)
+        if header_df.columns.tolist() != list(self.schema):
+            return True
+        schema_row = header_df.iloc[0].tolist() if len(header_df) > 0 else []
+        return any(
+            self.schema_registry.field(col, str(schema_str)) != self.schema[col]
+            for col, schema_str in zip(header_df.columns, schema_row)
+        )
+
+    def _reload(self, reason: str) -> Dict[str, int]:
+        """Full load_data() in place of an incremental refresh"""
+        logger.info(f"Reloading {self.csv_path} in full: {reason}")
+        revalidate = self.validation_table is not None and not self._validation_capped
+        self.load_data()
+        if revalidate:
+            self.validate_data()
+        else:
+            self.validation_table = None
+            self.validation_errors = []
+        return {"new": self._row_count(), "changed": 0, "removed": 0, "unchanged": 0}
+
+    def _stream_data(self, chunksize: int) -> None:
+        """Convert data rows chunk by chunk and accumulate a DataProfile"""
+        logger.info(f"Streaming data rows in chunks of {chunksize}")
+        self.df = None
+        self.profile = DataProfile(self.schema)
+
+        start = 1
+        reader = self._read_rows(chunksize=chunksize)
+        while True:
+            with self._stage("read_csv") as record:
+                chunk = next(reader, None)
+                if chunk is not None:
+                    record.rows, record.columns = chunk.shape
+            if chunk is None:
+                break
+            # Keep row labels identical to a full load (schema row is row 0)
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            chunk = self._convert_data_types(chunk)
+            with self._stage(
+                "decode_datatables",
+                rows=len(chunk),
+                columns=len(self.datatable_fields),
+            ):
+                for col_name in self.datatable_fields:
+                    chunk[col_name] = self._decode_datatables(chunk[col_name])
+            with self._stage("profile", rows=len(chunk), columns=len(chunk.columns)):
+                self.profile.update(chunk)
+
+        logger.info(
+            f"Streamed {self.profile.n_rows} data rows with {len(self.profile.columns)} columns"
+        )
         logger.info(
             f"Found {len(self.sections)} sections and {len(self.system_columns)} system columns"
         )
+        return None
+
+    def _convert_data_types(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Convert column data types based on schema definitions"""
+        if df is None:
+            df = self.df
+
+        with self._stage("convert_types", rows=len(df), columns=len(df.columns)):
+            temporal: Dict[str, List[str]] = defaultdict(list)
+            for col_name, field_schema in self.schema.items():
+                if col_name not in df.columns:
+                    continue
+                if field_schema.temporal_type:
+                    temporal[field_schema.temporal_type].append(col_name)
+                    continue
+                with self._stage("convert_types", rows=len(df), column=col_name):
+                    self._convert_column(df, col_name, field_schema)
+            for temporal_type, columns in temporal.items():
+                with self._stage(
+                    "convert_temporal", rows=len(df), columns=len(columns)
+                ):
+                    self._convert_temporal(df, columns, temporal_type)
+
+        return df
+
+    def _convert_temporal(
+        self, df: pd.DataFrame, columns: List[str], temporal_type: str
+    ):
+        """
+        Convert all date or datetime columns of df in place with one parse
+
+        The format is detected once per temporal type and reused for every
+        later chunk, refresh delta and column. Dates are kept as datetime64
+        normalized to midnight rather than Python date objects.
+        """
+        try:
+            n_rows = len(df)
+            values = df[columns].to_numpy(dtype=object).ravel(order="F")
+            parsed = self._parse_temporal(values, temporal_type)
+            if temporal_type == "date":
+                parsed = parsed.normalize()
+            for i, col_name in enumerate(columns):
+                df[col_name] = pd.Series(
+                    parsed[i * n_rows : (i + 1) * n_rows], index=df.index
+                )
+        except Exception as e:
+            logger.error(f"Error converting {temporal_type} columns {columns}: {e}")
+
+    def _parse_temporal(
+        self, values: np.ndarray, temporal_type: str
+    ) -> pd.DatetimeIndex:
+        """Parse raw values with the detected format, inferring only the misses"""
+        present = pd.notna(values)
+        fmt = self._temporal_formats.get(temporal_type)
+        if fmt is None:
+            sample = values[np.flatnonzero(present)[:TEMPORAL_SAMPLE_SIZE]]
+            if len(sample) == 0:
+                # Nothing to detect from yet; leave detection to a later batch
+                return pd.DatetimeIndex(
+                    np.full(len(values), np.datetime64("NaT", "ns"))
+                )
+            fmt = self._detect_temporal_format(sample)
+            self._temporal_formats[temporal_type] = fmt
+            logger.debug(f"Detected {temporal_type} format {fmt!r}")
+
+        parsed = _to_datetime(values, fmt)
+        missed = present & parsed.isna()
+        if fmt != "mixed" and missed.any():
+            # Values in another format than the sample fall back to inference
+            retry = _to_datetime(values[missed], "mixed")
+            if parsed.tz is None and retry.tz is not None:
+                retry = retry.tz_convert(None)
+            elif parsed.tz is not None and retry.tz is None:
+                retry = retry.tz_localize(parsed.tz)
+            result = parsed.to_series(index=pd.RangeIndex(len(parsed)))
+            result.iloc[np.flatnonzero(missed)] = retry
+            parsed = pd.DatetimeIndex(result)
+        return parsed
+
+    @staticmethod
+    def _detect_temporal_format(sample: np.ndarray) -> str:
+        """Candidate format parsing the most sample values, "mixed" if none do"""
+        best, best_count = "mixed", 0
+        for fmt in TEMPORAL_FORMATS:
+            count = int(_to_datetime(sample, fmt).notna().sum())
+            if count == len(sample):
+                return fmt
+            if count > best_count:
+                best, best_count = fmt, count
+        return best
+
+    def _convert_column(
+        self, df: pd.DataFrame, col_name: str, field_schema: FieldSchema
+    ):
+        """Convert one column of df in place"""
+        try:
+            if field_schema.field_type == "number":
+                df[col_name] = pd.to_numeric(df[col_name], errors="coerce")
+            elif (
+                field_schema.field_type in ["radio", "select"] and field_schema.options
+            ):
+                df[col_name] = self._to_categorical(df[col_name], field_schema)
+            elif field_schema.field_type == "identifier":
+                # Keep as string
+                df[col_name] = df[col_name].astype(str)
+            elif field_schema.field_type == "checkbox" and field_schema.multiple:
+                # Split multiple values
+                df[col_name] = df[col_name].apply(
+                    lambda x: x.split("; ") if pd.notna(x) and x else []
+                )
+            elif field_schema.field_type == "datatable":
+                # JSON content is decoded on first access, see get_datatable
+                self.datatable_fields[col_name] = field_schema
+                if df is self.df:
+                    self._pending_datatables.add(col_name)
+            elif field_schema.field_type == "unknown":
+                # Treat unknown fields as text
+                logger.warning(
+                    f"Unknown field type for column '{col_name}', treating as text"
+                )
+                df[col_name] = df[col_name].astype(str, errors="ignore")
+        except Exception as e:
+            logger.error(f"Error converting type for column '{col_name}': {e}")
+
+    def _build_multi_choice(self, df: Optional[pd.DataFrame] = None):
+        """Build selection matrices for the multiple-choice checkbox columns of df"""
+        if df is None:
+            df = self.df
+        with self._stage("multi_choice", rows=len(df)) as record:
+            built = 0
+            for col_name, field_schema in self.schema.items():
+                if (
+                    field_schema.field_type == "checkbox"
+                    and field_schema.multiple
+                    and col_name in df.columns
+                ):
+                    self.multi_choice[col_name] = MultiChoiceMatrix.from_lists(
+                        df[col_name], field_schema
+                    )
+                    built += 1
+            record.columns = built
+
+    def get_option_breakdown(self, col: str, group_by: GroupKey) -> pd.DataFrame:
+        """
+        Option selection counts of a multiple-choice field split by group
+
+        Args:
+            col: Multiple-choice checkbox column
+            group_by: Grouping key accepted by calculate_sus_scores
+
+        Returns:
+            DataFrame of (grouping, group) x option counts
+        """
+        self._ensure_loaded([col])
+        self._ensure_group_columns(group_by)
+        return self.multi_choice[col].breakdown(_group_indicators(self.df, group_by))
+
+    def _rating_fields(
+        self, scale: Dict[str, float], sections: Optional[List[str]] = None
+    ) -> Dict[str, List[str]]:
+        """Radio/select fields answered on scale, by section"""
+        labels = {label for label, score in scale.items() if pd.notna(score)}
+        rating_fields = {}
+        for section_name, columns in self.sections.items():
+            if sections is not None and section_name not in sections:
+                continue
+            fields = [
+                col
+                for col in columns
+                if self.schema[col].field_type in ("radio", "select")
+                and self.schema[col].options
+                and self.schema[col].option_set <= set(scale)
+                and self.schema[col].option_set & labels
+            ]
+            if fields:
+                rating_fields[section_name] = fields
+        return rating_fields
+
+    def get_rating_cube(
+        self,
+        sections: Optional[List[str]] = None,
+        scale: Optional[Dict[str, float]] = None,
+    ) -> RatingCube:
+        """
+        Build the respondent x application x section rating cube
+
+        Args:
+            sections: Sections to include (default: every section with rating fields)
+            scale: Label to score map; labels scored NaN count as Not Applicable
+                (default: EFFECTIVENESS_RATINGS)
+
+        Returns:
+            RatingCube over the loaded rows
+        """
+        scale = EFFECTIVENESS_RATINGS if scale is None else scale
+        key = (None if sections is None else tuple(sections), tuple(scale.items()))
+        cube = self._rating_cubes.get(key)
+        if cube is not None and cube.index is self.df.index:
+            return cube
+
+        labels = [label for label, score in scale.items() if pd.notna(score)]
+        na_labels = [label for label, score in scale.items() if pd.isna(score)]
+        scores = np.array([scale[label] for label in labels], dtype=float)
+        n_levels = len(labels) + 1
+
+        rating_fields = self._rating_fields(scale, sections)
+        self._ensure_loaded(
+            [col for fields in rating_fields.values() for col in fields]
+        )
+
+        section_names = (
+            [name for name in sections if name in rating_fields]
+            if sections is not None
+            else list(rating_fields)
+        )
+        applications = self.column_index.applications + [OVERALL_APPLICATION]
+        suffixes = {app: app for app in self.column_index.applications}
+        suffixes.update(
+            {
+                alias: app
+                for alias, app in APPLICATION_ALIASES.items()
+                if app in suffixes
+            }
+        )
+
+        # Level code per label: scale levels, then Not Applicable
+        level_codes = pd.Index(labels + na_labels)
+        level_of_code = np.append(
+            np.arange(len(labels)), [n_levels - 1] * len(na_labels)
+        )
+
+        fields_by_cell = defaultdict(list)
+        rows, cols = [], []
+        n_rows = len(self.df)
+        n_sections = len(section_names)
+        for s_idx, section_name in enumerate(section_names):
+            prefix = f"{section_name}."
+            for col in rating_fields[section_name]:
+                name = col[len(prefix) :] if col.startswith(prefix) else col
+                app = next(
+                    (
+                        app
+                        for suffix, app in suffixes.items()
+                        if name == suffix
+                        or name.endswith(f"_{suffix}")
+                        or name.endswith(f"-{suffix}")
+                    ),
+                    OVERALL_APPLICATION,
+                )
+                a_idx = applications.index(app)
+                fields_by_cell[(app, section_name)].append(col)
+
+                codes = level_codes.get_indexer(self.df[col].to_numpy(dtype=object))
+                answered = np.flatnonzero(codes >= 0)
+                rows.append(answered)
+                cols.append(
+                    (a_idx * n_sections + s_idx) * n_levels
+                    + level_of_code[codes[answered]]
+                )
+
+        rows = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.array([], dtype=np.int64)
+        counts = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, cols)),
+            shape=(n_rows, len(applications) * n_sections * n_levels),
+        )
+
+        cube = RatingCube(
+            counts=counts,
+            index=self.df.index,
+            applications=applications,
+            sections=section_names,
+            labels=labels + ["Not Applicable"],
+            scores=scores,
+            fields=dict(fields_by_cell),
+        )
+        self._rating_cubes[key] = cube
+        return cube
+
+    def text_fields(
+        self, field_types: Tuple[str, ...] = ("text", "textarea")
+    ) -> List[str]:
+        """Columns whose schema field type is one of field_types, in file order"""
+        return [
+            col
+            for col, field_schema in self.schema.items()
+            if field_schema.field_type in field_types
+        ]
+
+    def analyze_sentiment(
+        self,
+        fields: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        cache_path: Optional[Union[str, Path]] = None,
+        scorer=None,
+        batch_size: int = 200,
+    ) -> pd.DataFrame:
+        """
+        Score the sentiment of every free-text response
+
+        Each distinct text is scored once. Scores are first looked up in a
+        SQLite cache by text hash; only unseen texts are scored, in batches
+        spread over a process pool, and then stored. The default cache lives
+        next to the CSV, so datasets in one folder share it.
+
+        Args:
+            fields: Text columns (default: fields of FEEDBACK_FIELD_TYPES)
+            max_workers: Scoring processes (default: one per CPU; 1 scores in
+                this process)
+            use_cache: Read and write the on-disk score cache
+            cache_path: Cache file (default: SENTIMENT_CACHE_NAME next to the CSV)
+            scorer: Picklable function text -> (polarity, subjectivity)
+                (default: TextBlob)
+            batch_size: Texts per process pool task
+
+        Returns:
+            DataFrame with one row per non-empty response: row, field,
+            section, polarity, subjectivity and sentiment (positive, neutral
+            or negative by SENTIMENT_THRESHOLD)
+
+        Raises:
+            ImportError: If texts need scoring with TextBlob and it is not installed
+            ValueError: If the file was streamed, so no row-level data is kept
+        """
+        fields = (
+            self.text_fields(self.FEEDBACK_FIELD_TYPES)
+            if fields is None
+            else list(fields)
+        )
+        self._ensure_loaded(fields)
+        if self.df is None:
+            raise ValueError(
+                "Sentiment analysis needs row-level data; load without chunksize"
+            )
+
+        with self._stage("sentiment", rows=len(self.df), columns=len(fields)) as record:
+            values = self.df[fields].to_numpy(dtype=object)
+            rows, cols = np.nonzero(pd.notna(values))
+            texts = pd.Series(values[rows, cols], dtype=object).astype(str).str.strip()
+            answered = (texts != "").to_numpy()
+            rows, cols, texts = (
+                rows[answered],
+                cols[answered],
+                texts.to_numpy()[answered],
+            )
+
+            unique_texts = pd.Index(pd.unique(texts))
+            # A pooled processor's path is the datasets' common folder
+            folder = self.csv_path if self.csv_path.is_dir() else self.csv_path.parent
+            scores = self._score_texts(
+                unique_texts.tolist(),
+                scorer=scorer,
+                max_workers=max_workers,
+                cache_path=(
+                    None
+                    if not use_cache
+                    else cache_path or folder / SENTIMENT_CACHE_NAME
+                ),
+                batch_size=batch_size,
+            )
+            record.rows = len(unique_texts)
+            scores = scores.reshape(-1, 2)[unique_texts.get_indexer(texts)]
+
+        polarity = scores[:, 0]
+        threshold = self.SENTIMENT_THRESHOLD
+        sentiment = np.select(
+            [polarity > threshold, polarity < -threshold],
+            ["positive", "negative"],
+            "neutral",
+        )
+        field_names = pd.Index(fields)
+        return pd.DataFrame(
+            {
+                "row": self.df.index[rows],
+                "field": pd.Categorical.from_codes(cols, categories=field_names),
+                "section": [self.schema[field_names[c]].section for c in cols],
+                "polarity": polarity,
+                "subjectivity": scores[:, 1],
+                "sentiment": pd.Categorical(
+                    sentiment, categories=["positive", "neutral", "negative"]
+                ),
+            }
+        )
+
+    def _score_texts(
+        self,
+        texts: List[str],
+        scorer=None,
+        max_workers: Optional[int] = None,
+        cache_path: Optional[Path] = None,
+        batch_size: int = 200,
+    ) -> np.ndarray:
+        """(polarity, subjectivity) per text, from the cache or freshly scored"""
+        scorer = _textblob_sentiment if scorer is None else scorer
+        scorer_name = f"{scorer.__module__}.{scorer.__qualname__}"
+        hashes = [SentimentCache.text_hash(text) for text in texts]
+
+        cache = SentimentCache(cache_path) if cache_path is not None else None
+        try:
+            known = cache.get_many(scorer_name, hashes) if cache is not None else {}
+            missing = [
+                i for i, text_hash in enumerate(hashes) if text_hash not in known
+            ]
+            if missing:
+                if scorer is _textblob_sentiment and TextBlob is None:
+                    raise ImportError(
+                        f"Scoring {len(missing)} new texts needs textblob (pip install textblob)"
+                    )
+                todo = [texts[i] for i in missing]
+                batches = [
+                    todo[i : i + batch_size] for i in range(0, len(todo), batch_size)
+                ]
+                if max_workers == 1 or len(batches) == 1:
+                    results = [_score_batch(scorer, batch) for batch in batches]
+                else:
+                    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                        results = list(
+                            pool.map(functools.partial(_score_batch, scorer), batches)
+                        )
+                scored = dict(
+                    zip((hashes[i] for i in missing), chain.from_iterable(results))
+                )
+                if cache is not None:
+                    cache.put_many(scorer_name, scored)
+                known.update(scored)
+            logger.info(
+                f"Sentiment: {len(texts) - len(missing)} cached, {len(missing)} scored"
+            )
+        finally:
+            if cache is not None:
+                cache.close()
+
+        return np.array([known[text_hash] for text_hash in hashes], dtype=float)
+
+    def get_sentiment_summary(
+        self, by: Union[str, List[str]] = "field", **kwargs
+    ) -> pd.DataFrame:
+        """
+        Sentiment per field (or section, dataset, ...)
+
+        Args:
+            by: Column(s) of the analyze_sentiment result to group by
+            **kwargs: Passed to analyze_sentiment
+
+        Returns:
+            DataFrame of responses, avg_polarity, avg_subjectivity and
+            positive/neutral/negative counts per group
+        """
+        results = self.analyze_sentiment(**kwargs)
+        if "dataset" in self.df.columns:
+            results["dataset"] = self.df.loc[results["row"], "dataset"].to_numpy()
+        grouped = results.groupby(by, observed=True)
+        summary = grouped.agg(
+            responses=("polarity", "size"),
+            avg_polarity=("polarity", "mean"),
+            avg_subjectivity=("subjectivity", "mean"),
+        )
+        counts = grouped["sentiment"].value_counts().unstack(fill_value=0)
+        return summary.join(counts.add_suffix("_count"))
+
+    def get_text_index(
+        self,
+        fields: Optional[List[str]] = None,
+        path: Optional[Union[str, Path]] = None,
+    ) -> TextIndex:
+        """
+        Inverted index over the text fields, see TextIndex
+
+        Args:
+            fields: Columns to index (default: text and textarea fields)
+            path: Optional file to load the index from and save it to; a
+                saved index is only used while the indexed text is unchanged
+
+        Returns:
+            TextIndex over the loaded rows (grouped by dataset too when pooled)
+
+        Raises:
+            ValueError: If the file was streamed, so no row-level data is kept
+        """
+        fields = self.text_fields() if fields is None else list(fields)
+        key = tuple(fields)
+        index = self._text_indexes.get(key)
+        if index is not None:
+            return index
+
+        self._ensure_loaded(fields)
+        if self.df is None:
+            raise ValueError(
+                "The text index needs row-level data; load without chunksize"
+            )
+
+        saved_key = None
+        if path is not None:
+            # Key on the indexed text itself so edits, refreshes and pooled
+            # data are all covered
+            digest = hashlib.sha256("\x1f".join(fields).encode("utf-8"))
+            digest.update(
+                pd.util.hash_pandas_object(self.df[fields].astype(object), index=True)
+                .to_numpy()
+                .tobytes()
+            )
+            saved_key = f"{PROCESSOR_VERSION}:{digest.hexdigest()}"
+            index = TextIndex.load(path, saved_key)
+
+        if index is None:
+            with self._stage("text_index", rows=len(self.df), columns=len(fields)):
+                index = TextIndex.from_frame(
+                    self.df,
+                    fields,
+                    sections={col: self.schema[col].section for col in fields},
+                    group_column=MultiDatasetProcessor.DATASET_COLUMN,
+                )
+            if path is not None:
+                index.save(path, saved_key)
+        self._text_indexes[key] = index
+        return index
+
+    def search_text(
+        self, query: str, mode: str = "all", fields: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Responses mentioning the query terms, from the text index
+
+        Args:
+            query: Whitespace-separated terms; "term*" matches a prefix
+            mode: "all" to require every term, "any" for at least one
+            fields: Only search these fields
+
+        Returns:
+            DataFrame of row, field and hits, most hits first
+        """
+        return self.get_text_index().search(query, mode=mode, fields=fields)
+
+    def get_rating_matrix(
+        self,
+        stat: str = "mean",
+        group_by: Optional[GroupKey] = None,
+        sections: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Application x section effectiveness matrix
+
+        Args:
+            stat: One of "mean", "median", "count", "not_applicable" or
+                "distribution"
+            group_by: Optional grouping key (e.g. "dataset" or a demographic
+                column) to get one matrix per group
+            sections: Sections to include (default: all with rating fields)
+
+        Returns:
+            DataFrame of applications x sections, stacked under
+            (grouping, group) when group_by is given
+        """
+        cube = self.get_rating_cube(sections=sections)
+        self._ensure_group_columns(group_by)
+        indicators = None if group_by is None else _group_indicators(self.df, group_by)
+        return getattr(cube, stat)(indicators)
+
+    def _to_categorical(
+        self, series: pd.Series, field_schema: FieldSchema
+    ) -> pd.Series:
+        """
+        Store a radio/select column as a Categorical of its schema options
+
+        Categories follow the order of the schema options. Columns holding
+        values outside the schema are left unconverted and the values are
+        recorded in ``self.off_schema_values`` instead of being added as
+        new categories, so validation still reports them.
+        """
+        dtype = self.schema_registry.categorical_dtype(field_schema.options)
+        categorical = series.astype(dtype)
+        # Values outside the categories become NaN in the conversion
+        off_schema = categorical.isna() & series.notna()
+        if off_schema.any():
+            counts = self.off_schema_values.setdefault(field_schema.name, {})
+            for value, count in series[off_schema].value_counts().items():
+                counts[value] = counts.get(value, 0) + int(count)
+            logger.warning(
+                f"Column '{field_schema.name}' has values outside its schema options, "
+                f"keeping it as text: {list(counts)[:5]}"
+            )
+            return series
+
+        return categorical
+
+    def _data_columns(self) -> pd.Index:
+        """Columns of the loaded data, from the frame or the streamed profile"""
+        if self._unloaded:
+            # Lazily opened: every column in the file, loaded or not
+            return self._header_columns
+        if self.df is not None:
+            return self.df.columns
+        if self.profile is not None:
+            return self.profile.columns
+        return pd.Index([])
+
+    @property
+    def column_index(self) -> ColumnIndex:
+        """Column lookup tables, rebuilt only when the set of columns changes"""
+        columns = self._data_columns()
+        if self._column_index is None or self._column_index.columns is not columns:
+            self._column_index = ColumnIndex(columns, self.schema)
+        return self._column_index
+
+    @property
+    def data_profile(self) -> Optional[DataProfile]:
+        """
+        Per-column statistics for the loaded data
+
+        In streaming mode this is the accumulated profile; for a full load
+        it is built from the whole frame on first use and kept until the
+        data version changes.
+        """
+        if self.df is None:
+            return self.profile
+        if self._frame_profile_version != self._data_version:
+            self._frame_profile = DataProfile.from_frame(
+                self.df, self.schema, self.multi_choice
+            )
+            self._frame_profile_version = self._data_version
+        return self._frame_profile
+
+    def _has_current_profile(self) -> bool:
+        """Whether data_profile is available without profiling the frame again"""
+        if self.df is None:
+            return self.profile is not None
+        return (
+            self._frame_profile is not None
+            and self._frame_profile_version == self._data_version
+        )
 
-        return self.df
+    def _row_count(self) -> int:
+        """Number of data rows, from the frame or the streamed profile"""
+        if self.df is not None:
+            return len(self.df)
+        if self.profile is not None:
+            return self.profile.n_rows
+        return 0
+
+    def _non_null_count(self, col: str) -> int:
+        """Number of answered rows for a column"""
+        return self.data_profile.non_null.get(col, 0)
+
+    def _value_counts(self, col: str) -> pd.Series:
+        """Value distribution for a column, most common first"""
+        profile = self.data_profile
+        if self.df is not None and col not in profile.value_counts:
+            # Not profiled (high-cardinality or not a choice field)
+            return _count_values(self.df[col], self.schema.get(col))
+        return profile.get_value_counts(col)
+
+    def validate_data(
+        self, max_errors: Optional[int] = None, as_frame: bool = False
+    ) -> Union[List[Dict[str, Any]], pd.DataFrame]:
+        """
+        Validate data against schema constraints
 
-    def _convert_data_types(self):
-        """Convert column data types based on schema definitions"""
-        for col_name, field_schema in self.schema.items():
-            if col_name not in self.df.columns:
-                continue
+        Each schema rule is checked for a whole column at once and the
+        failures are collected into a columnar error table (row, column,
+        rule, value) stored on ``self.validation_table``.
 
-            try:
-                if field_schema.field_type == "datetime":
-                    self.df[col_name] = pd.to_datetime(
-                        self.df[col_name], errors="coerce"
-                    )
-                elif field_schema.field_type == "date":
-                    self.df[col_name] = pd.to_datetime(
-                        self.df[col_name], errors="coerce"
-                    ).dt.date
-                elif field_schema.field_type == "number":
-                    self.df[col_name] = pd.to_numeric(
-                        self.df[col_name], errors="coerce"
-                    )
-                elif field_schema.field_type == "identifier":
-                    # Keep as string
-                    self.df[col_name] = self.df[col_name].astype(str)
-                elif field_schema.field_type == "checkbox" and field_schema.multiple:
-                    # Split multiple values
-                    self.df[col_name] = self.df[col_name].apply(
-                        lambda x: x.split("; ") if pd.notna(x) and x else []
-                    )
-                elif field_schema.field_type == "datatable":
-                    # Parse JSON datatable content
-                    self.df[col_name] = self.df[col_name].apply(self._parse_datatable)
-                    self.datatable_fields[col_name] = field_schema
-                elif field_schema.field_type == "unknown":
-                    # Treat unknown fields as text
-                    logger.warning(
-                        f"Unknown field type for column '{col_name}', treating as text"
-                    )
-                    self.df[col_name] = self.df[col_name].astype(str, errors="ignore")
-            except Exception as e:
-                logger.error(f"Error converting type for column '{col_name}': {e}")
+        Args:
+            max_errors: Stop collecting once this many errors were found
+                (None for no limit)
+            as_frame: Return the columnar error table instead of the
+                list-of-dicts error format
 
-    def validate_data(self) -> List[Dict[str, Any]]:
-        """Validate data against schema constraints"""
+        Returns:
+            Error table or list of error dicts, ordered by row and column
+        """
+        self._ensure_loaded()
         logger.info("Validating data against schema")
-        self.validation_errors = []
 
-        for idx, row in self.df.iterrows():
-            for col_name, field_schema in self.schema.items():
-                if col_name not in self.df.columns:
-                    continue
+        self.validation_table, capped = self._validate_frame(self.df, max_errors)
+        self._validation_capped = capped
+        if capped:
+            logger.warning(f"Validation stopped after reaching max_errors={max_errors}")
+        logger.info(f"Validation complete: found {len(self.validation_table)} errors")
 
-                value = row[col_name]
+        if as_frame:
+            return self.validation_table
 
-                # Check required fields
-                if field_schema.required and pd.isna(value):
-                    self.validation_errors.append(
-                        {
-                            "row": idx,
-                            "column": col_name,
-                            "error": "Required field is empty",
-                            "value": value,
-                        }
+        self.validation_errors = self.get_validation_errors()
+        return self.validation_errors
+
+    def _validate_frame(
+        self, df: pd.DataFrame, max_errors: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, bool]:
+        """Error table for the rows of df, and whether max_errors cut it short"""
+        collector = _ValidationCollector(max_errors)
+        columns = [col for col in self.schema if col in df.columns]
+        n_rows = len(df)
+
+        with self._stage("validate", rows=n_rows, columns=len(columns)):
+            for col_position, col_name in enumerate(columns):
+                if collector.full:
+                    break
+                with self._stage("validate", rows=n_rows, column=col_name):
+                    self._validate_column(
+                        collector, col_position, df[col_name], self.schema[col_name]
                     )
+            table = collector.to_frame(df.index, columns)
+
+        return table, collector.full
+
+    def _validate_column(
+        self,
+        collector: "_ValidationCollector",
+        col_position: int,
+        series: pd.Series,
+        field_schema: FieldSchema,
+    ):
+        """Check every schema rule for one column across all rows"""
+        is_multiple = field_schema.field_type == "checkbox" and field_schema.multiple
+
+        # Check required fields
+        if field_schema.required:
+            missing = series.isna().to_numpy()
+            if is_multiple and series.dtype == object:
+                missing |= (series.str.len() == 0).to_numpy()
+            collector.add(col_position, ValidationRule.REQUIRED, missing, series)
+
+        # Check options for radio/select fields. A column stored with the
+        # options' shared categorical dtype cannot hold anything else.
+        if field_schema.options and field_schema.field_type in ["radio", "select"]:
+            if series.dtype != self.schema_registry.categorical_dtype(
+                field_schema.options
+            ):
+                invalid = (
+                    series.notna() & ~series.isin(field_schema.option_set)
+                ).to_numpy()
+                if invalid.any():
+                    # Fall back to string comparison for non-string values
+                    invalid[invalid] = (
+                        ~series[invalid]
+                        .astype(str)
+                        .isin(field_schema.option_set)
+                        .to_numpy()
+                    )
+                collector.add(
+                    col_position, ValidationRule.INVALID_OPTION, invalid, series
+                )
 
-                # Check options for radio/select fields
-                if field_schema.options and pd.notna(value):
-                    if field_schema.field_type in ["radio", "select"]:
-                        if str(value) not in field_schema.options:
-                            self.validation_errors.append(
-                                {
-                                    "row": idx,
-                                    "column": col_name,
-                                    "error": f"Invalid option: {value}",
-                                    "valid_options": field_schema.options,
-                                }
-                            )
-                    elif (
-                        field_schema.field_type == "checkbox" and field_schema.multiple
-                    ):
-                        if isinstance(value, list):
-                            invalid_opts = [
-                                v for v in value if v not in field_schema.options
-                            ]
-                            if invalid_opts:
-                                self.validation_errors.append(
-                                    {
-                                        "row": idx,
-                                        "column": col_name,
-                                        "error": f"Invalid options: {invalid_opts}",
-                                        "valid_options": field_schema.options,
-                                    }
-                                )
-
-                # Check numeric ranges
-                if pd.notna(value) and field_schema.field_type == "number":
-                    if (
-                        field_schema.min_value is not None
-                        and value < field_schema.min_value
-                    ):
-                        self.validation_errors.append(
-                            {
-                                "row": idx,
-                                "column": col_name,
-                                "error": f"Value {value} below minimum {field_schema.min_value}",
-                            }
-                        )
-                    if (
-                        field_schema.max_value is not None
-                        and value > field_schema.max_value
-                    ):
-                        self.validation_errors.append(
-                            {
-                                "row": idx,
-                                "column": col_name,
-                                "error": f"Value {value} above maximum {field_schema.max_value}",
-                            }
-                        )
+        # Check options for multiple-choice checkbox fields
+        elif field_schema.options and is_multiple:
+            positions = pd.Series(series.to_numpy(), copy=False)
+            exploded = positions[positions.map(type) == list].explode()
+            invalid = exploded[
+                exploded.notna() & ~exploded.isin(field_schema.option_set)
+            ]
+            if len(invalid) > 0:
+                invalid_opts = invalid.groupby(level=0, sort=True).agg(list)
+                collector.add_positions(
+                    col_position,
+                    ValidationRule.INVALID_OPTIONS,
+                    invalid_opts.index.to_numpy(),
+                    invalid_opts.to_numpy(),
+                )
 
-        logger.info(f"Validation complete: found {len(self.validation_errors)} errors")
-        return self.validation_errors
+        # Check numeric ranges
+        if field_schema.field_type == "number" and pd.api.types.is_numeric_dtype(
+            series
+        ):
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+            if field_schema.min_value is not None:
+                collector.add(
+                    col_position,
+                    ValidationRule.BELOW_MIN,
+                    values < field_schema.min_value,
+                    series,
+                )
+            if field_schema.max_value is not None:
+                collector.add(
+                    col_position,
+                    ValidationRule.ABOVE_MAX,
+                    values > field_schema.max_value,
+                    series,
+                )
+
+    def get_validation_errors(
+        self, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert the columnar error table into the list-of-dicts error format
+
+        Args:
+            limit: Only convert the first ``limit`` errors
 
+        Returns:
+            List of error dicts with row, column, error and value/valid_options
+        """
+        table = self.validation_table
+        if table is None:
+            return []
+        if limit is not None:
+            table = table.iloc[:limit]
+        return self._error_dicts(table)
+
+    def _error_dicts(self, table: pd.DataFrame) -> List[Dict[str, Any]]:
+        """List-of-dicts form of the rows of an error table"""
+        errors = []
+        for row, col_name, rule, value in zip(
+            table["row"], table["column"], table["rule"], table["value"]
+        ):
+            field_schema = self.schema[col_name]
+            error = {"row": row, "column": col_name}
+            if rule == ValidationRule.REQUIRED.value:
+                error["error"] = "Required field is empty"
+                error["value"] = value
+            elif rule == ValidationRule.INVALID_OPTION.value:
+                error["error"] = f"Invalid option: {value}"
+                error["valid_options"] = list(field_schema.options)
+            elif rule == ValidationRule.INVALID_OPTIONS.value:
+                error["error"] = f"Invalid options: {value}"
+                error["valid_options"] = list(field_schema.options)
+            elif rule == ValidationRule.BELOW_MIN.value:
+                error["error"] = f"Value {value} below minimum {field_schema.min_value}"
+            elif rule == ValidationRule.ABOVE_MAX.value:
+                error["error"] = f"Value {value} above maximum {field_schema.max_value}"
+            errors.append(error)
+
+        return errors
+
+    @_memoized_summary(bounded=True)
     def get_section_summary(self, section_name: str) -> Dict[str, Any]:
         """Generate statistical summary for a specific section"""
         if section_name not in self.sections:
@@ -289,6 +3712,7 @@ class BaseJCC2Processor(ABC):
             return {}
 
         section_cols = self.sections[section_name]
+        self._ensure_loaded(section_cols)
         summary = {
             "section": section_name,
             "total_fields": len(section_cols),
@@ -296,75 +3720,55 @@ class BaseJCC2Processor(ABC):
         }
 
         for col in section_cols:
-            field_schema = self.schema[col]
-            col_summary = {
-                "field_type": field_schema.field_type,
-                "non_null_count": self.df[col].notna().sum(),
-                "null_count": self.df[col].isna().sum(),
-                "completion_rate": self.df[col].notna().mean(),
-            }
+            summary["field_summaries"][col] = self._field_summary(col)
+
+        return summary
+
+    def _field_summary(self, col: str) -> Dict[str, Any]:
+        """
+        Per-field summary from the data profile
 
-            # Add type-specific summaries
-            if field_schema.field_type in ["radio", "select"]:
-                value_counts = self.df[col].value_counts()
-                col_summary["value_distribution"] = value_counts.to_dict()
+        The profile keeps no distribution for columns with more than
+        DataProfile.MAX_DISTINCT_VALUES distinct values. For a full load
+        their distribution and median are taken from the frame instead.
+        """
+        profile = self.data_profile
+        col_summary = profile.field_summary(col)
+        if self.df is None or col not in profile.high_cardinality:
+            return col_summary
+
+        if col_summary["field_type"] == "number":
+            col_summary["median"] = self.df[col].median()
+        elif "value_distribution" in col_summary:
+            value_counts = self._value_counts(col)
+            value_counts = value_counts[value_counts > 0]
+            col_summary["value_distribution"] = value_counts.to_dict()
+            if "most_common" in col_summary:
                 col_summary["most_common"] = (
                     value_counts.index[0] if len(value_counts) > 0 else None
                 )
+        return col_summary
 
-            elif field_schema.field_type == "checkbox" and field_schema.multiple:
-                # Flatten lists and count occurrences
-                all_values = []
-                for val_list in self.df[col].dropna():
-                    if isinstance(val_list, list):
-                        all_values.extend(val_list)
-                value_counts = pd.Series(all_values).value_counts()
-                col_summary["value_distribution"] = value_counts.to_dict()
-
-            elif field_schema.field_type == "number":
-                col_summary["mean"] = self.df[col].mean()
-                col_summary["std"] = self.df[col].std()
-                col_summary["min"] = self.df[col].min()
-                col_summary["max"] = self.df[col].max()
-                col_summary["median"] = self.df[col].median()
-
-            summary["field_summaries"][col] = col_summary
-
-        return summary
-
+    @_memoized_summary()
     def get_all_sections_summary(self) -> Dict[str, Dict[str, Any]]:
         """Generate summaries for all sections"""
+        self._ensure_loaded()
         all_summaries = {}
         for section_name in self.sections:
             all_summaries[section_name] = self.get_section_summary(section_name)
         return all_summaries
 
+    @_memoized_summary()
     def analyze_application_patterns(self) -> Dict[str, Any]:
         """Analyze response patterns across different applications"""
+        self._ensure_loaded()
         # Find all application-related columns
         app_patterns = defaultdict(dict)
 
-        # Common application names found in the data
-        applications = [
-            "jcc2cyberops",
-            "jcc2readiness",
-            "a2it",
-            "cad",
-            "codex",
-            "crucible",
-            "cyber9line",
-            "dispatch",
-            "madss",
-            "rally",
-            "redmap",
-            "sigact",
-            "threathub",
-            "triage",
-            "unity",
-        ]
-
-        for app in applications:
-            app_cols = [col for col in self.df.columns if app in col.lower()]
+        # Applications come from the file's exp_app_* columns
+        column_index = self.column_index
+        for app in column_index.applications:
+            app_cols = column_index.app_columns[app]
 
             if not app_cols:
                 continue
@@ -382,10 +3786,7 @@ class BaseJCC2Processor(ABC):
                         app_patterns[app]["sections"][section].append(col)
 
             # Calculate overall engagement
-            non_null_counts = []
-            for col in app_cols:
-                if col in self.df.columns:
-                    non_null_counts.append(self.df[col].notna().sum())
+            non_null_counts = [self._non_null_count(col) for col in app_cols]
 
             if non_null_counts:
                 app_patterns[app]["avg_responses"] = np.mean(non_null_counts)
@@ -393,6 +3794,49 @@ class BaseJCC2Processor(ABC):
 
         return dict(app_patterns)
 
+    def get_datatable(self, col: str) -> pd.Series:
+        """
+        Decoded datatable column
+
+        Raw JSON is decoded the first time a column is requested and written
+        back into df. Identical payloads share one decoded object, so treat
+        the returned dicts as read-only.
+
+        Args:
+            col: Datatable column name
+
+        Returns:
+            Series of decoded datatables (None where empty or invalid)
+        """
+        self._ensure_loaded([col])
+        if col in self._pending_datatables:
+            with self._stage("decode_datatables", rows=len(self.df), columns=1):
+                decoded = self._decode_datatables(self.df[col])
+            # df may be a row slice of a combined frame (MultiDatasetProcessor);
+            # the decoded column belongs to this processor only
+            with pd.option_context("mode.chained_assignment", None):
+                self.df[col] = decoded
+            self._pending_datatables.discard(col)
+        return self.df[col]
+
+    def _decode_datatables(self, series: pd.Series) -> pd.Series:
+        """Decode a column of datatable JSON, parsing each distinct payload once"""
+        values = series.to_numpy(dtype=object)
+        is_text = np.fromiter(
+            (isinstance(v, str) for v in values), dtype=bool, count=len(values)
+        )
+        for payload in pd.unique(values[is_text]):
+            if payload not in self._datatable_cache:
+                self._datatable_cache[payload] = self._parse_datatable(payload)
+
+        return series.map(
+            lambda v: (
+                self._datatable_cache[v]
+                if isinstance(v, str)
+                else self._parse_datatable(v)
+            )
+        )
+
     def _parse_datatable(self, value: Any) -> Optional[Dict[str, Any]]:
         """Parse datatable JSON content"""
         if pd.isna(value) or value == "null" or not value:
@@ -400,7 +3844,7 @@ class BaseJCC2Processor(ABC):
 
         try:
             if isinstance(value, str):
-                return json.loads(value)
+                return _loads(value)
             return value
         except json.JSONDecodeError:
             logger.error(f"Failed to parse datatable JSON: {value[:100]}...")
@@ -416,39 +3860,29 @@ class BaseJCC2Processor(ABC):
         """Prepare format-specific visualization data"""
         pass
 
+    @_memoized_summary()
     def prepare_visualization_data(self) -> Dict[str, pd.DataFrame]:
         """Prepare data structures optimized for visualization"""
+        self._ensure_loaded()
         viz_data = {}
 
         # Prepare data for effectiveness heatmaps
-        effectiveness_cols = [
-            col
-            for col in self.df.columns
-            if "effectiveness" in col or "effective" in col.lower()
-        ]
+        effectiveness_cols = self.column_index.contains("effective")
 
         if effectiveness_cols:
             # Extract effectiveness ratings
             effectiveness_data = self.df[effectiveness_cols].copy()
 
             # Map text ratings to numeric values
-            rating_map = {
-                "Completely Ineffective": 1,
-                "Moderately Ineffective": 2,
-                "Slightly Ineffective": 3,
-                "Slightly Effective": 4,
-                "Moderately Effective": 5,
-                "Completely Effective": 6,
-                "Not Applicable": np.nan,
-            }
-
             for col in effectiveness_cols:
-                effectiveness_data[col] = effectiveness_data[col].map(rating_map)
+                effectiveness_data[col] = (
+                    effectiveness_data[col].map(EFFECTIVENESS_RATINGS).astype(float)
+                )
 
             viz_data["effectiveness_heatmap"] = effectiveness_data
 
         # Prepare data for frequency bar charts
-        frequency_cols = [col for col in self.df.columns if "frequency" in col.lower()]
+        frequency_cols = self.column_index.contains("frequency")
         if frequency_cols:
             viz_data["frequency_data"] = self.df[frequency_cols].copy()
 
@@ -468,31 +3902,168 @@ class BaseJCC2Processor(ABC):
 
         return viz_data
 
-    def export_summary(self, output_path: Optional[str] = None) -> Dict[str, Any]:
-        """Export comprehensive summary of the data"""
-        summary = {
-            "metadata": {
-                "source_file": str(self.csv_path),
-                "processed_at": datetime.now().isoformat(),
-                "total_rows": len(self.df),
-                "total_columns": len(self.df.columns),
-                "total_sections": len(self.sections),
-                "validation_errors": len(self.validation_errors),
-            },
-            "sections": self.get_all_sections_summary(),
-            "application_patterns": self.analyze_application_patterns(),
-            "validation_errors": self.validation_errors[:10],  # First 10 errors
-            "format_type": self.format_type.value,
-            "format_specific": self.get_format_specific_summary(),
+    def export_summary(
+        self,
+        output_path: Optional[str] = None,
+        compact: bool = False,
+        errors_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Export comprehensive summary of the data
+
+        The file is written one top-level entry at a time, each encoded as
+        soon as it is computed; numpy, pandas and datetime values are
+        encoded natively (with orjson when installed).
+
+        Args:
+            output_path: JSON file to write; a ``.gz`` suffix writes gzip
+            compact: Write without indentation or spaces
+            errors_path: Also write every validation error to this file,
+                one JSON record per line (see write_validation_errors)
+
+        Returns:
+            The summary dict
+        """
+        with self._stage("export") as record:
+            summary = self._build_export(output_path, compact, errors_path)
+            record.rows = self._row_count()
+            record.columns = len(self._data_columns())
+        return summary
+
+    def _build_export(
+        self, output_path: Optional[str], compact: bool, errors_path: Optional[str]
+    ) -> Dict[str, Any]:
+        """Body of export_summary, timed as one stage"""
+        self._ensure_loaded()
+        metadata = {
+            "source_file": str(self.csv_path),
+            "processed_at": datetime.now().isoformat(),
+            "total_rows": self._row_count(),
+            "total_columns": len(self._data_columns()),
+            "total_sections": len(self.sections),
+            "validation_errors": (
+                len(self.validation_table) if self.validation_table is not None else 0
+            ),
         }
+        if errors_path:
+            self.write_validation_errors(errors_path)
+            metadata["validation_errors_file"] = str(errors_path)
+
+        entries = [
+            ("metadata", lambda: metadata),
+            ("sections", self.get_all_sections_summary),
+            ("application_patterns", self.analyze_application_patterns),
+            # First 10 errors
+            ("validation_errors", lambda: self.get_validation_errors(limit=10)),
+            ("format_type", lambda: self.format_type.value),
+            ("format_specific", self.get_format_specific_summary),
+        ]
 
-        if output_path:
-            with open(output_path, "w") as f:
-                json.dump(summary, f, indent=2, default=str)
-            logger.info(f"Summary exported to {output_path}")
+        if not output_path:
+            return {key: compute() for key, compute in entries}
+
+        summary = {}
+        # Same suffix as the target so a .gz export is compressed too
+        tmp_path = Path(output_path).with_name(f"tmp-{Path(output_path).name}")
+        with self._stage("write_json"), _open_text(tmp_path, "w") as f:
+            f.write("{")
+            for position, (key, compute) in enumerate(entries):
+                summary[key] = compute()
+                separator = "," if position else ""
+                if compact:
+                    f.write(
+                        f"{separator}{_dumps(key, True)}:{_dumps(summary[key], True)}"
+                    )
+                else:
+                    # Indent the entry one level to sit inside the top-level object
+                    encoded = _dumps(summary[key], False).replace("\n", "\n  ")
+                    f.write(f"{separator}\n  {_dumps(key, True)}: {encoded}")
+            f.write("}" if compact else "\n}\n")
+        os.replace(tmp_path, output_path)
+        logger.info(f"Summary exported to {output_path}")
 
         return summary
 
+    def write_validation_errors(self, path: str, chunk_size: int = 100_000) -> int:
+        """
+        Write every validation error as newline-delimited JSON
+
+        Each line is one error with the fields of get_validation_errors
+        plus the rule name: row, column, rule, error, value and
+        valid_options (null for rules without options). Records are built
+        column-wise from the error table and written in chunks, so
+        millions of errors never exist as Python dicts. A ``.gz`` suffix
+        writes gzip.
+
+        Args:
+            path: Output file
+            chunk_size: Errors encoded per write
+
+        Returns:
+            Number of errors written
+        """
+        if self.validation_table is None:
+            self.validate_data(as_frame=True)
+        table = self.validation_table
+
+        with self._stage("write_errors", rows=len(table)), _open_text(path, "w") as f:
+            for start in range(0, len(table), chunk_size):
+                records = self._error_records(table.iloc[start : start + chunk_size])
+                text = records.to_json(orient="records", lines=True, date_format="iso")
+                f.write(text if text.endswith("\n") else text + "\n")
+
+        logger.info(f"Wrote {len(table)} validation errors to {path}")
+        return len(table)
+
+    def _error_records(self, table: pd.DataFrame) -> pd.DataFrame:
+        """Error table with the messages and valid options of get_validation_errors"""
+        rules = table["rule"].astype(object).to_numpy()
+        columns = table["column"].astype(object).to_numpy()
+        values = table["value"].to_numpy(dtype=object)
+        text = np.array([str(v) for v in values], dtype=object)
+
+        errors = np.full(len(table), "Required field is empty", dtype=object)
+        for rule, prefix in (
+            (ValidationRule.INVALID_OPTION, "Invalid option: "),
+            (ValidationRule.INVALID_OPTIONS, "Invalid options: "),
+        ):
+            mask = rules == rule.value
+            errors[mask] = prefix + text[mask]
+        for rule, attribute, label in (
+            (ValidationRule.BELOW_MIN, "min_value", " below minimum "),
+            (ValidationRule.ABOVE_MAX, "max_value", " above maximum "),
+        ):
+            mask = rules == rule.value
+            if mask.any():
+                limits = np.array(
+                    [
+                        str(getattr(self.schema[col], attribute))
+                        for col in columns[mask]
+                    ],
+                    dtype=object,
+                )
+                errors[mask] = "Value " + text[mask] + label + limits
+
+        has_options = np.isin(
+            rules,
+            [ValidationRule.INVALID_OPTION.value, ValidationRule.INVALID_OPTIONS.value],
+        )
+        valid_options = np.full(len(table), None, dtype=object)
+        if has_options.any():
+            for position in np.flatnonzero(has_options):
+                valid_options[position] = list(self.schema[columns[position]].options)
+
+        return pd.DataFrame(
+            {
+                "row": table["row"].to_numpy(),
+                "column": columns,
+                "rule": rules,
+                "error": errors,
+                "value": values,
+                "valid_options": valid_options,
+            }
+        )
+
 
 class UserQuestionnaireProcessor(BaseJCC2Processor):
     """Processor for JCC2 User Questionnaire format"""
@@ -500,79 +4071,67 @@ class UserQuestionnaireProcessor(BaseJCC2Processor):
     def __init__(self, csv_path: str):
         super().__init__(csv_path)
         self.format_type = DataFormat.USER_QUESTIONNAIRE
+        # Built cubes with the data version they were built for
+        self._demographic_cubes: Dict[tuple, Tuple[int, DemographicCube]] = {}
 
+    @_memoized_summary()
     def get_format_specific_summary(self) -> Dict[str, Any]:
         """Get questionnaire-specific summary"""
+        self._ensure_loaded()
         summary = {
             "effectiveness_ratings": {},
             "frequency_distributions": {},
             "section_completion_rates": {},
         }
 
+        data_columns = self._data_columns()
+        n_rows = self._row_count()
+
         # Analyze effectiveness ratings
-        effectiveness_cols = [
-            col
-            for col in self.df.columns
-            if "effectiveness" in col or "effective" in col.lower()
-        ]
+        effectiveness_cols = self.column_index.contains("effective")
 
         for col in effectiveness_cols:
-            if col in self.df.columns:
-                value_counts = self.df[col].value_counts()
-                summary["effectiveness_ratings"][col] = value_counts.to_dict()
+            value_counts = self._value_counts(col)
+            summary["effectiveness_ratings"][col] = value_counts.to_dict()
 
         # Analyze frequency distributions
-        frequency_cols = [col for col in self.df.columns if "frequency" in col.lower()]
+        frequency_cols = self.column_index.contains("frequency")
         for col in frequency_cols:
-            if col in self.df.columns:
-                value_counts = self.df[col].value_counts()
-                summary["frequency_distributions"][col] = value_counts.to_dict()
+            value_counts = self._value_counts(col)
+            summary["frequency_distributions"][col] = value_counts.to_dict()
 
         # Calculate section completion rates
         for section_name, columns in self.sections.items():
             non_null_counts = [
-                self.df[col].notna().sum() for col in columns if col in self.df.columns
+                self._non_null_count(col) for col in columns if col in data_columns
             ]
             if non_null_counts:
-                avg_completion = (
-                    np.mean(non_null_counts) / len(self.df) if len(self.df) > 0 else 0
-                )
+                avg_completion = np.mean(non_null_counts) / n_rows if n_rows > 0 else 0
                 summary["section_completion_rates"][section_name] = avg_completion
 
         return summary
 
     def prepare_format_specific_visualizations(self) -> Dict[str, Any]:
         """Prepare questionnaire-specific visualizations"""
+        self._ensure_loaded()
         viz_data = {}
 
         # Effectiveness heatmap data
-        effectiveness_cols = [
-            col
-            for col in self.df.columns
-            if "effectiveness" in col or "effective" in col.lower()
-        ]
+        effectiveness_cols = self.column_index.contains("effective")
 
         if effectiveness_cols:
             effectiveness_data = self.df[effectiveness_cols].copy()
 
             # Map text ratings to numeric values
-            rating_map = {
-                "Completely Ineffective": 1,
-                "Moderately Ineffective": 2,
-                "Slightly Ineffective": 3,
-                "Slightly Effective": 4,
-                "Moderately Effective": 5,
-                "Completely Effective": 6,
-                "Not Applicable": np.nan,
-            }
-
             for col in effectiveness_cols:
-                effectiveness_data[col] = effectiveness_data[col].map(rating_map)
+                effectiveness_data[col] = (
+                    effectiveness_data[col].map(EFFECTIVENESS_RATINGS).astype(float)
+                )
 
             viz_data["effectiveness_heatmap"] = effectiveness_data
 
         # Frequency bar charts data
-        frequency_cols = [col for col in self.df.columns if "frequency" in col.lower()]
+        frequency_cols = self.column_index.contains("frequency")
         if frequency_cols:
             viz_data["frequency_data"] = self.df[frequency_cols].copy()
 
@@ -595,23 +4154,31 @@ class UserQuestionnaireProcessor(BaseJCC2Processor):
         Returns:
             NPS score (-100 to 100) or None if data not available
         """
+        recommend_field = RECOMMEND_FIELD
+
+        use_profile = False
         if df is None:
+            self._ensure_loaded([recommend_field])
             df = self.df
+            # Streamed and refreshed data keep a running distribution
+            use_profile = self._has_current_profile()
 
-        if df is None:
+        if df is None and not use_profile:
             logger.warning("No data loaded for NPS calculation")
             return None
 
-        # Check for recommendation field
-        recommend_field = "overall_system_suitability_eval.recommend_jcc2"
-        if recommend_field not in df.columns:
+        columns = self._data_columns() if use_profile else df.columns
+        if recommend_field not in columns:
             logger.warning(
                 f"Recommendation field '{recommend_field}' not found in data"
             )
             return None
 
         # Get value counts
-        rec_counts = df[recommend_field].value_counts()
+        if use_profile:
+            rec_counts = self._value_counts(recommend_field)
+        else:
+            rec_counts = df[recommend_field].value_counts()
         total_responses = rec_counts.sum()
 
         if total_responses == 0:
@@ -635,8 +4202,10 @@ class UserQuestionnaireProcessor(BaseJCC2Processor):
         return nps_score
 
     def calculate_sus_scores(
-        self, df: Optional[pd.DataFrame] = None
-    ) -> Optional[List[float]]:
+        self,
+        df: Optional[pd.DataFrame] = None,
+        group_by: Optional[GroupKey] = None,
+    ) -> Optional[Union[pd.Series, pd.DataFrame]]:
         """
         Calculate System Usability Scale (SUS) scores
 
@@ -645,13 +4214,30 @@ class UserQuestionnaireProcessor(BaseJCC2Processor):
         - For even questions (2,4,6,8,10): score = 5 - scale position
         - Total SUS score = sum of scores * 2.5 (to get 0-100 scale)
 
+        All respondents are scored in one matrix operation over the 10 SUS
+        columns. Respondents who did not answer all 10 questions get NaN.
+
         Args:
             df: DataFrame to use (defaults to self.df)
+            group_by: Optional grouping key (column name, Series, boolean
+                membership DataFrame, or a list of these). When given, SUS
+                count/mean/std per group are returned instead of the
+                per-respondent scores.
 
         Returns:
-            List of SUS scores for each valid response or None if data not available
+            Series of SUS scores aligned to the DataFrame index, a DataFrame
+            of per-group statistics when group_by is given, or None if data
+            not available
         """
         if df is None:
+            self._ensure_loaded(
+                [
+                    f
+                    for f in self.schema
+                    if f.startswith("overall_system_usability.sus_")
+                ]
+            )
+            self._ensure_group_columns(group_by)
             df = self.df
 
         if df is None:
@@ -670,58 +4256,274 @@ class UserQuestionnaireProcessor(BaseJCC2Processor):
         # Sort fields to ensure correct order (sus_1 through sus_10)
         sus_fields.sort(key=lambda x: int(x.split("sus_")[-1]))
 
-        sus_scores = []
+        responses = np.column_stack(
+            [_to_float_array(df[field]) for field in sus_fields]
+        )
+
+        # Odd questions score (value - 1), even questions score (5 - value)
+        signs = np.tile([1.0, -1.0], 5)
+        offsets = np.tile([-1.0, 5.0], 5)
+        item_scores = responses * signs + offsets
+
+        # Only score respondents who answered all 10 questions
+        complete = ~np.isnan(responses).any(axis=1)
+        scores = np.where(complete, item_scores.sum(axis=1) * 2.5, np.nan)
+        sus_scores = pd.Series(scores, index=df.index, name="sus_score")
 
-        # Calculate SUS score for each row
-        for idx, row in df.iterrows():
-            row_score = 0
-            valid_responses = 0
+        if not complete.any():
+            logger.warning("No complete SUS responses found")
+            return None
 
-            for i, field in enumerate(sus_fields):
-                value = row[field]
+        logger.info(
+            f"Calculated {int(complete.sum())} SUS scores, average: {np.nanmean(scores):.1f}"
+        )
 
-                if pd.notna(value) and isinstance(value, (int, float)):
-                    # Convert to numeric if string
-                    try:
-                        value = float(value)
-                    except:
-                        continue
+        if group_by is not None:
+            return _grouped_stats(sus_scores, _group_indicators(df, group_by))
 
-                    # Apply SUS scoring rules
-                    if (i + 1) % 2 == 1:  # Odd questions (1,3,5,7,9)
-                        score = value - 1
-                    else:  # Even questions (2,4,6,8,10)
-                        score = 5 - value
+        return sus_scores
 
-                    row_score += score
-                    valid_responses += 1
+    def get_demographic_cube(
+        self,
+        dimensions: Optional[GroupKey] = None,
+        scale: Optional[Dict[str, float]] = None,
+    ) -> DemographicCube:
+        """
+        Aggregate ratings, NPS and SUS per demographic group in one pass
 
-            # Only calculate if all 10 questions were answered
-            if valid_responses == 10:
-                sus_score = row_score * 2.5  # Convert to 0-100 scale
-                sus_scores.append(sus_score)
+        Args:
+            dimensions: Grouping key accepted by calculate_sus_scores (default:
+                the DEMOGRAPHIC_FIELDS present in the data). With
+                MultiDatasetProcessor.pooled, include "dataset" to break
+                every slice down by dataset as well.
+            scale: Label to score map for rating fields (default:
+                EFFECTIVENESS_RATINGS)
 
-        if not sus_scores:
-            logger.warning("No complete SUS responses found")
+        Returns:
+            DemographicCube over the loaded rows
+        """
+        scale = EFFECTIVENESS_RATINGS if scale is None else scale
+        if dimensions is None:
+            data_columns = self._data_columns()
+            dimensions = [col for col in DEMOGRAPHIC_FIELDS if col in data_columns]
+        keys = dimensions if isinstance(dimensions, list) else [dimensions]
+        cache_key = None
+        if all(isinstance(key, str) for key in keys):
+            cache_key = (tuple(keys), tuple(scale.items()))
+            cached = self._demographic_cubes.get(cache_key)
+            if (
+                cached is not None
+                and cached[0] == self._data_version
+                and cached[1].index is self.df.index
+            ):
+                return cached[1]
+
+        fields = [
+            col for columns in self._rating_fields(scale).values() for col in columns
+        ]
+        self._ensure_loaded(fields + [RECOMMEND_FIELD])
+        self._ensure_group_columns(keys)
+        if self.df is None:
+            raise ValueError(
+                "The demographic cube needs row-level data; load without chunksize"
+            )
+
+        with self._stage("demographic_cube", rows=len(self.df), columns=len(fields)):
+            ratings = self._rating_scores(fields, scale)
+            recommend = self.df.get(RECOMMEND_FIELD)
+            sus_scores = self._sus_scores()
+            cube = DemographicCube.build(
+                _group_indicators(self.df, keys), ratings, recommend, sus_scores
+            )
+
+        if cache_key is not None:
+            self._demographic_cubes[cache_key] = (self._data_version, cube)
+        return cube
+
+    def _rating_scores(
+        self, fields: List[str], scale: Dict[str, float]
+    ) -> pd.DataFrame:
+        """Respondent x field scores on scale (NaN if unrated or not scored)"""
+        scores = {}
+        for col in fields:
+            values = self.df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Score each category once and look the codes up
+                lookup = np.append(
+                    [scale.get(label, np.nan) for label in values.cat.categories],
+                    np.nan,
+                ).astype(float)
+                scores[col] = lookup[values.cat.codes.to_numpy()]
+            else:
+                scores[col] = _to_float_array(values.map(scale))
+        return pd.DataFrame(scores, index=self.df.index, columns=fields)
+
+    def _sus_scores(self) -> Optional[pd.Series]:
+        """Per-respondent SUS scores, or None when the SUS fields are absent"""
+        sus_fields = [
+            f for f in self.df.columns if f.startswith("overall_system_usability.sus_")
+        ]
+        if len(sus_fields) != 10:
             return None
+        return self.calculate_sus_scores()
+
+    def bootstrap_metrics(
+        self,
+        group_by: Optional[GroupKey] = None,
+        n_draws: int = 1000,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+        strata: Optional[str] = None,
+        rating_fields: Optional[List[str]] = None,
+        scale: Optional[Dict[str, float]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Bootstrap confidence intervals for mean rating, NPS and SUS
 
-        logger.info(
-            f"Calculated {len(sus_scores)} SUS scores, average: {np.mean(sus_scores):.1f}"
+        Every metric is a ratio of per-respondent sums (rating score sum over
+        rating count, promoters minus detractors over recommendation answers,
+        SUS score over complete SUS responses), so all metrics for all groups
+        are evaluated on the same resamples, see _bootstrap_ratios.
+
+        Args:
+            group_by: Optional grouping key accepted by calculate_sus_scores;
+                an ("all", "all") group of every respondent is always included
+            n_draws: Number of bootstrap resamples
+            confidence: Two-sided percentile interval level
+            seed: Random seed; the same seed gives the same intervals
+            strata: Column to resample within (e.g. "dataset" or the event),
+                keeping each stratum's size fixed
+            rating_fields: Rating fields pooled into the mean rating
+                (default: every field answered on scale)
+            scale: Label to score map (default: EFFECTIVENESS_RATINGS)
+
+        Returns:
+            DataFrame indexed by (metric, grouping, group) with estimate,
+            lower, upper, std_error and n (responses behind the estimate),
+            or None if there is no rating, NPS or SUS data
+        """
+        scale = EFFECTIVENESS_RATINGS if scale is None else scale
+        if rating_fields is None:
+            rating_fields = [
+                col
+                for columns in self._rating_fields(scale).values()
+                for col in columns
+            ]
+        keys = (
+            []
+            if group_by is None
+            else (group_by if isinstance(group_by, list) else [group_by])
         )
+        self._ensure_loaded(
+            list(rating_fields) + [RECOMMEND_FIELD] + ([strata] if strata else [])
+        )
+        self._ensure_group_columns(keys)
+        if self.df is None:
+            raise ValueError(
+                "Bootstrap intervals need row-level data; load without chunksize"
+            )
 
-        return sus_scores
+        # Per-respondent numerator and denominator of each metric
+        metrics = {}
+        if rating_fields:
+            ratings = self._rating_scores(list(rating_fields), scale).to_numpy(
+                dtype=float
+            )
+            metrics["rating"] = (
+                np.nansum(ratings, axis=1),
+                (~np.isnan(ratings)).sum(axis=1),
+            )
+        if RECOMMEND_FIELD in self.df.columns:
+            answers = self.df[RECOMMEND_FIELD].to_numpy(dtype=object)
+            metrics["nps"] = (
+                100.0 * ((answers == "Yes").astype(float) - (answers == "No")),
+                pd.notna(answers).astype(float),
+            )
+        sus_scores = self._sus_scores()
+        if sus_scores is not None:
+            sus = sus_scores.to_numpy(dtype=float)
+            metrics["sus"] = (np.nan_to_num(sus), (~np.isnan(sus)).astype(float))
+        if not metrics:
+            logger.warning("No rating, NPS or SUS data to bootstrap")
+            return None
+
+        everyone = pd.DataFrame(
+            True,
+            index=self.df.index,
+            columns=pd.MultiIndex.from_tuples(
+                [DemographicCube.ALL], names=["grouping", "group"]
+            ),
+        )
+        indicators = (
+            pd.concat([everyone, _group_indicators(self.df, keys)], axis=1)
+            if keys
+            else everyone
+        )
+        membership = indicators.to_numpy(dtype=float)
+
+        # One numerator and denominator column per (metric, group)
+        numerators = np.hstack(
+            [num[:, None] * membership for num, _ in metrics.values()]
+        )
+        denominators = np.hstack(
+            [den[:, None] * membership for _, den in metrics.values()]
+        )
+        strata_codes = (
+            None
+            if strata is None
+            else pd.factorize(self.df[strata], use_na_sentinel=False)[0]
+        )
+
+        with self._stage("bootstrap", rows=len(self.df), columns=numerators.shape[1]):
+            replicates = _bootstrap_ratios(
+                numerators,
+                denominators,
+                n_draws,
+                np.random.default_rng(seed),
+                strata_codes,
+            )
+
+        totals = denominators.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            estimate = numerators.sum(axis=0) / totals
+        alpha = (1 - confidence) / 2
+        with warnings.catch_warnings():
+            # Groups without responses have all-NaN replicates
+            warnings.simplefilter("ignore", RuntimeWarning)
+            lower, upper = np.nanquantile(replicates, [alpha, 1 - alpha], axis=0)
+            std_error = np.nanstd(replicates, axis=0, ddof=1)
+
+        index = pd.MultiIndex.from_tuples(
+            [(metric, *group) for metric in metrics for group in indicators.columns],
+            names=["metric", "grouping", "group"],
+        )
+        return pd.DataFrame(
+            {
+                "estimate": estimate,
+                "lower": lower,
+                "upper": upper,
+                "std_error": std_error,
+                "n": totals.astype(np.int64),
+            },
+            index=index,
+        )
 
 
 class DataCollectionProcessor(BaseJCC2Processor):
     """Processor for JCC2 Data Collection and Interview format"""
 
+    # Task section fields cross-tabulated against task_performance
+    CONTINGENCY_FACTORS = ("task_workaround", "problem_occurrence", "task_outcome")
+
     def __init__(self, csv_path: str):
         super().__init__(csv_path)
         self.format_type = DataFormat.DATA_COLLECTION
         self.task_performance_data: Dict[str, pd.DataFrame] = {}
 
+    @_memoized_summary()
     def get_format_specific_summary(self) -> Dict[str, Any]:
         """Get data collection-specific summary"""
+        self._ensure_loaded()
         summary = {
             "task_performance_metrics": {},
             "workaround_analysis": {},
@@ -736,31 +4538,25 @@ class DataCollectionProcessor(BaseJCC2Processor):
                 if section_metrics:
                     summary["task_performance_metrics"][section_name] = section_metrics
 
+        data_columns = self._data_columns()
+
         # Analyze workarounds
-        workaround_cols = [
-            col for col in self.df.columns if "workaround" in col.lower()
-        ]
-        for col in workaround_cols:
-            if col in self.df.columns and "details" not in col:
-                value_counts = self.df[col].value_counts()
-                summary["workaround_analysis"][col] = {
-                    "yes_count": int(value_counts.get("Yes", 0)),
-                    "no_count": int(value_counts.get("No", 0)),
-                    "na_count": int(value_counts.get("N/A", 0)),
-                }
+        for col in self.column_index.contains("workaround", exclude="details"):
+            value_counts = self._value_counts(col)
+            summary["workaround_analysis"][col] = {
+                "yes_count": int(value_counts.get("Yes", 0)),
+                "no_count": int(value_counts.get("No", 0)),
+                "na_count": int(value_counts.get("N/A", 0)),
+            }
 
         # Analyze problem occurrences
-        problem_cols = [
-            col for col in self.df.columns if "problem_occurrence" in col.lower()
-        ]
-        for col in problem_cols:
-            if col in self.df.columns and "details" not in col:
-                value_counts = self.df[col].value_counts()
-                summary["problem_occurrence_rates"][col] = value_counts.to_dict()
+        for col in self.column_index.contains("problem_occurrence", exclude="details"):
+            value_counts = self._value_counts(col)
+            summary["problem_occurrence_rates"][col] = value_counts.to_dict()
 
         # Summarize datatable fields
         for field_name, field_schema in self.datatable_fields.items():
-            if field_name in self.df.columns:
+            if field_name in data_columns:
                 dt_summary = self._summarize_datatable_field(field_name)
                 if dt_summary:
                     summary["datatable_summaries"][field_name] = dt_summary
@@ -774,9 +4570,10 @@ class DataCollectionProcessor(BaseJCC2Processor):
         metrics = {}
 
         # Look for performance columns
+        data_columns = self._data_columns()
         perf_col = f"{section_name}.task_performance"
-        if perf_col in columns and perf_col in self.df.columns:
-            value_counts = self.df[perf_col].value_counts()
+        if perf_col in columns and perf_col in data_columns:
+            value_counts = self._value_counts(perf_col)
             metrics["performance_distribution"] = value_counts.to_dict()
 
             # Calculate success rate
@@ -787,18 +4584,21 @@ class DataCollectionProcessor(BaseJCC2Processor):
 
         # Look for outcome columns
         outcome_col = f"{section_name}.task_outcome"
-        if outcome_col in columns and outcome_col in self.df.columns:
-            value_counts = self.df[outcome_col].value_counts()
+        if outcome_col in columns and outcome_col in data_columns:
+            value_counts = self._value_counts(outcome_col)
             metrics["outcome_distribution"] = value_counts.to_dict()
 
         return metrics
 
     def _summarize_datatable_field(self, field_name: str) -> Dict[str, Any]:
         """Summarize a datatable field"""
+        if self.df is None and self.profile is not None:
+            return self.profile.datatable_summary(field_name)
+
         summary = {"total_entries": 0, "avg_rows_per_entry": 0, "column_summaries": {}}
 
         valid_datatables = []
-        for dt in self.df[field_name].dropna():
+        for dt in self.get_datatable(field_name).dropna():
             if isinstance(dt, dict) and "rows" in dt:
                 valid_datatables.append(dt)
                 summary["total_entries"] += 1
@@ -821,6 +4621,7 @@ class DataCollectionProcessor(BaseJCC2Processor):
 
     def prepare_format_specific_visualizations(self) -> Dict[str, Any]:
         """Prepare data collection-specific visualizations"""
+        self._ensure_loaded()
         viz_data = {}
 
         # Task performance success rates
@@ -829,7 +4630,7 @@ class DataCollectionProcessor(BaseJCC2Processor):
             if section_name.startswith(("mop", "mos")):
                 perf_col = f"{section_name}.task_performance"
                 if perf_col in self.df.columns:
-                    value_counts = self.df[perf_col].value_counts()
+                    value_counts = self._value_counts(perf_col)
                     yes_count = value_counts.get("Yes", 0)
                     total_valid = sum(value_counts.get(val, 0) for val in ["Yes", "No"])
                     if total_valid > 0:
@@ -846,25 +4647,65 @@ class DataCollectionProcessor(BaseJCC2Processor):
 
         # Workaround frequency
         workaround_data = []
-        for col in self.df.columns:
-            if "workaround" in col.lower() and "details" not in col:
-                value_counts = self.df[col].value_counts()
-                if "Yes" in value_counts:
-                    workaround_data.append(
-                        {
-                            "field": col,
-                            "workaround_count": int(value_counts["Yes"]),
-                            "total_responses": int(value_counts.sum()),
-                        }
-                    )
+        for col in self.column_index.contains("workaround", exclude="details"):
+            value_counts = self._value_counts(col)
+            if "Yes" in value_counts:
+                workaround_data.append(
+                    {
+                        "field": col,
+                        "workaround_count": int(value_counts["Yes"]),
+                        "total_responses": int(value_counts.sum()),
+                    }
+                )
 
         if workaround_data:
             viz_data["workaround_frequency"] = pd.DataFrame(workaround_data)
 
         return viz_data
 
+    @_memoized_summary()
+    def get_contingency_tables(
+        self, factors: Optional[Tuple[str, ...]] = None
+    ) -> ContingencyTables:
+        """
+        Cross-tabulate task section fields against task_performance
+
+        Tables for every mop/mos section and factor are counted in one pass
+        over the encoded columns, see ContingencyTables.
+
+        Args:
+            factors: Task section fields to cross with task_performance
+                (default: CONTINGENCY_FACTORS)
+
+        Returns:
+            ContingencyTables labelled (section, factor)
+
+        Raises:
+            ValueError: If the file was streamed, so no row-level data is kept
+        """
+        factors = self.CONTINGENCY_FACTORS if factors is None else tuple(factors)
+        data_columns = self._data_columns()
+        pairs = {}
+        for section_name in self.sections:
+            if not section_name.startswith(("mop", "mos")):
+                continue
+            perf_col = f"{section_name}.task_performance"
+            for factor in factors:
+                factor_col = f"{section_name}.{factor}"
+                if perf_col in data_columns and factor_col in data_columns:
+                    pairs[(section_name, factor)] = (factor_col, perf_col)
+
+        self._ensure_loaded(sorted({col for pair in pairs.values() for col in pair}))
+        if self.df is None:
+            raise ValueError(
+                "Contingency tables need row-level data; load without chunksize"
+            )
+        with self._stage("contingency", rows=len(self.df), columns=len(pairs)):
+            return ContingencyTables.from_frame(self.df, pairs)
+
     def analyze_performance_patterns(self) -> Dict[str, Any]:
         """Analyze performance patterns across tasks"""
+        self._ensure_loaded()
         patterns = {
             "task_success_rates": {},
             "workaround_correlations": {},
@@ -882,21 +4723,37 @@ class DataCollectionProcessor(BaseJCC2Processor):
                         "success_rate"
                     ]
 
-        # Analyze workaround impact on success
-        for section_name in self.sections:
-            perf_col = f"{section_name}.task_performance"
-            work_col = f"{section_name}.task_workaround"
-
-            if perf_col in self.df.columns and work_col in self.df.columns:
-                # Create contingency table
-                ct = pd.crosstab(self.df[work_col], self.df[perf_col])
+        # Analyze workaround and problem impact on success
+        tables = self.get_contingency_tables()
+        chi_square = tables.chi_square()
+        fisher = tables.fisher_exact()
+        for section_name, factor in tables.keys:
+            tests = {
+                "chi2": float(chi_square.at[(section_name, factor), "chi2"]),
+                "chi2_p_value": float(chi_square.at[(section_name, factor), "p_value"]),
+                "odds_ratio": float(fisher.at[(section_name, factor), "odds_ratio"]),
+                "fisher_p_value": float(fisher.at[(section_name, factor), "p_value"]),
+            }
+            if factor == "task_workaround":
+                ct = tables.table(section_name, factor)
                 if "Yes" in ct.index and "Yes" in ct.columns:
                     patterns["workaround_correlations"][section_name] = {
                         "workaround_success_rate": ct.loc["Yes", "Yes"]
                         / ct.loc["Yes"].sum()
                         if ct.loc["Yes"].sum() > 0
-                        else 0
+                        else 0,
+                        **tests,
                     }
+            elif factor == "problem_occurrence":
+                patterns["problem_impact_analysis"][section_name] = {
+                    "success_rate_with_problem": float(
+                        fisher.at[(section_name, factor), "rate_given_positive"]
+                    ),
+                    "success_rate_without_problem": float(
+                        fisher.at[(section_name, factor), "rate_given_negative"]
+                    ),
+                    **tests,
+                }
 
         return patterns
 
@@ -939,68 +4796,462 @@ def create_processor(csv_path: str) -> BaseJCC2Processor:
         return UserQuestionnaireProcessor(csv_path)
 
 
-def main():
-    """Main execution function"""
-    # Example usage - automatically detect format
-    csv_file = "mock_20_jcc2_user_questionnaire.csv"
+def _load_processor(csv_path: str, use_cache: bool) -> BaseJCC2Processor:
+    """Create and load a processor (module-level so a process pool can run it)"""
+    processor = create_processor(csv_path)
+    processor.load_data(use_cache=use_cache)
+    return processor
+
+
+class MultiDatasetProcessor:
+    """
+    Loads several JCC2 exports of the same format and analyzes them together
+
+    Files are loaded in parallel, checked for schema compatibility and
+    stacked into one combined frame with a dataset key column. Any
+    processor method can be run pooled over the combined data or once per
+    dataset; attributes not defined here are looked up on the pooled
+    processor.
+    """
+
+    DATASET_COLUMN = "dataset"
+
+    def __init__(
+        self,
+        csv_paths: Union[Dict[str, str], List[str]],
+        max_workers: Optional[int] = None,
+    ):
+        if not isinstance(csv_paths, dict):
+            csv_paths = {Path(path).stem: path for path in csv_paths}
+        self.csv_paths: Dict[str, Path] = {
+            name: Path(path) for name, path in csv_paths.items()
+        }
+        self.max_workers = max_workers
+        self.processors: Dict[str, BaseJCC2Processor] = {}
+        self.pooled_processor: Optional[BaseJCC2Processor] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes missing on this object
+        pooled = self.__dict__.get("pooled_processor")
+        if pooled is None:
+            raise AttributeError(name)
+        return getattr(pooled, name)
+
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """Combined frame of all datasets with a dataset key column"""
+        return self.pooled_processor.df if self.pooled_processor else None
+
+    def load_data(self, use_cache: bool = False) -> pd.DataFrame:
+        """
+        Load all datasets in parallel and build the combined frame
+
+        Args:
+            use_cache: Passed through to each processor's load_data
+
+        Returns:
+            Combined DataFrame with a dataset key column
+        """
+        names = list(self.csv_paths)
+        logger.info(f"Loading {len(names)} datasets: {names}")
+
+        if len(names) > 1 and self.max_workers != 1:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {
+                    name: pool.submit(
+                        _load_processor, str(self.csv_paths[name]), use_cache
+                    )
+                    for name in names
+                }
+                self.processors = {name: futures[name].result() for name in names}
+        else:
+            self.processors = {
+                name: _load_processor(str(self.csv_paths[name]), use_cache)
+                for name in names
+            }
+
+        self.check_schema_compatibility()
+        self.pooled_processor = self._combine()
+        return self.pooled_processor.df
+
+    def refresh(self) -> Dict[str, Dict[str, int]]:
+        """
+        Refresh every dataset from its CSV and rebuild the combined frame
+
+        Each dataset is refreshed on its own columns, reading only its new
+        and changed rows (see BaseJCC2Processor.refresh); the combined frame
+        and pooled processor are then built again from the results.
+
+        Falls back to load_data() when nothing is loaded yet.
+
+        Returns:
+            Counts of new, changed, removed and unchanged rows per dataset
+        """
+        if self.pooled_processor is None:
+            self.load_data()
+            return {
+                name: {
+                    "new": processor._row_count(),
+                    "changed": 0,
+                    "removed": 0,
+                    "unchanged": 0,
+                }
+                for name, processor in self.processors.items()
+            }
+
+        counts = {
+            name: processor.refresh() for name, processor in self.processors.items()
+        }
+
+        self.check_schema_compatibility()
+        self.pooled_processor = self._combine()
+        return counts
+
+    def check_schema_compatibility(self) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Check that all loaded datasets can be analyzed together
+
+        Datasets must share a format and agree on the type of every common
+        field. Columns present in only some datasets are allowed and are
+        reported; they are empty for the other datasets in the combined
+        frame.
+
+        Returns:
+            Per-dataset lists of missing and extra columns relative to the
+            first dataset
 
-    # Create appropriate processor based on format
-    processor = create_processor(csv_file)
+        Raises:
+            ValueError: If formats or field types conflict
+        """
+        names = list(self.processors)
+        reference = self.processors[names[0]]
+        report = {}
+
+        for name in names[1:]:
+            processor = self.processors[name]
+            if processor.format_type != reference.format_type:
+                raise ValueError(
+                    f"Dataset '{name}' is {processor.format_type.value}, "
+                    f"expected {reference.format_type.value}"
+                )
 
-    # Load and process data
-    df = processor.load_data()
-    print(f"Loaded data shape: {df.shape}")
+            conflicts = [
+                col
+                for col, field_schema in processor.schema.items()
+                if col in reference.schema
+                and field_schema.field_type != reference.schema[col].field_type
+            ]
+            if conflicts:
+                raise ValueError(
+                    f"Dataset '{name}' has conflicting field types for: {conflicts[:10]}"
+                )
 
-    # Validate data
-    errors = processor.validate_data()
-    print(f"Validation errors: {len(errors)}")
+            missing = [col for col in reference.schema if col not in processor.schema]
+            extra = [col for col in processor.schema if col not in reference.schema]
+            report[name] = {"missing_columns": missing, "extra_columns": extra}
+            if missing or extra:
+                logger.warning(
+                    f"Dataset '{name}' has {len(missing)} missing and {len(extra)} "
+                    "extra columns compared to the first dataset"
+                )
 
-    # Get section summaries
-    print("\n=== Section Summaries ===")
-    for section_name in list(processor.sections.keys())[:3]:  # First 3 sections
-        summary = processor.get_section_summary(section_name)
-        print(f"\nSection: {section_name}")
-        print(f"Total fields: {summary['total_fields']}")
+        return report
 
-    # Analyze application patterns
-    print("\n=== Application Patterns ===")
-    app_patterns = processor.analyze_application_patterns()
-    for app, pattern in list(app_patterns.items())[:5]:  # First 5 apps
-        print(
-            f"\n{app}: {pattern['total_fields']} fields, "
-            f"{pattern.get('avg_responses', 0):.1f} avg responses"
+    def _combine(self) -> BaseJCC2Processor:
+        """Stack all datasets into one pooled processor"""
+        names = list(self.processors)
+        first = self.processors[names[0]]
+        common_dir = os.path.commonpath(
+            [str(path.resolve().parent) for path in self.csv_paths.values()]
         )
+        pooled = type(first)(common_dir)
 
-    # Prepare visualization data
-    viz_data = processor.prepare_visualization_data()
-    print("\n=== Visualization Data Prepared ===")
-    for key, data in viz_data.items():
-        print(f"{key}: {data.shape if hasattr(data, 'shape') else len(data)} records")
+        # Union of schemas, keeping the first dataset's column order
+        for processor in self.processors.values():
+            for col, field_schema in processor.schema.items():
+                if col in pooled.schema:
+                    continue
+                pooled.schema[col] = field_schema
+                if field_schema.section:
+                    pooled.sections[field_schema.section].append(col)
+                else:
+                    pooled.system_columns.append(col)
+            pooled.datatable_fields.update(processor.datatable_fields)
+            pooled._pending_datatables |= processor._pending_datatables
+        pooled.system_columns.append(self.DATASET_COLUMN)
+
+        frames = [self.processors[name].df for name in names]
+        combined = pd.concat(frames, ignore_index=True)
+        combined.index = pd.RangeIndex(1, len(combined) + 1)
+        combined.insert(
+            0,
+            self.DATASET_COLUMN,
+            pd.Categorical(
+                np.repeat(names, [len(frame) for frame in frames]), categories=names
+            ),
+        )
+        pooled.df = combined
+        pooled._build_multi_choice()
+
+        # Share decoded datatable payloads across all datasets
+        for processor in self.processors.values():
+            processor._datatable_cache = pooled._datatable_cache
+
+        # Point each dataset's processor at its own rows and columns of the
+        # combined frame, under its own row labels, so per-dataset results
+        # match a standalone load of the file
+        start = 0
+        for name, frame in zip(names, frames):
+            rows = combined.iloc[start : start + len(frame)][frame.columns]
+            rows.index = frame.index
+            self.processors[name].df = rows
+            start += len(frame)
 
-    # Format-specific visualizations
-    format_viz = processor.prepare_format_specific_visualizations()
-    print("\n=== Format-Specific Visualizations ===")
-    for key, data in format_viz.items():
-        print(f"{key}: {data.shape if hasattr(data, 'shape') else len(data)} records")
+        logger.info(
+            f"Combined {len(names)} datasets into {len(combined)} rows "
+            f"and {len(combined.columns)} columns"
+        )
+        return pooled
 
-    # Export summary
-    output_filename = f"jcc2_{processor.format_type.value}_summary.json"
-    processor.export_summary(output_filename)
+    def per_dataset(self, method: str, *args, **kwargs) -> Dict[str, Any]:
+        """Run a processor method separately on each dataset"""
+        return {
+            name: getattr(processor, method)(*args, **kwargs)
+            for name, processor in self.processors.items()
+        }
 
-    # Handle format-specific analysis
-    if isinstance(processor, DataCollectionProcessor):
-        print("\n=== Performance Analysis ===")
-        perf_patterns = processor.analyze_performance_patterns()
-        print(
-            f"Task success rates: {len(perf_patterns['task_success_rates'])} tasks analyzed"
+    def pooled(self, method: str, *args, **kwargs) -> Any:
+        """Run a processor method on the combined data of all datasets"""
+        return getattr(self.pooled_processor, method)(*args, **kwargs)
+
+
+def expand_inputs(inputs: List[str]) -> List[Path]:
+    """
+    CSV files named by a list of files, directories and glob patterns
+
+    Directories contribute the CSV files directly inside them. Files are
+    returned once each, in the order they were first named.
+    """
+    paths: List[Path] = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            paths.extend(sorted(path.glob("*.csv")))
+        elif path.exists():
+            paths.append(path)
+        else:
+            matches = sorted(Path(match) for match in glob.glob(item, recursive=True))
+            if not matches:
+                logger.warning(f"No files match '{item}'")
+            paths.extend(match for match in matches if match.is_file())
+    return list(dict.fromkeys(paths))
+
+
+def _summarize_export(
+    csv_path: str,
+    output_path: str,
+    use_cache: bool,
+    compact: bool = False,
+    errors_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Load, validate and export one file for process_exports
+
+    Module-level so a process pool can run it. Errors are returned in the
+    result rather than raised so one bad file does not stop a batch.
+    """
+    start = time.perf_counter()
+    result: Dict[str, Any] = {"file": csv_path}
+    try:
+        result["format"] = detect_format(csv_path).value
+        processor = create_processor(csv_path)
+        processor.load_data(use_cache=use_cache)
+        processor.validate_data(as_frame=True)
+        processor.export_summary(output_path, compact=compact, errors_path=errors_path)
+        result.update(
+            status="ok",
+            summary=Path(output_path).name,
+            errors=Path(errors_path).name if errors_path else None,
+            rows=processor._row_count(),
+            columns=len(processor._data_columns()),
+            validation_errors=len(processor.validation_table),
         )
-        print(
-            f"Workaround correlations: {len(perf_patterns['workaround_correlations'])} correlations found"
+    except Exception as e:
+        logger.error(f"Failed to process {csv_path}: {e}")
+        result.update(status="error", error=f"{type(e).__name__}: {e}")
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def process_exports(
+    csv_paths: List[Union[str, Path]],
+    output_dir: Union[str, Path],
+    max_workers: Optional[int] = None,
+    use_cache: bool = False,
+    compact: bool = False,
+    gzip_output: bool = False,
+    write_errors: bool = False,
+) -> Dict[str, Any]:
+    """
+    Write a summary for each export, processing files in parallel
+
+    Each file's format is detected on its own, so questionnaire and data
+    collection exports can be mixed. Every file gets
+    ``<name>_summary.json`` in output_dir, and ``index.json`` lists the
+    outcome of every file, including the error of files that failed.
+
+    Args:
+        csv_paths: Export files to process
+        output_dir: Directory for the summaries and the index (created if
+            missing)
+        max_workers: Worker processes (default: one per core; 1 processes
+            files in this process)
+        use_cache: Passed through to each processor's load_data
+        compact: Write summaries without indentation
+        gzip_output: Write ``.json.gz`` summaries (and ``.ndjson.gz`` errors)
+        write_errors: Also write every validation error to
+            ``<name>_errors.ndjson``
+
+    Returns:
+        The index written to ``index.json``
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Files with the same name in different directories get numbered summaries
+    outputs = {}
+    used = Counter()
+    extension = ".gz" if gzip_output else ""
+    for path in csv_paths:
+        stem = Path(path).stem
+        used[stem] += 1
+        name = f"{stem}_{used[stem]}" if used[stem] > 1 else stem
+        outputs[str(path)] = (
+            str(output_dir / f"{name}_summary.json{extension}"),
+            (
+                str(output_dir / f"{name}_errors.ndjson{extension}")
+                if write_errors
+                else None
+            ),
         )
 
-    # Return the main dataframe and processor for further use
-    return df, processor
+    logger.info(f"Processing {len(outputs)} exports into {output_dir}")
+    if len(outputs) > 1 and max_workers != 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                path: pool.submit(
+                    _summarize_export, path, output, use_cache, compact, errors
+                )
+                for path, (output, errors) in outputs.items()
+            }
+            results = []
+            for path, future in futures.items():
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # The worker process itself died (e.g. out of memory)
+                    logger.error(f"Failed to process {path}: {e}")
+                    results.append(
+                        {
+                            "file": path,
+                            "status": "error",
+                            "error": f"{type(e).__name__}: {e}",
+                        }
+                    )
+    else:
+        results = [
+            _summarize_export(path, output, use_cache, compact, errors)
+            for path, (output, errors) in outputs.items()
+        ]
+
+    failed = sum(result["status"] != "ok" for result in results)
+    index = {
+        "generated_at": datetime.now().isoformat(),
+        "processor_version": PROCESSOR_VERSION,
+        "total_files": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "files": results,
+    }
+    with open(output_dir / "index.json", "w") as f:
+        json.dump(index, f, indent=2, default=str)
+
+    logger.info(f"Processed {len(results) - failed} of {len(results)} exports")
+    return index
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: summarize a batch of exports"""
+    parser = argparse.ArgumentParser(
+        description="Write a JSON summary for each JCC2 CSV export plus an index.json"
+    )
+    parser.add_argument(
+        "inputs", nargs="*", help="CSV files, directories or glob patterns"
+    )
+    parser.add_argument(
+        "-o", "--output-dir", default="jcc2_summaries", help="Where to write summaries"
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: all cores)",
+    )
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help="Reuse parsed-data caches in the per-user cache directory",
+    )
+    parser.add_argument(
+        "--compact", action="store_true", help="Write summaries without indentation"
+    )
+    parser.add_argument("--gzip", action="store_true", help="Gzip the written files")
+    parser.add_argument(
+        "--errors",
+        action="store_true",
+        help="Also write every validation error to <name>_errors.ndjson",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log progress")
+    args = parser.parse_args(argv)
+
+    if not args.inputs:
+        parser.print_help()
+        return 0
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    csv_paths = expand_inputs(args.inputs)
+    if not csv_paths:
+        print("No CSV files found")
+        return 1
+
+    index = process_exports(
+        csv_paths,
+        args.output_dir,
+        args.workers,
+        args.use_cache,
+        compact=args.compact,
+        gzip_output=args.gzip,
+        write_errors=args.errors,
+    )
+    for result in index["files"]:
+        if result["status"] == "ok":
+            print(
+                f"{result['file']}: {result['format']}, {result['rows']} rows, "
+                f"{result['validation_errors']} validation errors -> {result['summary']}"
+            )
+        else:
+            print(f"{result['file']}: FAILED ({result['error']})")
+    print(
+        f"\n{index['succeeded']} of {index['total_files']} exports summarized; "
+        f"index written to {Path(args.output_dir) / 'index.json'}"
+    )
+    return 1 if index["failed"] else 0
 
 
 if __name__ == "__main__":
-    df, processor = main()
+    sys.exit(main())
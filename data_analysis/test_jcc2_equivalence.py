@@ -0,0 +1,697 @@
+#!/usr/bin/env python3
+"""
+Equivalence checks for the JCC2 Data Processor
+Each fast path must give the same answer as the plain computation it replaces
+"""
+
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+from scipy import stats
+
+from jcc2_data_processor import (
+    EFFECTIVENESS_RATINGS,
+    RECOMMEND_FIELD,
+    STOPWORDS,
+    MultiDatasetProcessor,
+    TextIndex,
+    _bootstrap_ratios,
+    create_processor,
+)
+
+DATA_DIR = Path(__file__).parent / "data"
+QUESTIONNAIRE_CSV = DATA_DIR / "mock_20_jcc2_user_questionnaire.csv"
+QUESTIONNAIRE_50_CSV = (
+    DATA_DIR / "JCC2_User_Questionnaire_V4_mock_data_50_instances.csv"
+)
+DATA_COLLECTION_CSV = (
+    DATA_DIR / "JCC2_Data_Collection_and_Interview_Form_v4_mock_data_20_instances.csv"
+)
+
+
+def _require(*paths: Path):
+    missing = [path.name for path in paths if not path.exists()]
+    if missing:
+        pytest.skip(f"Mock data not found: {missing}")
+
+
+def _load(csv_path: Path, **kwargs):
+    processor = create_processor(str(csv_path))
+    processor.load_data(**kwargs)
+    return processor
+
+
+def _write_variant(source: Path, target: Path, edit=None):
+    """Copy a mock export, optionally editing its data rows (schema row is row 0)"""
+    frame = pd.read_csv(source, dtype=str, keep_default_na=False)
+    if edit is not None:
+        edit(frame)
+    frame.to_csv(target, index=False)
+    return target
+
+
+def _row_by_row_errors(processor):
+    """(row, column, error) of every schema violation, checked one cell at a time"""
+    errors = []
+    for row, values in processor.df.iterrows():
+        for col, field_schema in processor.schema.items():
+            if col not in processor.df.columns:
+                continue
+            value = values[col]
+            is_list = isinstance(value, list)
+            if field_schema.required and (value == [] if is_list else pd.isna(value)):
+                errors.append((row, col, "Required field is empty"))
+            if not field_schema.options or (not is_list and pd.isna(value)):
+                continue
+            if field_schema.field_type in ["radio", "select"]:
+                if str(value) not in field_schema.options:
+                    errors.append((row, col, f"Invalid option: {value}"))
+            elif field_schema.field_type == "checkbox" and field_schema.multiple:
+                invalid = [v for v in value if v not in field_schema.options]
+                if invalid:
+                    errors.append((row, col, f"Invalid options: {invalid}"))
+    return errors
+
+
+def test_validation_matches_row_by_row_check(tmp_path):
+    """The columnar validator reports exactly the errors of a cell-by-cell scan"""
+    _require(QUESTIONNAIRE_CSV)
+    schema = _load(QUESTIONNAIRE_CSV).schema
+    radio = next(c for c, s in schema.items() if s.field_type == "radio" and s.options)
+    checkbox = next(
+        c for c, s in schema.items() if s.field_type == "checkbox" and s.multiple
+    )
+
+    def corrupt(frame):
+        frame.loc[2, radio] = "Not an option"
+        frame.loc[4, checkbox] = f"{schema[checkbox].options[0]}; Not an option"
+        frame.loc[5, radio] = ""
+
+    processor = _load(
+        _write_variant(QUESTIONNAIRE_CSV, tmp_path / "export.csv", corrupt)
+    )
+    errors = processor.validate_data()
+    expected = _row_by_row_errors(processor)
+    assert sorted((e["row"], e["column"], e["error"]) for e in errors) == sorted(
+        expected
+    )
+    assert {rule for _, _, rule in expected} >= {
+        "Required field is empty",
+        "Invalid option: Not an option",
+        "Invalid options: ['Not an option']",
+    }
+
+    table = processor.validate_data(as_frame=True)
+    assert len(table) == len(errors)
+    assert processor.get_validation_errors(limit=10) == errors[:10]
+    capped = processor.validate_data(max_errors=10, as_frame=True)
+    assert len(capped) == 10
+
+
+@pytest.mark.parametrize("csv_path", [QUESTIONNAIRE_50_CSV, DATA_COLLECTION_CSV])
+def test_streamed_load_matches_full_load(csv_path):
+    """Summaries from a chunked load equal those of a full load"""
+    _require(csv_path)
+    full = _load(csv_path)
+    streamed = _load(csv_path, chunksize=7)
+    assert streamed.df is None
+    assert streamed.profile.n_rows == len(full.df)
+    assert streamed.get_all_sections_summary() == full.get_all_sections_summary()
+    assert streamed.get_format_specific_summary() == full.get_format_specific_summary()
+    for col in full.schema:
+        if col in full.df.columns:
+            assert streamed._non_null_count(col) == full._non_null_count(col), col
+
+
+def test_cached_load_matches_csv_load(tmp_path, monkeypatch):
+    """A cache hit restores the parsed frame; shared-writable caches are ignored"""
+    _require(DATA_COLLECTION_CSV)
+    monkeypatch.setenv("JCC2_CACHE_DIR", str(tmp_path / "cache"))
+    csv_path = _write_variant(DATA_COLLECTION_CSV, tmp_path / "export.csv")
+    full = _load(csv_path, use_cache=True)
+    cache_path = full.cache_path
+    assert cache_path.parent == tmp_path / "cache"
+    assert cache_path.exists()
+    assert list(tmp_path.glob("*.jcc2cache")) == []
+
+    cached = create_processor(str(csv_path))
+    assert cached._read_cache(cached._cache_key())
+    assert_frame_equal(cached.df, full.df)
+    assert cached.get_all_sections_summary() == full.get_all_sections_summary()
+
+    cache_path.chmod(0o664)
+    shared = create_processor(str(csv_path))
+    assert not shared._read_cache(shared._cache_key())
+    assert shared.df is None
+
+
+def test_multi_dataset_matches_single_loads(tmp_path):
+    """Each dataset's frame and summaries equal those of the file loaded alone"""
+    _require(QUESTIONNAIRE_CSV, QUESTIONNAIRE_50_CSV)
+
+    def drop_column(frame):
+        frame.drop(columns="user_information.phone", inplace=True)
+
+    def add_column(frame):
+        frame["user_information.team"] = ["text|optional"] + ["Blue"] * (len(frame) - 1)
+
+    multi = MultiDatasetProcessor(
+        [
+            _write_variant(QUESTIONNAIRE_CSV, tmp_path / "first.csv", drop_column),
+            _write_variant(QUESTIONNAIRE_50_CSV, tmp_path / "second.csv", add_column),
+        ],
+        max_workers=1,
+    )
+    multi.load_data()
+    assert multi.DATASET_COLUMN in multi.df.columns
+    sections = multi.per_dataset("get_all_sections_summary")
+    format_specific = multi.per_dataset("get_format_specific_summary")
+
+    for name, processor in multi.processors.items():
+        single = _load(multi.csv_paths[name])
+        assert_frame_equal(processor.df, single.df)
+        assert sections[name] == single.get_all_sections_summary()
+        assert format_specific[name] == single.get_format_specific_summary()
+
+
+def test_multi_dataset_selection_means_match_single_loads():
+    """Per-dataset selection means equal those of each file loaded on its own"""
+    _require(QUESTIONNAIRE_CSV, QUESTIONNAIRE_50_CSV)
+    multi = MultiDatasetProcessor(
+        [QUESTIONNAIRE_CSV, QUESTIONNAIRE_50_CSV], max_workers=1
+    )
+    multi.load_data()
+
+    for name, processor in multi.processors.items():
+        single = _load(multi.csv_paths[name])
+        rating_field = next(
+            col
+            for col, field_schema in single.schema.items()
+            if "Completely Effective" in field_schema.options
+        )
+        scores = {
+            option: score
+            for score, option in enumerate(single.schema[rating_field].options[:6])
+        }
+        assert processor.df.index.equals(single.df.index)
+        assert single.multi_choice
+        for col, matrix in single.multi_choice.items():
+            expected = matrix.mean_by_option(
+                single.df[rating_field].astype(object).map(scores)
+            )
+            actual = processor.multi_choice[col].mean_by_option(
+                processor.df[rating_field].astype(object).map(scores)
+            )
+            assert actual.equals(expected), (name, col)
+
+
+def _cell_scores(df, fields):
+    """Scored answers and Not Applicable count of a cell's fields, read cell by cell"""
+    answers = pd.concat([df[col].astype(object) for col in fields])
+    return answers.map(EFFECTIVENESS_RATINGS).dropna(), int(
+        (answers == "Not Applicable").sum()
+    )
+
+
+def test_rating_matrix_matches_per_field_scan():
+    """Cube aggregates equal the mean/median/count of each cell's stacked answers"""
+    _require(QUESTIONNAIRE_50_CSV)
+    processor = _load(QUESTIONNAIRE_50_CSV)
+    cube = processor.get_rating_cube()
+    mean, median = processor.get_rating_matrix("mean"), processor.get_rating_matrix(
+        "median"
+    )
+    count = processor.get_rating_matrix("count")
+    not_applicable = processor.get_rating_matrix("not_applicable")
+    assert cube.fields
+
+    for (app, section), fields in cube.fields.items():
+        scores, n_not_applicable = _cell_scores(processor.df, fields)
+        assert count.loc[app, section] == len(scores)
+        assert not_applicable.loc[app, section] == n_not_applicable
+        if len(scores):
+            assert mean.loc[app, section] == pytest.approx(scores.mean())
+            assert median.loc[app, section] == pytest.approx(scores.median())
+
+    group_col = "role_and_echelon.current_role_status"
+    grouped = processor.get_rating_matrix("mean", group_by=group_col)
+    for group, rows in processor.df.groupby(group_col, observed=True):
+        for (app, section), fields in cube.fields.items():
+            scores, _ = _cell_scores(rows, fields)
+            actual = grouped.loc[(group_col, group, app), section]
+            if len(scores):
+                assert actual == pytest.approx(scores.mean())
+            else:
+                assert pd.isna(actual)
+
+
+def test_memoized_summaries_match_uncached():
+    """Cache hits equal a fresh computation, and callers cannot alter the cache"""
+    _require(QUESTIONNAIRE_CSV)
+    processor = _load(QUESTIONNAIRE_CSV)
+    section = next(iter(processor.sections))
+    first = processor.get_format_specific_summary()
+    section_summary = processor.get_section_summary(section)
+    visualizations = processor.prepare_visualization_data()
+    hits = processor.cache_info().hits
+
+    first["nps_score"] = "changed"
+    section_summary["field_summaries"].clear()
+    for frame in visualizations.values():
+        frame.drop(frame.index, inplace=True)
+
+    uncached = _load(QUESTIONNAIRE_CSV)
+    assert (
+        processor.get_format_specific_summary()
+        == uncached.get_format_specific_summary()
+    )
+    assert processor.get_section_summary(section) == uncached.get_section_summary(
+        section
+    )
+    for key, frame in uncached.prepare_visualization_data().items():
+        assert_frame_equal(processor.prepare_visualization_data()[key], frame)
+    assert processor.cache_info().hits > hits
+
+
+def test_memoized_contingency_tables_are_shared_read_only():
+    """Cache hits share one ContingencyTables whose counts cannot be changed"""
+    _require(DATA_COLLECTION_CSV)
+    processor = _load(DATA_COLLECTION_CSV)
+    tables = processor.get_contingency_tables()
+    assert processor.get_contingency_tables() is tables
+    with pytest.raises(ValueError):
+        tables.counts[0, 0, 0] = 1
+
+
+def test_high_cardinality_summaries_match_frame(tmp_path):
+    """Columns past the distinct-value cap are summarized from the full frame"""
+    rng = np.random.default_rng(5)
+    n_rows = 3000
+    csv_path = tmp_path / "export.csv"
+    pd.DataFrame(
+        {
+            "id": ["system|identifier", *map(str, range(n_rows))],
+            "user_information.score": [
+                "number|optional",
+                *rng.integers(0, 100000, size=n_rows).astype(str),
+            ],
+            "user_information.unit": [
+                "radio|optional|options:Alpha,Bravo",
+                *(f"Unit {i}" for i in rng.integers(0, 1500, size=n_rows)),
+            ],
+        }
+    ).to_csv(csv_path, index=False)
+
+    processor = _load(csv_path)
+    summary = processor.get_section_summary("user_information")["field_summaries"]
+    score = processor.df["user_information.score"]
+    unit = processor.df["user_information.unit"]
+    assert summary["user_information.score"]["median"] == score.median()
+    counts = unit.value_counts()
+    assert summary["user_information.unit"]["value_distribution"] == counts.to_dict()
+    most_common = summary["user_information.unit"]["most_common"]
+    assert counts[most_common] == counts.max()
+
+    streamed = _load(csv_path, chunksize=500)
+    summary = streamed.get_section_summary("user_information")["field_summaries"]
+    assert pd.isna(summary["user_information.score"]["median"])
+    assert summary["user_information.unit"]["most_common"] is None
+
+
+def _radio_column(processor) -> str:
+    return next(
+        col
+        for col, field_schema in processor.schema.items()
+        if field_schema.field_type == "radio" and field_schema.options
+    )
+
+
+def _assert_same_state(refreshed, reloaded):
+    assert_frame_equal(refreshed.df, reloaded.df)
+    assert refreshed.off_schema_values == reloaded.off_schema_values
+    for col, matrix in reloaded.multi_choice.items():
+        assert (refreshed.multi_choice[col].matrix != matrix.matrix).nnz == 0
+        assert refreshed.multi_choice[col].index.equals(matrix.index)
+
+
+def test_load_with_stats_matches_plain_load():
+    """Recording stages changes nothing; disabled stages get throwaway records"""
+    _require(QUESTIONNAIRE_CSV)
+    plain = _load(QUESTIONNAIRE_CSV)
+    timed = create_processor(str(QUESTIONNAIRE_CSV))
+    stats = timed.enable_stats(track_memory=True)
+    timed.load_data()
+    assert_frame_equal(timed.df, plain.df)
+    assert "load_data" in set(stats.summary().index)
+
+    with plain._stage("first") as record:
+        record.rows = 5
+    with plain._stage("second") as record:
+        assert record.stage == "second"
+        assert record.rows is None
+
+
+def test_refresh_matches_reload_when_off_schema_value_is_fixed(tmp_path):
+    """A refresh that fixes the only off-schema value restores the Categorical"""
+    _require(QUESTIONNAIRE_CSV)
+    column = _radio_column(_load(QUESTIONNAIRE_CSV, lazy=True))
+
+    def corrupt(frame):
+        frame.loc[3, column] = "Not an option"
+
+    def fix(frame):
+        frame.loc[3, "updated_at"] = "2030-01-01T00:00:00Z"
+
+    csv_path = _write_variant(QUESTIONNAIRE_CSV, tmp_path / "export.csv", corrupt)
+    processor = _load(csv_path)
+    processor.validate_data()
+    assert column in processor.off_schema_values
+    assert processor.df[column].dtype == object
+
+    _write_variant(QUESTIONNAIRE_CSV, csv_path, fix)
+    counts = processor.refresh()
+    assert counts["changed"] == 1
+
+    reloaded = _load(csv_path)
+    assert isinstance(processor.df[column].dtype, pd.CategoricalDtype)
+    _assert_same_state(processor, reloaded)
+    assert processor.validation_table.equals(reloaded.validate_data(as_frame=True))
+
+
+def test_refresh_matches_reload(tmp_path):
+    """Changed, new and removed rows give the same frame as a full reload"""
+    _require(QUESTIONNAIRE_CSV)
+    column = _radio_column(_load(QUESTIONNAIRE_CSV, lazy=True))
+    csv_path = _write_variant(QUESTIONNAIRE_CSV, tmp_path / "export.csv")
+    processor = _load(csv_path)
+    assert processor.refresh()["unchanged"] == len(processor.df)
+
+    def edit(frame):
+        options = processor.schema[column].options
+        frame.loc[2, column] = options[-1]
+        frame.loc[2, "updated_at"] = "2030-01-01T00:00:00Z"
+        frame.drop(index=5, inplace=True)
+        extra = frame.iloc[[4]].assign(id="new-response")
+        frame.loc[len(frame) + 10] = extra.iloc[0]
+
+    _write_variant(QUESTIONNAIRE_CSV, csv_path, edit)
+    counts = processor.refresh()
+    assert counts == {
+        "new": 1,
+        "changed": 1,
+        "removed": 1,
+        "unchanged": len(processor.df) - 2,
+    }
+    _assert_same_state(processor, _load(csv_path))
+
+
+def test_multi_dataset_refresh(tmp_path):
+    """Refreshing several datasets re-reads changed rows and rebuilds the combined frame"""
+    _require(QUESTIONNAIRE_CSV, QUESTIONNAIRE_50_CSV)
+    first = _write_variant(QUESTIONNAIRE_CSV, tmp_path / "first.csv")
+    second = _write_variant(QUESTIONNAIRE_50_CSV, tmp_path / "second.csv")
+    multi = MultiDatasetProcessor([first, second], max_workers=1)
+    multi.load_data()
+    column = _radio_column(multi.processors["first"])
+
+    def edit(frame):
+        frame.loc[1, column] = multi.schema[column].options[0]
+        frame.loc[1, "updated_at"] = "2030-01-01T00:00:00Z"
+
+    _write_variant(QUESTIONNAIRE_CSV, first, edit)
+    counts = multi.refresh()
+    assert counts["first"]["changed"] == 1
+    assert counts["second"]["unchanged"] == len(multi.processors["second"].df)
+
+    expected = MultiDatasetProcessor([first, second], max_workers=1)
+    expected.load_data()
+    assert_frame_equal(multi.df, expected.df)
+    for name, processor in expected.processors.items():
+        assert_frame_equal(multi.processors[name].df, processor.df)
+
+
+def test_contingency_tests_match_scipy():
+    """Batched tables, chi-square and Fisher tests equal per-pair crosstab and scipy"""
+    _require(DATA_COLLECTION_CSV)
+    processor = _load(DATA_COLLECTION_CSV)
+    tables = processor.get_contingency_tables()
+    chi_square, fisher = tables.chi_square(), tables.fisher_exact()
+    assert len(tables) > 0
+
+    tested = 0
+    for (section, factor), (factor_col, outcome_col) in zip(
+        tables.keys, tables.columns
+    ):
+        ct = pd.crosstab(processor.df[factor_col], processor.df[outcome_col])
+        table = tables.table(section, factor)
+        assert (table.index.name, table.columns.name) == (factor_col, outcome_col)
+        assert table.index.tolist() == ct.index.tolist()
+        assert table.columns.tolist() == ct.columns.tolist()
+        assert (table.to_numpy() == ct.to_numpy()).all()
+        result = chi_square.loc[(section, factor)]
+        if min(ct.shape) >= 2:
+            chi2, p_value, dof, _ = stats.chi2_contingency(ct, correction=False)
+            assert result["chi2"] == pytest.approx(chi2)
+            assert result["p_value"] == pytest.approx(p_value)
+            assert result["dof"] == dof
+            tested += 1
+        else:
+            assert pd.isna(result["p_value"])
+
+        result = fisher.loc[(section, factor)]
+        if {"Yes", "No"} <= set(ct.index) and {"Yes", "No"} <= set(ct.columns):
+            two_by_two = ct.loc[["Yes", "No"], ["Yes", "No"]].to_numpy()
+            odds_ratio, p_value = stats.fisher_exact(two_by_two)
+            assert result["p_value"] == pytest.approx(p_value)
+            assert result["odds_ratio"] == pytest.approx(odds_ratio, nan_ok=True)
+        else:
+            assert pd.isna(result["p_value"])
+    assert tested > 0
+    assert all(labels.name is None for labels in tables.row_labels + tables.col_labels)
+
+
+SCORED_TEXTS = []
+
+
+def _keyword_sentiment(text):
+    """Deterministic stand-in for TextBlob that records what it scores"""
+    SCORED_TEXTS.append(text)
+    words = text.lower().split()
+    score = sum(w in ("good", "easy", "effective") for w in words) - sum(
+        w in ("bad", "slow", "difficult") for w in words
+    )
+    return max(-1.0, min(1.0, score / 3)), min(1.0, len(words) / 50)
+
+
+def test_sentiment_cache_matches_direct_scoring(tmp_path):
+    """Cached, uncached and parallel scoring all equal scoring each response directly"""
+    _require(QUESTIONNAIRE_50_CSV)
+    processor = _load(QUESTIONNAIRE_50_CSV)
+    fields = processor.text_fields(processor.FEEDBACK_FIELD_TYPES)
+    expected = {
+        (row, field): _keyword_sentiment(text.strip())
+        for field in fields
+        for row, text in processor.df[field].dropna().astype(str).items()
+        if text.strip()
+    }
+    distinct_texts = {
+        text.strip()
+        for field in fields
+        for text in processor.df[field].dropna().astype(str)
+        if text.strip()
+    }
+    assert expected
+
+    def scores(result):
+        return {
+            (row, field): (polarity, subjectivity)
+            for row, field, polarity, subjectivity in zip(
+                result["row"],
+                result["field"],
+                result["polarity"],
+                result["subjectivity"],
+            )
+        }
+
+    kwargs = {"scorer": _keyword_sentiment, "max_workers": 1}
+    assert scores(processor.analyze_sentiment(use_cache=False, **kwargs)) == expected
+
+    cache_path = tmp_path / "sentiment.sqlite"
+    SCORED_TEXTS.clear()
+    first = processor.analyze_sentiment(cache_path=cache_path, **kwargs)
+    # Each distinct answer is scored exactly once
+    assert sorted(SCORED_TEXTS) == sorted(distinct_texts)
+    assert scores(first) == expected
+
+    SCORED_TEXTS.clear()
+    second = processor.analyze_sentiment(cache_path=cache_path, **kwargs)
+    assert SCORED_TEXTS == []
+    assert_frame_equal(second, first)
+
+    parallel = processor.analyze_sentiment(
+        use_cache=False, scorer=_keyword_sentiment, max_workers=2, batch_size=3
+    )
+    assert_frame_equal(parallel, first)
+
+
+def _text_documents(processor):
+    """(row, field, tokens) of every non-empty text response, by plain iteration"""
+    fields = processor.text_fields()
+    return [
+        (row, field, TextIndex.tokenize(text))
+        for field in fields
+        for row, text in processor.df[field].dropna().items()
+    ]
+
+
+def test_tokenizer_drops_one_character_tokens():
+    assert TextIndex.tokenize("It’s a map of Bravo's AO, I s-2 it") == [
+        "it's",
+        "map",
+        "of",
+        "bravo's",
+        "ao",
+        "s-2",
+        "it",
+    ]
+
+
+def test_text_index_matches_plain_scan(tmp_path):
+    """Term counts and search hits equal a token-by-token scan of the responses"""
+    _require(QUESTIONNAIRE_50_CSV)
+    processor = _load(QUESTIONNAIRE_50_CSV)
+    documents = _text_documents(processor)
+    index = processor.get_text_index()
+
+    expected = Counter(
+        token
+        for _, _, tokens in documents
+        for token in tokens
+        if token not in STOPWORDS
+    )
+    frequencies = index.term_frequencies()
+    assert frequencies.to_dict() == dict(expected)
+    assert (frequencies.index.str.len() >= 2).all()
+
+    for term, _ in expected.most_common(5):
+        hits = {
+            (row, field): tokens.count(term)
+            for row, field, tokens in documents
+            if term in tokens
+        }
+        found = processor.search_text(term)
+        assert dict(zip(zip(found["row"], found["field"]), found["hits"])) == hits
+
+        prefix = term[:3]
+        prefix_rows = {
+            (row, field)
+            for row, field, tokens in documents
+            if any(token.startswith(prefix) for token in tokens)
+        }
+        found = processor.search_text(f"{prefix}*")
+        assert set(zip(found["row"], found["field"])) == prefix_rows
+
+    saved = processor.get_text_index(path=tmp_path / "index.pkl")
+    processor.invalidate_cache()
+    loaded = processor.get_text_index(path=tmp_path / "index.pkl")
+    assert loaded is not saved
+    assert loaded.term_frequencies().equals(frequencies)
+
+
+def _add_nps_and_sus(frame):
+    """Give a mock export a recommendation question and the ten SUS items"""
+    rng = np.random.default_rng(0)
+    n_rows = len(frame) - 1
+    answers = rng.choice(["Yes", "No", "Maybe", ""], size=n_rows)
+    frame[RECOMMEND_FIELD] = ["radio|options:Yes,No,Maybe", *answers]
+    for item in range(1, 11):
+        values = rng.integers(1, 6, size=n_rows).astype(str)
+        values[rng.random(n_rows) < 0.05] = ""
+        frame[f"overall_system_usability.sus_{item}"] = ["number|min:1|max:5", *values]
+
+
+def _plain_bootstrap(numerators, denominators, n_draws, seed, strata=None):
+    """Replicates drawn one resample at a time from the same random stream"""
+    rng = np.random.default_rng(seed)
+    n_rows = len(numerators)
+    strata = np.zeros(n_rows, dtype=int) if strata is None else strata
+    members = {s: np.flatnonzero(strata == s) for s in np.unique(strata)}
+    replicates = []
+    for _ in range(n_draws):
+        draws = rng.random(n_rows)
+        picks = [
+            members[strata[j]][int(draws[j] * len(members[strata[j]]))]
+            for j in range(n_rows)
+        ]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            replicates.append(
+                numerators[picks].sum(axis=0) / denominators[picks].sum(axis=0)
+            )
+    return np.array(replicates)
+
+
+def test_bootstrap_resamples_match_plain_loop():
+    """Blocked matrix resampling equals drawing each resample separately"""
+    rng = np.random.default_rng(3)
+    numerators = rng.normal(size=(40, 3))
+    denominators = (rng.random((40, 3)) < 0.8).astype(float)
+    strata = rng.integers(0, 4, size=40)
+
+    for codes in (None, strata):
+        expected = _plain_bootstrap(numerators, denominators, 25, 11, codes)
+        for block_size in (1, 7, 256):
+            actual = _bootstrap_ratios(
+                numerators,
+                denominators,
+                25,
+                np.random.default_rng(11),
+                codes,
+                block_size,
+            )
+            np.testing.assert_allclose(actual, expected)
+
+
+def test_bootstrap_metrics_reproducible_and_centered(tmp_path):
+    """Seeded intervals repeat exactly, and estimates equal the point estimates"""
+    _require(QUESTIONNAIRE_50_CSV)
+    csv_path = _write_variant(
+        QUESTIONNAIRE_50_CSV, tmp_path / "export.csv", _add_nps_and_sus
+    )
+    processor = _load(csv_path)
+    group_col = "role_and_echelon.current_role_status"
+
+    intervals = processor.bootstrap_metrics(group_by=group_col, n_draws=200, seed=7)
+    assert_frame_equal(
+        processor.bootstrap_metrics(group_by=group_col, n_draws=200, seed=7), intervals
+    )
+    other_seed = processor.bootstrap_metrics(group_by=group_col, n_draws=200, seed=8)
+    assert not other_seed["lower"].equals(intervals["lower"])
+    assert_series_equal(other_seed["estimate"], intervals["estimate"])
+    assert (intervals["lower"] <= intervals["estimate"]).all()
+    assert (intervals["estimate"] <= intervals["upper"]).all()
+
+    rating_fields = [
+        col
+        for columns in processor._rating_fields(EFFECTIVENESS_RATINGS).values()
+        for col in columns
+    ]
+    sus = processor.calculate_sus_scores()
+    groups = [("all", "all", processor.df)] + [
+        (group_col, group, rows)
+        for group, rows in processor.df.groupby(group_col, observed=True)
+    ]
+    for grouping, group, rows in groups:
+        ratings = pd.concat([rows[col].astype(object) for col in rating_fields])
+        expected = {
+            "rating": ratings.map(EFFECTIVENESS_RATINGS).mean(),
+            "nps": processor.calculate_nps_score(rows),
+            "sus": sus[rows.index].mean(),
+        }
+        for metric, value in expected.items():
+            assert intervals.loc[
+                (metric, grouping, group), "estimate"
+            ] == pytest.approx(value)